@@ -0,0 +1,46 @@
+"""add job posting search indexes
+
+Revision ID: 20261019000000
+Revises: 8c64ec664c39
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019000000'
+down_revision = '8c64ec664c39'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 1. 필터 조합용 composite index (status + 필터 컬럼, TEXT 컬럼은 prefix index)
+    op.create_index('ix_job_postings_status_location', 'job_postings', ['status', 'location_city'])
+    op.create_index(
+        'ix_job_postings_status_employment', 'job_postings', ['status', 'employment_type'],
+        mysql_length={'employment_type': 20},
+    )
+    op.create_index(
+        'ix_job_postings_status_career', 'job_postings', ['status', 'career_level'],
+        mysql_length={'career_level': 30},
+    )
+    op.create_index('ix_job_postings_status_salary', 'job_postings', ['status', 'salary_range'])
+    op.create_index('ix_job_postings_status_deadline', 'job_postings', ['status', 'deadline_date'])
+
+    # 2. 키워드 검색용 FULLTEXT index (한국어는 공백 토큰화가 맞지 않아 ngram parser 사용)
+    op.execute("""
+        ALTER TABLE job_postings
+        ADD FULLTEXT INDEX ft_job_postings_text (title, responsibilities, requirements_must, competencies)
+        WITH PARSER ngram
+    """)
+
+
+def downgrade():
+    op.drop_index('ft_job_postings_text', table_name='job_postings')
+    op.drop_index('ix_job_postings_status_deadline', table_name='job_postings')
+    op.drop_index('ix_job_postings_status_salary', table_name='job_postings')
+    op.drop_index('ix_job_postings_status_career', table_name='job_postings')
+    op.drop_index('ix_job_postings_status_employment', table_name='job_postings')
+    op.drop_index('ix_job_postings_status_location', table_name='job_postings')
@@ -0,0 +1,24 @@
+"""add job posting updated_at index
+
+Revision ID: 20261019010000
+Revises: 20261019000000
+Create Date: 2026-10-19 01:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019010000'
+down_revision = '20261019000000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # bitmap index 증분 refresh (updated_at >= watermark) 용
+    op.create_index('ix_job_postings_updated_at', 'job_postings', ['updated_at'])
+
+
+def downgrade():
+    op.drop_index('ix_job_postings_updated_at', table_name='job_postings')
@@ -0,0 +1,30 @@
+"""add matching vector model_version / dims
+
+Revision ID: 20261019020000
+Revises: 20261019010000
+Create Date: 2026-10-19 02:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019020000'
+down_revision = '20261019010000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 기존 벡터는 NULL (모델 표시 없음) → scripts/vectorize_cards.py --backfill 로 재인코딩
+    op.add_column('matching_vectors', sa.Column('model_version', sa.String(length=100), nullable=True))
+    op.add_column('matching_vectors', sa.Column('dims', sa.Integer(), nullable=True))
+    # 자동 매칭 후보 / backfill 대상 조회 (role + model_version)
+    op.create_index('ix_matching_vectors_role_model_version', 'matching_vectors', ['role', 'model_version'])
+
+
+def downgrade():
+    op.drop_index('ix_matching_vectors_role_model_version', table_name='matching_vectors')
+    op.drop_column('matching_vectors', 'dims')
+    op.drop_column('matching_vectors', 'model_version')
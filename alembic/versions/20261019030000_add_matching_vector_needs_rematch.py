@@ -0,0 +1,30 @@
+"""add matching vector needs_rematch
+
+Revision ID: 20261019030000
+Revises: 20261019020000
+Create Date: 2026-10-19 03:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019030000'
+down_revision = '20261019020000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 자동 매칭을 미루고 저장한 벡터 표시 (backfill이 중단돼도 다음 실행에서 재매칭)
+    op.add_column(
+        'matching_vectors',
+        sa.Column('needs_rematch', sa.Boolean(), nullable=False, server_default=sa.text('0')),
+    )
+    op.create_index('ix_matching_vectors_needs_rematch', 'matching_vectors', ['needs_rematch'])
+
+
+def downgrade():
+    op.drop_index('ix_matching_vectors_needs_rematch', table_name='matching_vectors')
+    op.drop_column('matching_vectors', 'needs_rematch')
@@ -0,0 +1,34 @@
+"""create revoked_tokens
+
+Revision ID: 20261019040000
+Revises: 20261019030000
+Create Date: 2026-10-19 04:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019040000'
+down_revision = '20261019030000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # logout된 토큰을 워커끼리 공유 (각 워커가 created_at 기준으로 주기적으로 읽어 간다)
+    op.create_table(
+        'revoked_tokens',
+        sa.Column('token_digest', sa.String(length=64), primary_key=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index('ix_revoked_tokens_expires_at', 'revoked_tokens', ['expires_at'])
+    op.create_index('ix_revoked_tokens_created_at', 'revoked_tokens', ['created_at'])
+
+
+def downgrade():
+    op.drop_index('ix_revoked_tokens_created_at', table_name='revoked_tokens')
+    op.drop_index('ix_revoked_tokens_expires_at', table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
@@ -1,30 +1,62 @@
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
+from jose import jwt
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.security import (
+    PasswordHasherBusy,
+    create_access_token,
+    hash_password_async,
+    verify_and_update_password_async,
+)
 from app.core.settings import settings
-from app.api.deps import get_db
+from app.api.deps import bearer, get_current_user, get_db
 from app.models.user import User
 from app.schemas.auth import TokenResponse, UserLoginRequest, UserRegisterRequest
 from app.models.company import Company
+from app.repositories import revoked_token_repo
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={"code": "AUTH_BUSY", "message": "Too many concurrent sign-ins, retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
+def _get_user_by_email(db: Session, email: str):
+    return db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+
+
+# 로그인/회원가입은 async: bcrypt는 전용 executor에서 await 하므로 해싱 중에는 공용 threadpool을 쓰지 않는다.
+# DB 작업만 짧게 run_in_threadpool로 실행.
 @router.post("/register")
-def register(payload: UserRegisterRequest, db: Session = Depends(get_db)):
-    existing = db.execute(select(User).where(User.email == payload.email)).scalar_one_or_none()
+async def register(payload: UserRegisterRequest, db: Session = Depends(get_db)):
+    existing = await run_in_threadpool(_get_user_by_email, db, payload.email)
     if existing is not None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
 
+    try:
+        password_hash = await hash_password_async(payload.password)
+    except PasswordHasherBusy:
+        raise _busy()
+
+    return await run_in_threadpool(_create_user, db, payload, password_hash)
+
+
+def _create_user(db: Session, payload: UserRegisterRequest, password_hash: str) -> dict:
     user = User(
         email=payload.email,
-        password_hash=hash_password(payload.password),
+        password_hash=password_hash,
         role=payload.role,
     )
     try:
@@ -47,17 +79,39 @@ def register(payload: UserRegisterRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: UserLoginRequest, db: Session = Depends(get_db)) -> TokenResponse:
-    user = db.execute(select(User).where(User.email == payload.email)).scalar_one_or_none()
-    if user is None or not verify_password(payload.password, user.password_hash):
+async def login(payload: UserLoginRequest, db: Session = Depends(get_db)) -> TokenResponse:
+    user = await run_in_threadpool(_get_user_by_email, db, payload.email)
+    verified, new_hash = False, None
+    if user is not None:
+        try:
+            verified, new_hash = await verify_and_update_password_async(payload.password, user.password_hash)
+        except PasswordHasherBusy:
+            raise _busy()
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # 해시 정책(cost factor 등)이 바뀐 경우 로그인 성공 시 재해싱 (get_db()가 commit)
+    if new_hash is not None:
+        user.password_hash = new_hash
+
     token = create_access_token(
         data={"sub": str(user.id), "email": user.email, "role": user.role},
         expires_delta=timedelta(minutes=settings.JWT_EXPIRE_MINUTES),
     )
     return TokenResponse(access_token=token, role=user.role)
+
+
+@router.post("/logout")
+def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer),
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """현재 토큰을 만료 시각까지 revoke (이 워커는 즉시, 다른 워커는 TOKEN_REVOCATION_SYNC_SECONDS 이내)"""
+    claims = jwt.get_unverified_claims(credentials.credentials)  # get_current_user에서 검증 완료
+    revoked_token_repo.revoke(db, credentials.credentials, exp=claims.get("exp"))
+    return {"ok": True}
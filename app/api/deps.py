@@ -1,20 +1,51 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import secrets
+from typing import Any, Dict, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
 from app.core.settings import settings
-from app.db.session import SessionLocal
+from app.core.token_cache import token_cache
+from app.db.session import SessionLocal, read_session
+from app.repositories import revoked_token_repo
 
 
 bearer = HTTPBearer(auto_error=False)
 
 
-def get_db() -> Session:
+def get_optional_user(credentials: HTTPAuthorizationCredentials | None = Depends(bearer)) -> Optional[Dict[str, Any]]:
+    """
+    토큰이 없거나 유효하지 않으면 None (DB 라우팅 등 인증이 필수가 아닌 곳에서 사용)
+    - 검증된 토큰은 exp까지 token_cache에 보관하여 jwt.decode 반복을 피함
+    - logout/revoke된 토큰은 거부 (다른 워커의 revoke는 revoked_token_repo가 주기적으로 가져온다)
+    """
+    if credentials is None or credentials.scheme.lower() != "bearer":
+        return None
+    revoked_token_repo.sync_if_stale()
+    token = credentials.credentials
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
+    if token_cache.is_revoked(token):
+        return None
+    try:
+        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALG])
+        sub = payload.get("sub")
+        role = payload.get("role")
+        if not sub or not role:
+            raise ValueError("missing sub/role")
+        user = {"id": int(sub), "role": role}
+    except (JWTError, ValueError):
+        return None
+    token_cache.put(token, user, payload.get("exp"))
+    return user
+
+
+def get_db(user: Optional[Dict[str, Any]] = Depends(get_optional_user)) -> Session:
     """
     요청당 1 트랜잭션 패턴:
     - 요청 시작 시 세션 생성
@@ -22,7 +53,7 @@ def get_db() -> Session:
     - 예외 시 rollback
     - 항상 close
     """
-    db = SessionLocal()
+    db = SessionLocal(info={"user_id": user["id"] if user else None})
     try:
         yield db
         db.commit()
@@ -33,19 +64,30 @@ def get_db() -> Session:
         db.close()
 
 
-def get_current_user(credentials: HTTPAuthorizationCredentials | None = Depends(bearer)) -> Dict[str, Any]:
+def get_read_db(user: Optional[Dict[str, Any]] = Depends(get_optional_user)) -> Session:
+    """
+    조회 전용(GET) 요청 세션:
+    - READ ONLY 트랜잭션 (replica 설정 시 replica 라운드로빈)
+    - 최근 쓰기를 한 사용자는 primary에서 읽음 (read-your-writes)
+    - commit 없이 항상 rollback 후 close
+    """
+    db = read_session(user["id"] if user else None)
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.close()
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer),
+    user: Optional[Dict[str, Any]] = Depends(get_optional_user),
+) -> Dict[str, Any]:
     if credentials is None or credentials.scheme.lower() != "bearer":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail={"code": "UNAUTHORIZED", "message": "Not authenticated"})
-    token = credentials.credentials
-    try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALG])
-        sub = payload.get("sub")
-        role = payload.get("role")
-        if not sub or not role:
-            raise ValueError("missing sub/role")
-        return {"id": int(sub), "role": role}
-    except (JWTError, ValueError):
+    if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail={"code": "UNAUTHORIZED", "message": "Invalid token"})
+    return user
 
 
 def require_company_role(user: Dict[str, Any] = Depends(get_current_user)) -> Dict[str, Any]:
@@ -56,3 +98,17 @@ def require_company_role(user: Dict[str, Any] = Depends(get_current_user)) -> Di
         )
     return user
 
+
+def require_admin(x_admin_key: str | None = Header(default=None, alias="X-Admin-Key")) -> None:
+    """
+    운영용 Admin API 보호
+    - settings.ADMIN_API_KEY 미설정 시 Admin API 전체 비활성화 (404)
+    - X-Admin-Key 헤더가 일치하지 않으면 403
+    """
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"code": "NOT_FOUND", "message": "Not found"})
+    if x_admin_key is None or not secrets.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"code": "FORBIDDEN_ADMIN", "message": "Admin key required"},
+        )
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
+from jose import JWTError, jwt
+from pydantic import BaseModel, Field
+
+from app.api.deps import require_admin
+from app.core import memory, profiler
+from app.core.security import hash_executor
+from app.core.settings import settings
+from app.core.token_cache import token_cache
+from app.db import pool_metrics
+from app.db.session import SessionLocal, read_router
+from app.repositories import autocomplete_index, card_index, job_posting_index, revoked_token_repo
+from app.services import job_posting_service
+
+
+router = APIRouter(prefix="/api/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/db/pool")
+def get_db_pool_stats():
+    """
+    DB 커넥션 풀 상태 조회 (엔진별)
+    - size / checked_out / overflow: 현재 풀 상태
+    - checkouts / checkins / connects / invalidations: 풀 이벤트 누적 카운트
+    - wait_avg_ms / wait_max_ms / timeouts: 커넥션 획득 대기 시간
+    """
+    return {"ok": True, "data": pool_metrics.snapshot()}
+
+
+@router.get("/db/replicas")
+def get_db_replica_status():
+    """Read replica health check 상태 (DB_REPLICA_URLS 미설정 시 빈 목록)"""
+    return {"ok": True, "data": read_router.status()}
+
+
+@router.get("/auth/password-hasher")
+def get_password_hasher_stats():
+    """비밀번호 해싱 executor 상태 (running / queue_depth / rejected)"""
+    return {"ok": True, "data": hash_executor.stats()}
+
+
+class TokenRevokeIn(BaseModel):
+    token: str
+
+
+@router.get("/auth/token-cache")
+def get_token_cache_stats():
+    """검증된 토큰 캐시 통계 (hits / misses / evictions / revoked) + revoked_tokens 마지막 sync"""
+    return {"ok": True, "data": {**token_cache.stats(), "sync": revoked_token_repo.stats()}}
+
+
+@router.post("/auth/revoke")
+def revoke_token(payload: TokenRevokeIn):
+    """토큰을 revocation list에 추가 (exp까지 거부, 캐시에서 즉시 제거, 다른 워커는 다음 sync 때)"""
+    try:
+        exp = jwt.get_unverified_claims(payload.token).get("exp")
+    except JWTError:
+        exp = None
+    with SessionLocal() as db:
+        revoked_token_repo.revoke(db, payload.token, exp=exp)
+        db.commit()
+    return {"ok": True, "data": {"revoked": True}}
+
+
+@router.get("/job-postings/index")
+def get_job_posting_index_stats():
+    """채용공고 bitmap index 상태 (행 수, 필드별 값 종류 수, bitmap 메모리, 마지막 refresh, facet 캐시)"""
+    return {"ok": True, "data": {**job_posting_index.stats(), "facets_cache": job_posting_service.facets_cache_stats()}}
+
+
+@router.post("/job-postings/index/rebuild")
+def rebuild_job_posting_index():
+    """bitmap index 전체 재구성 + facet 캐시 비우기 (배치로 공고를 직접 적재한 뒤 등, 이 워커에만 적용)"""
+    with SessionLocal() as db:
+        job_posting_index.build(db)
+    job_posting_service.clear_facets_cache()
+    return {"ok": True, "data": job_posting_index.stats()}
+
+
+@router.get("/autocomplete")
+def get_autocomplete_index_stats():
+    """자동완성 prefix index 상태 (type별 row 수 / 값 종류 수 / key 수)"""
+    return {"ok": True, "data": autocomplete_index.stats()}
+
+
+@router.post("/autocomplete/rebuild")
+def rebuild_autocomplete_index():
+    """자동완성 index 전체 재구성 (이 워커에만 적용)"""
+    with SessionLocal() as db:
+        autocomplete_index.build(db)
+    return {"ok": True, "data": autocomplete_index.stats()}
+
+
+@router.get("/card-index")
+def get_card_index_stats():
+    """카드 trigram index 상태 (kind별 문서/trigram/posting 수, snapshot 로드 여부)"""
+    return {"ok": True, "data": card_index.stats()}
+
+
+@router.post("/card-index/rebuild")
+def rebuild_card_index():
+    """DB에서 전체 재구성 + snapshot 저장 (삭제된 카드 정리, 이 워커에만 적용)"""
+    with SessionLocal() as db:
+        card_index.build(db)
+    return {"ok": True, "data": card_index.stats()}
+
+
+@router.post("/card-index/snapshot")
+def save_card_index_snapshot():
+    """현재 index를 CARD_INDEX_SNAPSHOT_DIR에 저장"""
+    if not settings.CARD_INDEX_SNAPSHOT_DIR or not card_index.ready():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"code": "CARD_INDEX_SNAPSHOT_DISABLED", "message": "Snapshot dir is not set or index is not built"},
+        )
+    return {"ok": True, "data": {"saved": card_index.save_snapshots()}}
+
+
+_PROFILE_NAME = re.compile(r"^[A-Za-z0-9_.-]+\.collapsed$")
+
+
+@router.get("/profiles")
+def list_request_profiles():
+    """sampling profiler가 저장한 collapsed stack 파일 목록 (최신순)"""
+    return {
+        "ok": True,
+        "data": {
+            "enabled": settings.PROFILER_ENABLED,
+            "profiles": profiler.list_profiles(settings.PROFILER_OUTPUT_DIR),
+        },
+    }
+
+
+@router.get("/profiles/{name}")
+def download_request_profile(name: str):
+    """collapsed stack 파일 다운로드 (flamegraph.pl / speedscope 입력)"""
+    path = Path(settings.PROFILER_OUTPUT_DIR) / name
+    if not _PROFILE_NAME.match(name) or not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "PROFILE_NOT_FOUND", "message": "Profile not found"},
+        )
+    return FileResponse(path, media_type="text/plain; charset=utf-8", filename=name)
+
+
+class TracemallocStartIn(BaseModel):
+    frames: int = Field(25, ge=1, le=100)
+
+
+class MemorySnapshotIn(BaseModel):
+    label: str = Field("", max_length=100)
+    limit: int = Field(20, ge=1, le=200)
+
+
+_KEY_TYPE_PATTERN = "^(" + "|".join(memory.KEY_TYPES) + ")$"
+
+
+def _snapshot_not_found(snapshot_id) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={"code": "SNAPSHOT_NOT_FOUND", "message": f"Memory snapshot {snapshot_id} not found"},
+    )
+
+
+@router.get("/memory")
+def get_memory_status():
+    """tracemalloc 상태 (traced current / peak, RSS, 저장된 snapshot 목록)"""
+    return {"ok": True, "data": memory.status()}
+
+
+@router.post("/memory/tracemalloc/start")
+def start_tracemalloc(payload: TracemallocStartIn = TracemallocStartIn()):
+    """tracemalloc 시작 (frames: 할당 위치별로 보관할 stack 깊이, 클수록 오버헤드 증가)"""
+    return {"ok": True, "data": memory.start(payload.frames)}
+
+
+@router.post("/memory/tracemalloc/stop")
+def stop_tracemalloc():
+    """tracemalloc 중지 + 저장된 snapshot 삭제"""
+    return {"ok": True, "data": memory.stop()}
+
+
+@router.post("/memory/snapshots")
+def take_memory_snapshot(payload: MemorySnapshotIn = MemorySnapshotIn()):
+    """현재 메모리 snapshot 저장 후 top allocation site 반환 (최대 10개 보관, 오래된 것부터 삭제)"""
+    try:
+        meta = memory.take_snapshot(payload.label)
+    except RuntimeError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"code": "TRACEMALLOC_NOT_TRACING", "message": "Start tracemalloc before taking a snapshot"},
+        )
+    return {"ok": True, "data": {**meta, "top": memory.top(meta["id"], limit=payload.limit)}}
+
+
+@router.get("/memory/snapshots/diff")
+def diff_memory_snapshots(
+    base: int,
+    target: int,
+    key_type: str = Query("lineno", pattern=_KEY_TYPE_PATTERN),
+    limit: int = Query(20, ge=1, le=200),
+):
+    """두 snapshot 비교 (target - base, 증가량이 큰 allocation site 순)"""
+    try:
+        stats = memory.diff(base, target, key_type=key_type, limit=limit)
+    except memory.SnapshotNotFound as e:
+        raise _snapshot_not_found(e.args[0])
+    return {"ok": True, "data": {"base": base, "target": target, "key_type": key_type, "stats": stats}}
+
+
+@router.get("/memory/snapshots/{snapshot_id}")
+def get_memory_snapshot_top(
+    snapshot_id: int,
+    key_type: str = Query("lineno", pattern=_KEY_TYPE_PATTERN),
+    limit: int = Query(20, ge=1, le=200),
+):
+    """저장된 snapshot의 top allocation site"""
+    try:
+        stats = memory.top(snapshot_id, key_type=key_type, limit=limit)
+    except memory.SnapshotNotFound:
+        raise _snapshot_not_found(snapshot_id)
+    return {"ok": True, "data": {"id": snapshot_id, "key_type": key_type, "stats": stats}}
+
+
+@router.delete("/memory/snapshots")
+def clear_memory_snapshots():
+    """저장된 snapshot 전체 삭제"""
+    memory.clear()
+    return {"ok": True, "data": {"cleared": True}}
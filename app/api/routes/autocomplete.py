@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.core.responses import FastJSONResponse
+from app.repositories import autocomplete_index
+
+router = APIRouter(prefix="/api/autocomplete", tags=["autocomplete"])
+
+
+@router.get("")
+def autocomplete(
+    type: str = Query(..., description="position / skill / company"),
+    q: str = Query("", max_length=50, description="입력 중인 prefix (한글은 자모 단위까지 매칭)"),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_read_db),
+):
+    """
+    자동완성 후보 조회
+    - 인증 불필요
+    - position: 공고 직무/직군, skill: 인재 카드 직무 역량, company: 기업명
+    - 결과는 해당 값을 쓰는 건수(count) 순
+    """
+    if type not in autocomplete_index.TYPES:
+        return FastJSONResponse(
+            status_code=422,
+            content={
+                "ok": False,
+                "error": {
+                    "code": "VALIDATION_ERROR",
+                    "message": f"type must be one of {', '.join(autocomplete_index.TYPES)}",
+                },
+            },
+        )
+    autocomplete_index.ensure_ready(db)
+    items = autocomplete_index.search(db, type, q, limit)
+    return FastJSONResponse({"ok": True, "data": {"type": type, "items": items}})
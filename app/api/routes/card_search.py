@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.core.responses import FastJSONResponse
+from app.repositories import card_index
+
+router = APIRouter(prefix="/api/cards", tags=["card_search"])
+
+
+@router.get("/search")
+def search_cards(
+    type: str = Query(..., description="talent / job_posting"),
+    q: str = Query(..., min_length=1, max_length=100),
+    min_similarity: float = Query(0.5, gt=0.0, le=1.0, description="일치해야 하는 쿼리 trigram 비율"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+):
+    """
+    카드 텍스트 fuzzy 검색 (오탈자 허용)
+    - 인증 불필요
+    - talent: 헤드라인 / 강점 / 경험, job_posting: 헤드라인 / 자격요건 / 인재상
+    - 응답 items[] = {card_id, user_id | job_posting_id, similarity} (유사도 순)
+    """
+    if type not in card_index.KINDS:
+        return FastJSONResponse(
+            status_code=422,
+            content={
+                "ok": False,
+                "error": {"code": "VALIDATION_ERROR", "message": f"type must be one of {', '.join(card_index.KINDS)}"},
+            },
+        )
+    card_index.ensure_ready(db)
+    items = card_index.search(db, type, q, limit=limit, min_similarity=min_similarity)
+    return FastJSONResponse({"ok": True, "data": {"type": type, "items": items}})
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, require_company_role
+from app.api.deps import get_db, get_read_db, require_company_role
+from app.core.responses import FastJSONResponse
 from app.schemas.company import CompanyFullIn
 from app.schemas.job_posting import JobPostingCreateIn
 from app.services import company_service
@@ -37,21 +39,86 @@ def _serialize_company(company):
         "profile_step": company.profile_step or 0,
         "is_submitted": company.is_submitted or 0,
         "status": company.status,
-        "created_at": company.created_at.isoformat() if company.created_at else None,
-        "updated_at": company.updated_at.isoformat() if company.updated_at else None,
+        "created_at": company.created_at,
+        "updated_at": company.updated_at,
+    }
+
+
+def _serialize_job_posting(posting):
+    return {
+        "id": posting.id,
+        "company_id": posting.company_id,
+        "title": posting.title,
+        "position_group": posting.position_group,
+        "position": posting.position,
+        "department": posting.department,
+        "employment_type": posting.employment_type,
+        "location_city": posting.location_city,
+        "career_level": posting.career_level,
+        "education_level": posting.education_level,
+        "start_date": posting.start_date,  # 문자열로 저장됨
+        "term_months": posting.term_months,
+        "homepage_url": posting.homepage_url,
+        "deadline_date": posting.deadline_date,
+        "contact_email": posting.contact_email,
+        "contact_phone": posting.contact_phone,
+        "salary_range": posting.salary_range,
+        "responsibilities": posting.responsibilities,
+        "requirements_must": posting.requirements_must,
+        "requirements_nice": posting.requirements_nice,
+        "competencies": posting.competencies,
+        "status": posting.status,
+        "jd_file_id": posting.jd_file_id,
+        "extra_file_id": posting.extra_file_id,
+        "published_at": posting.published_at,
+        "closed_at": posting.closed_at,
+        "deleted_at": posting.deleted_at,
+        "created_at": posting.created_at,
+        "updated_at": posting.updated_at,
+    }
+
+
+def _serialize_public_job_posting(posting):
+    return {
+        "id": posting.id,
+        "company_id": posting.company_id,
+        "title": posting.title,
+        "position_group": posting.position_group,
+        "position": posting.position,
+        "department": posting.department,
+        "employment_type": posting.employment_type,
+        "location_city": posting.location_city,
+        "career_level": posting.career_level,
+        "education_level": posting.education_level,
+        "salary_range": posting.salary_range,
+        "start_date": posting.start_date,  # 문자열로 저장됨
+        "term_months": posting.term_months,
+        "responsibilities": posting.responsibilities,
+        "requirements_must": posting.requirements_must,
+        "requirements_nice": posting.requirements_nice,
+        "competencies": posting.competencies,
+        "contact_email": posting.contact_email,
+        "contact_phone": posting.contact_phone,
+        "homepage_url": posting.homepage_url,
+        "deadline_date": posting.deadline_date,
+        "jd_file_id": posting.jd_file_id,
+        "extra_file_id": posting.extra_file_id,
+        "status": posting.status,
+        "created_at": posting.created_at,
+        "updated_at": posting.updated_at,
     }
 
 
 @router.get("")
-def get_company(user=Depends(require_company_role), db: Session = Depends(get_db)):
+def get_company(user=Depends(require_company_role), db: Session = Depends(get_read_db)):
     try:
         company = company_service.get_my_company(db, owner_user_id=user["id"])
     except HTTPException as e:
         if e.status_code == status.HTTP_404_NOT_FOUND:
-            return JSONResponse(status_code=404, content={"ok": False, "error": e.detail})
+            return FastJSONResponse(status_code=404, content={"ok": False, "error": e.detail})
         raise
 
-    return {"ok": True, "data": _serialize_company(company)}
+    return FastJSONResponse({"ok": True, "data": _serialize_company(company)})
 
 
 @router.post("/full")
@@ -60,10 +127,10 @@ def upsert_company_full(payload: CompanyFullIn, user=Depends(require_company_rol
         company = company_service.upsert_full(db, owner_user_id=user["id"], payload=payload.model_dump())
     except HTTPException as e:
         if e.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY:
-            return JSONResponse(status_code=422, content={"ok": False, "error": e.detail})
+            return FastJSONResponse(status_code=422, content={"ok": False, "error": e.detail})
         raise
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_201_CREATED,
         content={
             "ok": True,
@@ -91,93 +158,25 @@ def create_job_posting(payload: JobPostingCreateIn, user=Depends(require_company
         posting = job_posting_service.create(db, owner_user_id=user["id"], payload=payload.model_dump())
     except HTTPException as e:
         if e.status_code in (status.HTTP_404_NOT_FOUND, status.HTTP_422_UNPROCESSABLE_ENTITY):
-            return JSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
+            return FastJSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
         raise
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_201_CREATED,
-        content={
-            "ok": True,
-            "data": {
-                "id": posting.id,
-                "company_id": posting.company_id,
-                "title": posting.title,
-                "position_group": posting.position_group,
-                "position": getattr(posting, "position", None),
-                "department": posting.department,
-                "employment_type": posting.employment_type,
-                "location_city": posting.location_city,
-                "career_level": posting.career_level,
-                "education_level": posting.education_level,
-                "start_date": posting.start_date,  # 이제 문자열로 저장됨
-                "term_months": posting.term_months,
-                "homepage_url": posting.homepage_url,
-                "deadline_date": posting.deadline_date.isoformat() if posting.deadline_date else None,
-                "contact_email": posting.contact_email,
-                "contact_phone": posting.contact_phone,
-                "salary_range": posting.salary_range,
-                "responsibilities": posting.responsibilities,
-                "requirements_must": posting.requirements_must,
-                "requirements_nice": posting.requirements_nice,
-                "competencies": posting.competencies,
-                "status": posting.status,
-                "jd_file_id": posting.jd_file_id,
-                "extra_file_id": posting.extra_file_id,
-                "published_at": posting.published_at.isoformat() if posting.published_at else None,
-                "closed_at": posting.closed_at.isoformat() if posting.closed_at else None,
-                "deleted_at": posting.deleted_at.isoformat() if posting.deleted_at else None,
-                "created_at": posting.created_at.isoformat() if posting.created_at else None,
-                "updated_at": posting.updated_at.isoformat() if posting.updated_at else None,
-            },
-        },
+        content={"ok": True, "data": _serialize_job_posting(posting)},
     )
 
 
 @router.get("/job-postings")
-def list_job_postings(posting_status: str | None = None, user=Depends(require_company_role), db: Session = Depends(get_db)):
+def list_job_postings(posting_status: str | None = None, user=Depends(require_company_role), db: Session = Depends(get_read_db)):
     try:
         postings = job_posting_service.list_mine(db, owner_user_id=user["id"], status_filter=posting_status)
     except HTTPException as e:
         if e.status_code in (status.HTTP_404_NOT_FOUND, status.HTTP_422_UNPROCESSABLE_ENTITY):
-            return JSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
+            return FastJSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
         raise
 
-    items = [
-        {
-            "id": p.id,
-            "company_id": p.company_id,
-            "title": p.title,
-            "position_group": p.position_group,
-            "position": getattr(p, "position", None),
-            "department": p.department,
-            "employment_type": p.employment_type,
-            "location_city": p.location_city,
-            "career_level": p.career_level,
-            "education_level": p.education_level,
-            "start_date": p.start_date,  # 이미 문자열이므로 그대로 반환
-            "term_months": p.term_months,
-            "homepage_url": p.homepage_url,
-            "deadline_date": p.deadline_date.isoformat() if p.deadline_date else None,
-            "contact_email": p.contact_email,
-            "contact_phone": p.contact_phone,
-            "salary_range": p.salary_range,
-            "responsibilities": p.responsibilities,
-            "requirements_must": p.requirements_must,
-            "requirements_nice": p.requirements_nice,
-            "competencies": p.competencies,
-            "status": p.status,
-            "jd_file_id": p.jd_file_id,
-            "extra_file_id": p.extra_file_id,
-            "published_at": p.published_at.isoformat() if p.published_at else None,
-            "closed_at": p.closed_at.isoformat() if p.closed_at else None,
-            "deleted_at": p.deleted_at.isoformat() if p.deleted_at else None,
-            "created_at": p.created_at.isoformat() if p.created_at else None,
-            "updated_at": p.updated_at.isoformat() if p.updated_at else None,
-        }
-        for p in postings
-    ]
-
-    return {"ok": True, "data": items}
+    return FastJSONResponse({"ok": True, "data": [_serialize_job_posting(p) for p in postings]})
 
 
 @router.patch("/job-postings/{posting_id}")
@@ -194,43 +193,10 @@ def update_job_posting(
             status.HTTP_404_NOT_FOUND,
             status.HTTP_422_UNPROCESSABLE_ENTITY,
         ):
-            return JSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
+            return FastJSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
         raise
 
-    return {
-        "ok": True,
-        "data": {
-            "id": posting.id,
-            "company_id": posting.company_id,
-            "title": posting.title,
-            "position_group": posting.position_group,
-            "position": getattr(posting, "position", None),
-            "department": posting.department,
-            "employment_type": posting.employment_type,
-            "location_city": posting.location_city,
-            "career_level": posting.career_level,
-            "education_level": posting.education_level,
-            "start_date": posting.start_date,  # 이미 문자열
-            "term_months": posting.term_months,
-            "homepage_url": posting.homepage_url,
-            "deadline_date": posting.deadline_date.isoformat() if posting.deadline_date else None,
-            "contact_email": posting.contact_email,
-            "contact_phone": posting.contact_phone,
-            "salary_range": posting.salary_range,
-            "responsibilities": posting.responsibilities,
-            "requirements_must": posting.requirements_must,
-            "requirements_nice": posting.requirements_nice,
-            "competencies": posting.competencies,
-            "status": posting.status,
-            "jd_file_id": posting.jd_file_id,
-            "extra_file_id": posting.extra_file_id,
-            "published_at": posting.published_at.isoformat() if posting.published_at else None,
-            "closed_at": posting.closed_at.isoformat() if posting.closed_at else None,
-            "deleted_at": posting.deleted_at.isoformat() if posting.deleted_at else None,
-            "created_at": posting.created_at.isoformat() if posting.created_at else None,
-            "updated_at": posting.updated_at.isoformat() if posting.updated_at else None,
-        },
-    }
+    return FastJSONResponse({"ok": True, "data": _serialize_job_posting(posting)})
 
 
 @router.delete("/job-postings/{posting_id}")
@@ -246,17 +212,14 @@ def delete_job_posting(
             status.HTTP_404_NOT_FOUND,
             status.HTTP_422_UNPROCESSABLE_ENTITY,
         ):
-            return JSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
+            return FastJSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
         raise
 
-    return {
-        "ok": True,
-        "data": {"id": posting.id, "deleted_at": posting.deleted_at.isoformat() if posting.deleted_at else None},
-    }
+    return FastJSONResponse({"ok": True, "data": {"id": posting.id, "deleted_at": posting.deleted_at}})
 
 
 @public_router.get("/user/{user_id}")
-def get_company_profile_by_user(user_id: int, db: Session = Depends(get_db)):
+def get_company_profile_by_user(user_id: int, db: Session = Depends(get_read_db)):
     """
     공개 기업 프로필 조회 (user_id 기반)
     - 인증 불필요
@@ -266,14 +229,14 @@ def get_company_profile_by_user(user_id: int, db: Session = Depends(get_db)):
         company = company_service.get_company_by_user_id(db, user_id=user_id)
     except HTTPException as e:
         if e.status_code == status.HTTP_404_NOT_FOUND:
-            return JSONResponse(status_code=404, content={"ok": False, "error": e.detail})
+            return FastJSONResponse(status_code=404, content={"ok": False, "error": e.detail})
         raise
 
-    return {"ok": True, "data": _serialize_company(company)}
+    return FastJSONResponse({"ok": True, "data": _serialize_company(company)})
 
 
 @public_router.get("/{company_id}")
-def get_company_profile(company_id: int, db: Session = Depends(get_db)):
+def get_company_profile(company_id: int, db: Session = Depends(get_read_db)):
     """
     공개 기업 프로필 조회 (company_id 기반)
     - 인증 불필요
@@ -283,15 +246,15 @@ def get_company_profile(company_id: int, db: Session = Depends(get_db)):
         company = company_service.get_public_company(db, company_id=company_id)
     except HTTPException as e:
         if e.status_code == status.HTTP_404_NOT_FOUND:
-            return JSONResponse(status_code=404, content={"ok": False, "error": e.detail})
+            return FastJSONResponse(status_code=404, content={"ok": False, "error": e.detail})
         raise
 
-    return {"ok": True, "data": _serialize_company(company)}
+    return FastJSONResponse({"ok": True, "data": _serialize_company(company)})
 
 
 # 공개 API: user_id로 기업 프로필 조회
 @public_router.get("/user/{user_id}")
-def get_company_by_user_id(user_id: int, db: Session = Depends(get_db)):
+def get_company_by_user_id(user_id: int, db: Session = Depends(get_read_db)):
     """
     공개 기업 프로필 조회 (user_id 기반)
     - 인증 불필요
@@ -303,21 +266,108 @@ def get_company_by_user_id(user_id: int, db: Session = Depends(get_db)):
         company = company_service.get_company_by_user_id(db, user_id=user_id)
     except HTTPException as e:
         if e.status_code == status.HTTP_404_NOT_FOUND:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=404, 
                 content={"ok": False, "error": e.detail}
             )
         raise
 
-    return {"ok": True, "data": _serialize_company(company)}
+    return FastJSONResponse({"ok": True, "data": _serialize_company(company)})
 
 
 # 새로운 공개 라우터 추가 (job-postings용)
 job_posting_public_router = APIRouter(prefix="/api/job-postings", tags=["job_posting_public"])
 
 
+@job_posting_public_router.get("/search")
+def search_job_postings(
+    q: str | None = Query(None, max_length=100, description="키워드 (제목/주요업무/필수요건/역량)"),
+    location_city: list[str] | None = Query(None),
+    employment_type: list[str] | None = Query(None),
+    career_level: list[str] | None = Query(None),
+    education_level: list[str] | None = Query(None),
+    salary_range: list[str] | None = Query(None),
+    posting_status: list[str] | None = Query(None, alias="status", description="PUBLISHED(기본) / CLOSED"),
+    deadline_from: date | None = None,
+    deadline_to: date | None = None,
+    open_only: bool = Query(True, description="마감일이 지난 공고 제외"),
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+):
+    """
+    공개 채용공고 검색
+    - 인증 불필요
+    - 같은 필터를 여러 번 주면 OR (예: location_city=서울&location_city=경기)
+    - q가 있으면 관련도 순, 없으면 최신순 / 응답의 next_cursor로 다음 페이지 조회
+    """
+    try:
+        rows, next_cursor = job_posting_service.search(
+            db,
+            keyword=q,
+            statuses=posting_status,
+            location_city=location_city,
+            employment_type=employment_type,
+            career_level=career_level,
+            education_level=education_level,
+            salary_range=salary_range,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+            open_only=open_only,
+            cursor=cursor,
+            limit=limit,
+        )
+    except HTTPException as e:
+        if e.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY:
+            return FastJSONResponse(status_code=422, content={"ok": False, "error": e.detail})
+        raise
+
+    items = [{**_serialize_public_job_posting(posting), "relevance": relevance} for posting, relevance in rows]
+    return FastJSONResponse({"ok": True, "data": {"items": items, "next_cursor": next_cursor}})
+
+
+@job_posting_public_router.get("/search/facets")
+def search_job_posting_facets(
+    q: str | None = Query(None, max_length=100, description="키워드 (제목/주요업무/필수요건/역량)"),
+    location_city: list[str] | None = Query(None),
+    employment_type: list[str] | None = Query(None),
+    career_level: list[str] | None = Query(None),
+    education_level: list[str] | None = Query(None),
+    salary_range: list[str] | None = Query(None),
+    posting_status: list[str] | None = Query(None, alias="status", description="PUBLISHED(기본) / CLOSED"),
+    deadline_from: date | None = None,
+    deadline_to: date | None = None,
+    open_only: bool = Query(True, description="마감일이 지난 공고 제외"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    공개 채용공고 검색 facet 건수
+    - 인증 불필요, 조건은 /search와 동일 (cursor/limit 제외)
+    - facets[필드] = [{value, count}] (건수 내림차순), 각 필드는 자기 조건을 뺀 나머지 조건 기준
+    """
+    try:
+        data = job_posting_service.facets(
+            db,
+            keyword=q,
+            statuses=posting_status,
+            location_city=location_city,
+            employment_type=employment_type,
+            career_level=career_level,
+            education_level=education_level,
+            salary_range=salary_range,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+            open_only=open_only,
+        )
+    except HTTPException as e:
+        if e.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY:
+            return FastJSONResponse(status_code=422, content={"ok": False, "error": e.detail})
+        raise
+    return FastJSONResponse({"ok": True, "data": data})
+
+
 @job_posting_public_router.get("/{job_posting_id}")
-def get_public_job_posting(job_posting_id: int, db: Session = Depends(get_db)):
+def get_public_job_posting(job_posting_id: int, db: Session = Depends(get_read_db)):
     """
     공개 채용공고 상세 조회
     - 인증 불필요
@@ -326,40 +376,10 @@ def get_public_job_posting(job_posting_id: int, db: Session = Depends(get_db)):
     try:
         posting = job_posting_service.get_by_id(db, job_posting_id=job_posting_id)
         
-        return {
-            "ok": True,
-            "data": {
-                "id": posting.id,
-                "company_id": posting.company_id,
-                "title": posting.title,
-                "position_group": posting.position_group,
-                "position": posting.position,
-                "department": posting.department,
-                "employment_type": posting.employment_type,
-                "location_city": posting.location_city,
-                "career_level": posting.career_level,
-                "education_level": posting.education_level,
-                "salary_range": posting.salary_range,
-                "start_date": posting.start_date,  # 이미 문자열
-                "term_months": posting.term_months,
-                "responsibilities": posting.responsibilities,
-                "requirements_must": posting.requirements_must,
-                "requirements_nice": posting.requirements_nice,
-                "competencies": posting.competencies,
-                "contact_email": posting.contact_email,
-                "contact_phone": posting.contact_phone,
-                "homepage_url": posting.homepage_url,
-                "deadline_date": posting.deadline_date.isoformat() if posting.deadline_date else None,
-                "jd_file_id": posting.jd_file_id,
-                "extra_file_id": posting.extra_file_id,
-                "status": posting.status,
-                "created_at": posting.created_at.isoformat() if posting.created_at else None,
-                "updated_at": posting.updated_at.isoformat() if posting.updated_at else None,
-            }
-        }
+        return FastJSONResponse({"ok": True, "data": _serialize_public_job_posting(posting)})
     except HTTPException as e:
         if e.status_code == status.HTTP_404_NOT_FOUND:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=404,
                 content={"ok": False, "error": {"code": "JOB_POSTING_NOT_FOUND", "message": "Job posting not found"}}
             )
@@ -367,7 +387,7 @@ def get_public_job_posting(job_posting_id: int, db: Session = Depends(get_db)):
 
 
 @public_router.get("/{company_id}/job-postings/{job_posting_id}")
-def get_public_job_posting_by_company(company_id: int, job_posting_id: int, db: Session = Depends(get_db)):
+def get_public_job_posting_by_company(company_id: int, job_posting_id: int, db: Session = Depends(get_read_db)):
     """
     공개 채용공고 상세 조회 (회사별)
     - 인증 불필요
@@ -379,7 +399,7 @@ def get_public_job_posting_by_company(company_id: int, job_posting_id: int, db:
         
         # 채용공고가 해당 기업의 것인지 확인
         if posting.company_id != company_id:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=404,
                 content={
                     "ok": False,
@@ -387,40 +407,10 @@ def get_public_job_posting_by_company(company_id: int, job_posting_id: int, db:
                 }
             )
         
-        return {
-            "ok": True,
-            "data": {
-                "id": posting.id,
-                "company_id": posting.company_id,
-                "title": posting.title,
-                "position_group": posting.position_group,
-                "position": getattr(posting, "position", None),
-                "department": posting.department,
-                "employment_type": posting.employment_type,
-                "location_city": posting.location_city,
-                "career_level": posting.career_level,
-                "education_level": posting.education_level,
-                "salary_range": posting.salary_range,
-                "start_date": posting.start_date,  # 이미 문자열
-                "term_months": posting.term_months,
-                "responsibilities": posting.responsibilities,
-                "requirements_must": posting.requirements_must,
-                "requirements_nice": posting.requirements_nice,
-                "competencies": posting.competencies,
-                "contact_email": posting.contact_email,
-                "contact_phone": posting.contact_phone,
-                "homepage_url": posting.homepage_url,
-                "deadline_date": posting.deadline_date.isoformat() if posting.deadline_date else None,
-                "jd_file_id": posting.jd_file_id,
-                "extra_file_id": posting.extra_file_id,
-                "status": posting.status,
-                "created_at": posting.created_at.isoformat() if posting.created_at else None,
-                "updated_at": posting.updated_at.isoformat() if posting.updated_at else None,
-            }
-        }
+        return FastJSONResponse({"ok": True, "data": _serialize_public_job_posting(posting)})
     except HTTPException as e:
         if e.status_code == status.HTTP_404_NOT_FOUND:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=404,
                 content={"ok": False, "error": {"code": "JOB_POSTING_NOT_FOUND", "message": "Job posting not found"}}
             )
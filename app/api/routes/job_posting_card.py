@@ -5,10 +5,11 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_read_db
 from app.models.company import Company
 from app.models.job_posting import JobPosting
 from app.models.job_posting_card import JobPostingCard
+from app.repositories import card_index
 from app.schemas.job_posting_card import JobPostingCardCreate, JobPostingCardResponse
 
 
@@ -31,13 +32,14 @@ def create_job_posting_card(payload: JobPostingCardCreate, db: Session = Depends
     db.add(card)
     db.flush()  # PK 생성을 위해 flush
     db.refresh(card)  # 관계 로딩
+    card_index.track(db, "job_posting", card)
 
     response = JobPostingCardResponse.model_validate(card)
     return {"ok": True, "data": response.model_dump(mode="json")}
 
 
 @router.get("/{job_posting_id}")
-def get_job_posting_card(job_posting_id: int, db: Session = Depends(get_db)):
+def get_job_posting_card(job_posting_id: int, db: Session = Depends(get_read_db)):
     cards = db.scalars(
         select(JobPostingCard).where(JobPostingCard.job_posting_id == job_posting_id)
     ).all()
@@ -123,6 +125,7 @@ def update_job_posting_card(
 
     db.flush()
     db.refresh(card)
+    card_index.track(db, "job_posting", card)
 
     response = JobPostingCardResponse.model_validate(card)
     return {"ok": True, "data": response.model_dump(mode="json")}
@@ -3,7 +3,8 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_read_db
+from app.core.responses import FastJSONResponse
 from app.repositories import matching_result_repo
 
 router = APIRouter(prefix="/api/matching-results", tags=["matching_results"])
@@ -15,7 +16,7 @@ def get_talent_matches(
     min_score: float = Query(0.0, ge=0.0, le=100.0, description="최소 점수 필터 (0~100)"),
     limit: int = Query(100, ge=1, le=500, description="최대 반환 개수"),
     user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     특정 인재와 매칭된 공고 목록 조회 (점수 내림차순)
@@ -36,26 +37,26 @@ def get_talent_matches(
         results.append({
             "job_posting_id": match.job_posting_id,
             "company_user_id": match.company_user_id,
-            "total_score": float(match.total_score),
+            "total_score": match.total_score,
             "scores": {
-                "roles": float(match.score_roles) if match.score_roles else None,
-                "skills": float(match.score_skills) if match.score_skills else None,
-                "growth": float(match.score_growth) if match.score_growth else None,
-                "career": float(match.score_career) if match.score_career else None,
-                "vision": float(match.score_vision) if match.score_vision else None,
-                "culture": float(match.score_culture) if match.score_culture else None,
+                "roles": match.score_roles,
+                "skills": match.score_skills,
+                "growth": match.score_growth,
+                "career": match.score_career,
+                "vision": match.score_vision,
+                "culture": match.score_culture,
             },
-            "calculated_at": match.calculated_at.isoformat(),
+            "calculated_at": match.calculated_at,
         })
     
-    return {
+    return FastJSONResponse({
         "ok": True,
         "data": {
             "talent_user_id": user_id,
             "total_matches": len(results),
             "matches": results,
         }
-    }
+    })
 
 
 @router.get("/job-postings/{job_posting_id}/talents")
@@ -64,7 +65,7 @@ def get_job_posting_matches(
     min_score: float = Query(0.0, ge=0.0, le=100.0, description="최소 점수 필터 (0~100)"),
     limit: int = Query(100, ge=1, le=500, description="최대 반환 개수"),
     user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     특정 공고와 매칭된 인재 목록 조회 (점수 내림차순)
@@ -84,26 +85,26 @@ def get_job_posting_matches(
     for match in matches:
         results.append({
             "talent_user_id": match.talent_user_id,
-            "total_score": float(match.total_score),
+            "total_score": match.total_score,
             "scores": {
-                "roles": float(match.score_roles) if match.score_roles else None,
-                "skills": float(match.score_skills) if match.score_skills else None,
-                "growth": float(match.score_growth) if match.score_growth else None,
-                "career": float(match.score_career) if match.score_career else None,
-                "vision": float(match.score_vision) if match.score_vision else None,
-                "culture": float(match.score_culture) if match.score_culture else None,
+                "roles": match.score_roles,
+                "skills": match.score_skills,
+                "growth": match.score_growth,
+                "career": match.score_career,
+                "vision": match.score_vision,
+                "culture": match.score_culture,
             },
-            "calculated_at": match.calculated_at.isoformat(),
+            "calculated_at": match.calculated_at,
         })
     
-    return {
+    return FastJSONResponse({
         "ok": True,
         "data": {
             "job_posting_id": job_posting_id,
             "total_matches": len(results),
             "matches": results,
         }
-    }
+    })
 
 
 @router.get("/companies/{company_user_id}/talents")
@@ -112,7 +113,7 @@ def get_company_matches(
     min_score: float = Query(0.0, ge=0.0, le=100.0, description="최소 점수 필터 (0~100)"),
     limit: int = Query(100, ge=1, le=500, description="최대 반환 개수"),
     user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     특정 기업의 모든 공고와 매칭된 인재 목록 조회 (점수 내림차순)
@@ -133,23 +134,23 @@ def get_company_matches(
         results.append({
             "talent_user_id": match.talent_user_id,
             "job_posting_id": match.job_posting_id,
-            "total_score": float(match.total_score),
+            "total_score": match.total_score,
             "scores": {
-                "roles": float(match.score_roles) if match.score_roles else None,
-                "skills": float(match.score_skills) if match.score_skills else None,
-                "growth": float(match.score_growth) if match.score_growth else None,
-                "career": float(match.score_career) if match.score_career else None,
-                "vision": float(match.score_vision) if match.score_vision else None,
-                "culture": float(match.score_culture) if match.score_culture else None,
+                "roles": match.score_roles,
+                "skills": match.score_skills,
+                "growth": match.score_growth,
+                "career": match.score_career,
+                "vision": match.score_vision,
+                "culture": match.score_culture,
             },
-            "calculated_at": match.calculated_at.isoformat(),
+            "calculated_at": match.calculated_at,
         })
     
-    return {
+    return FastJSONResponse({
         "ok": True,
         "data": {
             "company_user_id": company_user_id,
             "total_matches": len(results),
             "matches": results,
         }
-    }
+    })
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_read_db
 from app.schemas.matching_vector import (
     MatchingVectorCreateIn,
     MatchingVectorDetailOut,
@@ -29,7 +29,7 @@ def _error_response(exc: HTTPException) -> JSONResponse:
 @router.get("")
 def get_my_matching_vectors(
     user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     현재 로그인한 사용자의 모든 매칭 벡터 조회
@@ -141,7 +141,7 @@ def delete_matching_vector(
 @public_router.get("/{vector_id}")
 def get_matching_vector_by_id(
     vector_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Vector ID로 매칭 벡터 상세 정보 조회 (인증 불필요)
@@ -155,6 +155,8 @@ def get_matching_vector_by_id(
     - reference_type: "talent" 또는 "job_posting" (있을 경우)
     - reference_id: talent_card_id 또는 job_posting_card_id (있을 경우)
     - vector_roles, vector_skills, vector_growth, vector_career, vector_vision, vector_culture: 벡터 값들
+      (필드별 "model" / "dim" 포함)
+    - model_version / dims: 벡터를 만든 모델과 차원 (필드별로 다르면 "mixed" / null)
     - updated_at: 마지막 업데이트 시각
     """
     try:
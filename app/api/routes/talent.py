@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Header, HTTPException, status
 from fastapi.responses import JSONResponse
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_read_db, require_company_role
 from app.core.settings import settings  # noqa: F401  # kept for parity, not used directly
 from app.schemas.full_profile import FullProfileIn
 from app.schemas.talent_response import (
@@ -17,7 +18,9 @@ from app.schemas.talent_response import (
     TalentFullData,
     TalentFullResponse,
 )
+from app.schemas.talent_search import TalentSearchIn
 from app.services.full_profile import save_full_profile
+from app.services import talent_search_service
 from app.services.talent_read import (
     get_basic_profile,
     list_activities,
@@ -170,7 +173,7 @@ def delete_education(education_id: int, user=Depends(get_current_user)):
         if e.status_code in (status.HTTP_404_NOT_FOUND, status.HTTP_403_FORBIDDEN):
             return JSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
         raise
-    return {"ok": True, "data": {"id": row.id, "deleted_at": row.deleted_at.isoformat() if row.deleted_at else None}}
+    return {"ok": True, "data": {"id": row.id, "deleted_at": row.deleted_at}}
 
 
 @router.post("/experiences")
@@ -203,7 +206,7 @@ def delete_experience(experience_id: int, user=Depends(get_current_user)):
         if e.status_code in (status.HTTP_404_NOT_FOUND, status.HTTP_403_FORBIDDEN):
             return JSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
         raise
-    return {"ok": True, "data": {"id": row.id, "deleted_at": row.deleted_at.isoformat() if row.deleted_at else None}}
+    return {"ok": True, "data": {"id": row.id, "deleted_at": row.deleted_at}}
 
 
 @router.post("/activities")
@@ -231,7 +234,7 @@ def delete_activity(activity_id: int, user=Depends(get_current_user)):
         if e.status_code in (status.HTTP_404_NOT_FOUND, status.HTTP_403_FORBIDDEN):
             return JSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
         raise
-    return {"ok": True, "data": {"id": row.id, "deleted_at": row.deleted_at.isoformat() if row.deleted_at else None}}
+    return {"ok": True, "data": {"id": row.id, "deleted_at": row.deleted_at}}
 
 
 @router.post("/certifications")
@@ -259,7 +262,7 @@ def delete_certification(certification_id: int, user=Depends(get_current_user)):
         if e.status_code in (status.HTTP_404_NOT_FOUND, status.HTTP_403_FORBIDDEN):
             return JSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
         raise
-    return {"ok": True, "data": {"id": row.id, "deleted_at": row.deleted_at.isoformat() if row.deleted_at else None}}
+    return {"ok": True, "data": {"id": row.id, "deleted_at": row.deleted_at}}
 
 
 @router.post("/documents")
@@ -287,7 +290,72 @@ def delete_document(document_id: int, user=Depends(get_current_user)):
         if e.status_code in (status.HTTP_404_NOT_FOUND, status.HTTP_403_FORBIDDEN):
             return JSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
         raise
-    return {"ok": True, "data": {"id": row.id, "deleted_at": row.deleted_at.isoformat() if row.deleted_at else None}}
+    return {"ok": True, "data": {"id": row.id, "deleted_at": row.deleted_at}}
+
+
+# ============================================================
+# 기업용 인재 검색
+# ============================================================
+
+def _search_talents(payload: TalentSearchIn, user, db: Session):
+    try:
+        data = talent_search_service.search(db, owner_user_id=int(user["id"]), payload=payload)
+    except HTTPException as e:
+        if e.status_code in (status.HTTP_404_NOT_FOUND, status.HTTP_422_UNPROCESSABLE_ENTITY):
+            return JSONResponse(status_code=e.status_code, content={"ok": False, "error": e.detail})
+        raise
+    return {"ok": True, "data": data}
+
+
+@public_router.get("/search")
+def search_talents(
+    job_posting_id: int,
+    desired_role: str | None = None,
+    residence_location: str | None = None,
+    desired_work_location: str | None = None,
+    min_experience_years: int | None = None,
+    max_experience_years: int | None = None,
+    submitted_only: bool = True,
+    min_score: float = 0.0,
+    limit: int = 20,
+    cursor: str | None = None,
+    user=Depends(require_company_role),
+    db: Session = Depends(get_read_db),
+):
+    """
+    내 채용공고 기준 인재 검색 (기업 전용)
+    - 공고의 매칭 벡터와 인재 벡터의 유사도 순, 프로필/경력 필터 적용
+    - 임의 벡터로 검색하려면 POST /api/talents/search
+    """
+    try:
+        payload = TalentSearchIn(
+            job_posting_id=job_posting_id,
+            desired_role=desired_role,
+            residence_location=residence_location,
+            desired_work_location=desired_work_location,
+            min_experience_years=min_experience_years,
+            max_experience_years=max_experience_years,
+            submitted_only=submitted_only,
+            min_score=min_score,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValidationError as e:
+        return JSONResponse(
+            status_code=422,
+            content={"ok": False, "error": {"code": "VALIDATION_ERROR", "message": e.errors()[0]["msg"]}},
+        )
+    return _search_talents(payload, user, db)
+
+
+@public_router.post("/search")
+def search_talents_by_vectors(
+    payload: TalentSearchIn,
+    user=Depends(require_company_role),
+    db: Session = Depends(get_read_db),
+):
+    """인재 검색 (기업 전용, body로 job_posting_id 또는 query_vectors + 필터 전달)"""
+    return _search_talents(payload, user, db)
 
 
 # ============================================================
@@ -295,7 +363,7 @@ def delete_document(document_id: int, user=Depends(get_current_user)):
 # ============================================================
 
 @public_router.get("/{user_id}/profile", response_model=TalentFullResponse)
-def get_public_talent_profile(user_id: int, db: Session = Depends(get_db)) -> TalentFullResponse:
+def get_public_talent_profile(user_id: int, db: Session = Depends(get_read_db)) -> TalentFullResponse:
     """
     공개 인재 프로필 조회
     - 인증 불필요
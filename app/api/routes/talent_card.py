@@ -5,9 +5,10 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_read_db
 from app.models.talent_card import TalentCard
 from app.models.user import User
+from app.repositories import autocomplete_index, card_index
 from app.schemas.talent_card import TalentCardCreate, TalentCardResponse
 
 
@@ -46,13 +47,15 @@ def create_talent_card(payload: TalentCardCreate, db: Session = Depends(get_db))
     db.add(card)
     db.flush()  # PK 생성을 위해 flush
     db.refresh(card)  # 관계 로딩
+    autocomplete_index.track(db, "skill", card)
+    card_index.track(db, "talent", card)
 
     response = TalentCardResponse.model_validate(card)
     return {"ok": True, "data": response.model_dump(mode="json")}
 
 
 @router.get("/{user_id}")
-def get_talent_card(user_id: int, db: Session = Depends(get_db)):
+def get_talent_card(user_id: int, db: Session = Depends(get_read_db)):
     card = db.scalar(select(TalentCard).where(TalentCard.user_id == user_id))
     if card is None:
         return JSONResponse(
@@ -112,6 +115,8 @@ def update_talent_card(
 
     db.flush()
     db.refresh(card)
+    autocomplete_index.track(db, "skill", card)
+    card_index.track(db, "talent", card)
 
     response = TalentCardResponse.model_validate(card)
     return {"ok": True, "data": response.model_dump(mode="json")}
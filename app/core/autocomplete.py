@@ -0,0 +1,152 @@
+"""
+자동완성용 in-memory prefix index
+- (정규화 key, 원문) 을 정렬된 list로 유지하고 bisect로 prefix 범위를 찾는다 (trie 대비 메모리가 작고 구현이 단순)
+- 한글은 자모 단위로 분해해서 비교: "갭" → ㄱㅐㅂ 이 "개발" → ㄱㅐㅂㅏㄹ 의 prefix 이므로 입력 중인 글자도 매칭
+  (겹모음/겹받침도 나눠서 "고" → "과", "달" → "닭" 처럼 조합 중인 상태를 처리)
+- 여러 단어 값은 단어 시작 위치마다 key를 추가 ("네이버 클라우드" 는 "클라" 로도 검색)
+- 같은 값을 여러 row가 가지면 값별 row id 집합으로 관리하고, 결과는 참조 수(많이 쓰인 값) 순
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ", "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"]
+_JONG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+    "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+# 단독으로 입력된 겹자모 (호환 자모)
+_COMPOUND = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLES = [
+    _CHO[i // 588] + _JUNG[i % 588 // 28] + _JONG[i % 28] for i in range(11172)
+]
+_RE_SPACE = re.compile(r"\s+")
+_RE_WORD_BREAK = re.compile(r"[\s/,·()\[\]]+")
+_MAX_WORD_KEYS = 8
+
+
+def normalize(text: str) -> str:
+    """비교용 key: NFC → 소문자 → 공백 정리 → 한글 음절/겹자모를 자모로 분해"""
+    text = _RE_SPACE.sub(" ", unicodedata.normalize("NFC", text).lower()).strip()
+    out = []
+    for ch in text:
+        code = ord(ch) - _SYLLABLE_BASE
+        if 0 <= code < 11172:
+            out.append(_SYLLABLES[code])
+        else:
+            out.append(_COMPOUND.get(ch, ch))
+    return "".join(out)
+
+
+def keys_for(value: str) -> List[str]:
+    """값 전체 + 단어 시작 위치별 key (중복 제거)"""
+    words = [w for w in _RE_WORD_BREAK.split(value) if w]
+    keys = {normalize(value)}
+    for i in range(1, min(len(words), _MAX_WORD_KEYS)):
+        keys.add(normalize(" ".join(words[i:])))
+    keys.discard("")
+    return sorted(keys)
+
+
+class PrefixIndex:
+    """
+    row id → 값 목록을 받아 prefix 검색을 제공
+    - set(row_id, values): 이전 값과의 차이만 반영 (insort/del, 값 종류 수에 비례)
+    - search(q, limit): bisect로 범위 시작을 찾고 최대 scan_limit개 key만 확인
+    """
+
+    def __init__(self, scan_limit: int = 200) -> None:
+        self.scan_limit = scan_limit
+        self._entries: List[Tuple[str, str]] = []  # (key, 원문) 정렬 상태 유지
+        self._holders: Dict[str, Set[int]] = {}  # 값 → 그 값을 가진 row id
+        self._rows: Dict[int, Tuple[str, ...]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._holders)
+
+    @staticmethod
+    def _clean(values: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(sorted({v.strip() for v in values if v and v.strip()}))
+
+    def _add(self, value: str, row_id: int) -> None:
+        holders = self._holders.get(value)
+        if holders is None:
+            holders = self._holders[value] = set()
+            for key in keys_for(value):
+                insort(self._entries, (key, value))
+        holders.add(row_id)
+
+    def _discard(self, value: str, row_id: int) -> None:
+        holders = self._holders[value]
+        holders.discard(row_id)
+        if holders:
+            return
+        del self._holders[value]
+        for key in keys_for(value):
+            i = bisect_left(self._entries, (key, value))
+            if i < len(self._entries) and self._entries[i] == (key, value):
+                del self._entries[i]
+
+    def set(self, row_id: int, values: Iterable[str]) -> None:
+        new = self._clean(values)
+        with self._lock:
+            old = self._rows.pop(row_id, ())
+            if new:
+                self._rows[row_id] = new
+            for value in set(old) - set(new):
+                self._discard(value, row_id)
+            for value in set(new) - set(old):
+                self._add(value, row_id)
+
+    def remove(self, row_id: int) -> None:
+        self.set(row_id, ())
+
+    def rebuild(self, rows: Iterable[Tuple[int, Iterable[str]]]) -> None:
+        """전체 재구성: insort 대신 모아서 한 번 정렬"""
+        row_values = {row_id: values for row_id, values in ((r, self._clean(v)) for r, v in rows) if values}
+        holders: Dict[str, Set[int]] = {}
+        for row_id, values in row_values.items():
+            for value in values:
+                holders.setdefault(value, set()).add(row_id)
+        entries = sorted({(key, value) for value in holders for key in keys_for(value)})
+        with self._lock:
+            self._rows, self._holders, self._entries = row_values, holders, entries
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, object]]:
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        found: Dict[str, int] = {}
+        with self._lock:
+            i = bisect_left(self._entries, (prefix,))
+            end = min(len(self._entries), i + self.scan_limit)
+            while i < end:
+                key, value = self._entries[i]
+                if not key.startswith(prefix):
+                    break
+                found[value] = len(self._holders[value])
+                i += 1
+        ranked: Sequence[Tuple[str, int]] = sorted(found.items(), key=lambda item: (-item[1], len(item[0]), item[0]))
+        return [{"value": value, "count": count} for value, count in ranked[:limit]]
+
+    def rows_with(self, value: str, limit: int) -> List[int]:
+        """value를 가진 row id 최대 limit개"""
+        with self._lock:
+            return list(islice(self._holders.get(value, ()), limit))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"rows": len(self._rows), "values": len(self._holders), "keys": len(self._entries)}
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# byte 값 → 켜진 bit 위치 (ids() 에서 byte 단위로 풀어낼 때 사용)
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def iter_ids(bits: int, descending: bool = False) -> List[int]:
+    """bitset에서 켜진 위치(id) 목록, O(bitset 크기 + 결과 수)"""
+    if bits <= 0:
+        return []
+    raw = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    ids = [offset * 8 + bit for offset, byte in enumerate(raw) if byte for bit in _BYTE_BITS[byte]]
+    if descending:
+        ids.reverse()
+    return ids
+
+
+def from_ids(ids: Iterable[int]) -> int:
+    """id 목록 → bitset (iter_ids의 역), bytearray에 bit를 찍고 한 번에 int로 변환"""
+    ids = list(ids)
+    if not ids:
+        return 0
+    raw = bytearray(max(ids) // 8 + 1)
+    for row_id in ids:
+        raw[row_id >> 3] |= 1 << (row_id & 7)
+    return int.from_bytes(raw, "little")
+
+
+class BitmapIndex:
+    """
+    저카디널리티 컬럼용 in-process bitmap index
+    - 필드마다 값 → bitset(Python int, bit 위치 = row id)
+    - Python int는 상위 bit가 비어 있으면 그만큼 메모리를 쓰지 않고, AND/OR/popcount가 C 루프로 동작
+    - match({"location_city": ["서울", "경기"], "status": ["PUBLISHED"]}) → 같은 필드는 OR, 필드끼리는 AND
+    """
+
+    def __init__(self, fields: Sequence[str]) -> None:
+        self.fields = tuple(fields)
+        self._bits: Dict[str, Dict[Hashable, int]] = {field: {} for field in self.fields}
+        self._rows: Dict[int, tuple] = {}
+        self._all = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, row_id: int, values: Mapping[str, Hashable]) -> None:
+        """row 추가 (이미 있으면 이전 값 bit를 지우고 다시 기록)"""
+        row = tuple(values.get(field) for field in self.fields)
+        bit = 1 << row_id
+        with self._lock:
+            self._clear(row_id)
+            for field, value in zip(self.fields, row):
+                by_value = self._bits[field]
+                by_value[value] = by_value.get(value, 0) | bit
+            self._rows[row_id] = row
+            self._all |= bit
+
+    def rebuild(self, rows: Iterable[Tuple[int, Mapping[str, Hashable]]]) -> None:
+        """
+        전체 교체: 값별로 id를 모은 뒤 from_ids로 bitset을 한 번씩 만든다
+        (row마다 add하면 매번 max_id 크기의 int를 새로 만들어 O(N·max_id))
+        """
+        ids_by_value: Dict[str, Dict[Hashable, List[int]]] = {field: {} for field in self.fields}
+        table: Dict[int, tuple] = {}
+        for row_id, values in rows:
+            row = tuple(values.get(field) for field in self.fields)
+            table[row_id] = row
+            for field, value in zip(self.fields, row):
+                ids_by_value[field].setdefault(value, []).append(row_id)
+        bits = {field: {value: from_ids(ids) for value, ids in by_value.items()} for field, by_value in ids_by_value.items()}
+        everything = from_ids(table)
+        with self._lock:
+            self._bits = bits
+            self._rows = table
+            self._all = everything
+
+    def remove(self, row_id: int) -> None:
+        with self._lock:
+            self._clear(row_id)
+
+    def _clear(self, row_id: int) -> None:
+        row = self._rows.pop(row_id, None)
+        if row is None:
+            return
+        mask = ~(1 << row_id)
+        for field, value in zip(self.fields, row):
+            by_value = self._bits[field]
+            remaining = by_value[value] & mask
+            if remaining:
+                by_value[value] = remaining
+            else:
+                del by_value[value]
+        self._all &= mask
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bits = {field: {} for field in self.fields}
+            self._rows = {}
+            self._all = 0
+
+    def bitmap(self, field: str, values: Iterable[Hashable]) -> int:
+        by_value = self._bits[field]
+        bits = 0
+        for value in values:
+            bits |= by_value.get(value, 0)
+        return bits
+
+    def match(self, filters: Mapping[str, Optional[Sequence[Hashable]]]) -> int:
+        """빈 필터(None/빈 목록)는 조건 없음으로 취급"""
+        with self._lock:
+            bits = self._all
+            for field, values in filters.items():
+                if values:
+                    bits &= self.bitmap(field, values)
+                    if not bits:
+                        break
+            return bits
+
+    def counts(self, field: str, bits: Optional[int] = None) -> Dict[Hashable, int]:
+        """bits(기본: 전체)와 교집합 기준 field 값별 row 수 (popcount)"""
+        with self._lock:
+            if bits is None:
+                return {value: b.bit_count() for value, b in self._bits[field].items()}
+            return {value: (b & bits).bit_count() for value, b in self._bits[field].items() if b & bits}
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "rows": len(self._rows),
+                "max_id": self._all.bit_length() - 1 if self._all else None,
+                "cardinality": {field: len(by_value) for field, by_value in self._bits.items()},
+                "bitmap_bytes": sum(
+                    (b.bit_length() + 7) // 8 for by_value in self._bits.values() for b in by_value.values()
+                ),
+            }
@@ -0,0 +1,182 @@
+"""
+tracemalloc 기반 메모리 진단 (admin API에서 사용)
+- start/stop, snapshot 저장(프로세스 메모리에 최대 MAX_SNAPSHOTS개), top allocation, 두 snapshot diff
+- PeakTracker: 코드 블록의 peak 메모리 측정 (자동 매칭 로그용)
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+MAX_SNAPSHOTS = 10
+KEY_TYPES = ("lineno", "filename", "traceback")
+
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+_snapshots: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+_ids = itertools.count(1)
+_lock = threading.Lock()
+
+
+class SnapshotNotFound(KeyError):
+    pass
+
+
+def rss_bytes() -> Optional[int]:
+    """현재 프로세스 RSS (Linux /proc 기준, 그 외 플랫폼은 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def start(frames: int = 25) -> Dict[str, Any]:
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    return status()
+
+
+def stop() -> Dict[str, Any]:
+    """tracing 중지 (저장된 snapshot도 함께 삭제)"""
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    clear()
+    return status()
+
+
+def status() -> Dict[str, Any]:
+    tracing = tracemalloc.is_tracing()
+    current, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+    with _lock:
+        snapshots = [_meta(sid, item) for sid, item in _snapshots.items()]
+    return {
+        "tracing": tracing,
+        "frames": tracemalloc.get_traceback_limit() if tracing else None,
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory() if tracing else 0,
+        "rss_bytes": rss_bytes(),
+        "snapshots": snapshots,
+    }
+
+
+def _meta(snapshot_id: int, item: Dict[str, Any]) -> Dict[str, Any]:
+    return {"id": snapshot_id, "label": item["label"], "taken_at": item["taken_at"], "traced_bytes": item["traced_bytes"]}
+
+
+def take_snapshot(label: str = "") -> Dict[str, Any]:
+    if not tracemalloc.is_tracing():
+        raise RuntimeError("tracemalloc is not tracing")
+    snapshot = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+    item = {
+        "snapshot": snapshot,
+        "label": label,
+        "taken_at": time.time(),
+        "traced_bytes": tracemalloc.get_traced_memory()[0],
+    }
+    with _lock:
+        snapshot_id = next(_ids)
+        _snapshots[snapshot_id] = item
+        while len(_snapshots) > MAX_SNAPSHOTS:
+            _snapshots.popitem(last=False)
+    return _meta(snapshot_id, item)
+
+
+def _get(snapshot_id: int) -> tracemalloc.Snapshot:
+    with _lock:
+        item = _snapshots.get(snapshot_id)
+    if item is None:
+        raise SnapshotNotFound(snapshot_id)
+    return item["snapshot"]
+
+
+def _frames(traceback: tracemalloc.Traceback) -> List[str]:
+    return [f"{frame.filename}:{frame.lineno}" for frame in traceback]
+
+
+def top(snapshot_id: int, key_type: str = "lineno", limit: int = 20) -> List[Dict[str, Any]]:
+    stats = _get(snapshot_id).statistics(key_type)
+    return [
+        {"size_bytes": stat.size, "count": stat.count, "traceback": _frames(stat.traceback)}
+        for stat in stats[:limit]
+    ]
+
+
+def diff(base_id: int, target_id: int, key_type: str = "lineno", limit: int = 20) -> List[Dict[str, Any]]:
+    """target - base, 증가량이 큰 순서"""
+    stats = _get(target_id).compare_to(_get(base_id), key_type)
+    return [
+        {
+            "size_diff_bytes": stat.size_diff,
+            "size_bytes": stat.size,
+            "count_diff": stat.count_diff,
+            "count": stat.count,
+            "traceback": _frames(stat.traceback),
+        }
+        for stat in stats[:limit]
+    ]
+
+
+def clear() -> None:
+    with _lock:
+        _snapshots.clear()
+
+
+class PeakTracker:
+    """
+    start() ~ stop() 구간의 메모리 사용량 측정
+    - rss_delta_bytes: 구간 전후 RSS 차이 (항상)
+    - traced_peak_bytes: 시작 시점 대비 tracemalloc peak 증가량 (tracing 중일 때만)
+    tracemalloc peak는 프로세스 전역이므로 동시에 실행 중인 다른 요청의 할당도 포함될 수 있다.
+    """
+
+    def __init__(self) -> None:
+        self.tracing = False
+        self.rss_before: Optional[int] = None
+        self.traced_before = 0
+
+    def start(self) -> "PeakTracker":
+        self.tracing = tracemalloc.is_tracing()
+        self.rss_before = rss_bytes()
+        if self.tracing:
+            self.traced_before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        return self
+
+    def stop(self) -> Dict[str, Optional[int]]:
+        rss_after = rss_bytes()
+        result: Dict[str, Optional[int]] = {"rss_delta_bytes": None, "traced_peak_bytes": None}
+        if self.rss_before is not None and rss_after is not None:
+            result["rss_delta_bytes"] = rss_after - self.rss_before
+        if self.tracing and tracemalloc.is_tracing():
+            result["traced_peak_bytes"] = tracemalloc.get_traced_memory()[1] - self.traced_before
+        return result
+
+    def describe(self) -> str:
+        """로그용 한 줄 요약 (stop() 호출)"""
+        usage = self.stop()
+        return f"peak_mem={format_bytes(usage['traced_peak_bytes'])} rss_delta={format_bytes(usage['rss_delta_bytes'])}"
+
+
+def format_bytes(value: Optional[int]) -> str:
+    if value is None:
+        return "n/a"
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{sign}{value:.0f}{unit}" if unit == "B" else f"{sign}{value:.1f}{unit}"
+        value /= 1024
+    return f"{sign}{value:.1f}GiB"
@@ -0,0 +1,283 @@
+"""
+In-process metrics registry rendered in the Prometheus text exposition format (0.0.4).
+외부 클라이언트 라이브러리 없이 프로세스(uvicorn worker) 단위로 집계한다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        """exposition 형식의 sample 줄"""
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """
+    현재 값 게이지
+    - set()으로 직접 갱신하거나
+    - callback을 주면 렌더링 시점에 {label values: value}를 수집 (풀 상태처럼 조회가 싼 값)
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def samples(self) -> Iterable[str]:
+        if self._callback is not None:
+            values = self._callback()
+        else:
+            with self._lock:
+                values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class CounterFunc(Gauge):
+    """외부에서 누적되는 값(예: pool_metrics 카운터)을 렌더링 시점에 읽어 counter로 노출"""
+
+    kind = "counter"
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> ([count per bucket (non-cumulative) + overflow], sum, count)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0, 0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            item = self._values.get(self._key(labels))
+        return item[2] if item else 0
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted((key, (list(c), s, n)) for key, (c, s, n) in self._values.items())
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {count}"
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+registry = Registry()
+
+
+def _pool_gauge(field: str) -> Callable[[], Dict[LabelValues, float]]:
+    def collect() -> Dict[LabelValues, float]:
+        from app.db import pool_metrics
+
+        return {
+            (name,): float(stats[field])
+            for name, stats in pool_metrics.snapshot().items()
+            if field in stats
+        }
+
+    return collect
+
+
+# ------------------------------------------------------------
+# HTTP
+# ------------------------------------------------------------
+http_requests_total = registry.register(
+    Counter("fitconnect_http_requests_total", "HTTP requests by route template and status", ("method", "route", "status"))
+)
+http_request_duration_seconds = registry.register(
+    Histogram("fitconnect_http_request_duration_seconds", "HTTP request latency by route template", ("method", "route"))
+)
+errors_total = registry.register(
+    Counter("fitconnect_errors_total", "Error responses (4xx/5xx) by error code", ("code",))
+)
+
+# ------------------------------------------------------------
+# DB connection pool (per engine: primary, replica-N)
+# ------------------------------------------------------------
+for _field, _doc in (
+    ("size", "Configured pool size"),
+    ("checked_out", "Connections currently checked out"),
+    ("checked_in", "Idle connections in the pool"),
+    ("overflow", "Overflow connections currently open"),
+):
+    registry.register(Gauge(f"fitconnect_db_pool_{_field}", _doc, ("engine",), callback=_pool_gauge(_field)))
+
+for _field, _doc in (
+    ("checkouts", "Total connection checkouts"),
+    ("timeouts", "Total pool checkout timeouts"),
+    ("invalidations", "Total invalidated connections"),
+):
+    registry.register(CounterFunc(f"fitconnect_db_pool_{_field}_total", _doc, ("engine",), callback=_pool_gauge(_field)))
+
+# ------------------------------------------------------------
+# Matching
+# ------------------------------------------------------------
+auto_matching_duration_seconds = registry.register(
+    Histogram(
+        "fitconnect_auto_matching_duration_seconds",
+        "Duration of one auto-matching run",
+        ("role",),
+        buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+    )
+)
+auto_matching_pairs_per_second = registry.register(
+    Histogram(
+        "fitconnect_auto_matching_pairs_per_second",
+        "Scored pairs per second in one auto-matching run",
+        ("role",),
+        buckets=(10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 50000),
+    )
+)
+auto_matching_pairs_total = registry.register(
+    Counter("fitconnect_auto_matching_pairs_total", "Auto-matching pairs by outcome", ("role", "outcome"))
+)
+matching_result_upserts_total = registry.register(
+    Counter("fitconnect_matching_result_upserts_total", "matching_results writes by operation", ("operation",))
+)
+
+
+def count_error(code: str) -> None:
+    errors_total.inc(code=code)
+
+
+def observe_request(method: str, route: str, status: int, seconds: float) -> None:
+    http_requests_total.inc(method=method, route=route, status=str(status))
+    http_request_duration_seconds.observe(seconds, method=method, route=route)
+
+
+def observe_auto_matching(role: str, seconds: float, success: int, errors: int, filtered: int = 0) -> None:
+    pairs = success + errors
+    auto_matching_duration_seconds.observe(seconds, role=role)
+    if pairs and seconds > 0:
+        auto_matching_pairs_per_second.observe(pairs / seconds, role=role)
+    auto_matching_pairs_total.inc(success, role=role, outcome="success")
+    auto_matching_pairs_total.inc(errors, role=role, outcome="error")
+    if filtered:
+        auto_matching_pairs_total.inc(filtered, role=role, outcome="filtered")
+
+
+def render() -> str:
+    return registry.render()
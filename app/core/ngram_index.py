@@ -0,0 +1,197 @@
+"""
+In-process trigram inverted index (카드 텍스트 fuzzy 검색용)
+- 단어마다 앞 2칸/뒤 1칸 공백을 붙여 3글자 window → trigram (pg_trgm 방식, 한글은 음절 단위)
+- posting list: trigram → 정렬된 doc id 배열 (numpy int64)
+- 검색: 쿼리 trigram L개 중 T개 이상을 가진 문서 찾기 (T = ceil(min_similarity × L))
+  · 짧은 posting list L-T+1개만 합쳐 후보를 만들고 (T개 이상 가진 문서는 반드시 이 중 하나에 있음)
+  · 나머지 긴 list는 후보마다 searchsorted로 건너뛰며 포함 여부만 확인 (skip pointer 탐색을 벡터화)
+  · T = L 이면 가장 짧은 list 기준의 교집합과 같다
+- snapshot: posting list를 CSR(offsets + ids) 형태의 npz 한 파일로 저장/로드 (pickle 미사용)
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+import tempfile
+import threading
+import unicodedata
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_RE_WORD = re.compile(r"\w+")
+_EMPTY = np.empty(0, dtype=np.int64)
+SNAPSHOT_VERSION = 1
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    grams = set()
+    for word in _RE_WORD.findall(unicodedata.normalize("NFC", text).lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class NgramIndex:
+    def __init__(self) -> None:
+        self._postings: Dict[str, np.ndarray] = {}
+        self._docs: Dict[int, FrozenSet[str]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------
+
+    def _insert(self, doc_id: int, grams: Iterable[str]) -> None:
+        for gram in grams:
+            ids = self._postings.get(gram, _EMPTY)
+            pos = int(np.searchsorted(ids, doc_id))
+            self._postings[gram] = np.insert(ids, pos, doc_id)
+
+    def _delete(self, doc_id: int, grams: Iterable[str]) -> None:
+        for gram in grams:
+            ids = self._postings.get(gram)
+            if ids is None:
+                continue
+            pos = int(np.searchsorted(ids, doc_id))
+            if pos < len(ids) and ids[pos] == doc_id:
+                ids = np.delete(ids, pos)
+            if len(ids):
+                self._postings[gram] = ids
+            else:
+                del self._postings[gram]
+
+    def set(self, doc_id: int, text: str) -> None:
+        """문서 추가/갱신 (이전 trigram과의 차이만 반영, 빈 텍스트면 제거)"""
+        new = trigrams(text)
+        with self._lock:
+            old = self._docs.pop(doc_id, frozenset())
+            self._delete(doc_id, old - new)
+            self._insert(doc_id, new - old)
+            if new:
+                self._docs[doc_id] = new
+
+    def remove(self, doc_id: int) -> None:
+        self.set(doc_id, "")
+
+    def rebuild(self, docs: Iterable[Tuple[int, str]]) -> None:
+        """전체 재구성: trigram별 id를 모아 한 번에 정렬"""
+        doc_grams: Dict[int, FrozenSet[str]] = {}
+        buckets: Dict[str, List[int]] = {}
+        for doc_id, text in docs:
+            grams = trigrams(text)
+            if not grams:
+                continue
+            doc_grams[doc_id] = grams
+            for gram in grams:
+                buckets.setdefault(gram, []).append(doc_id)
+        postings = {gram: np.unique(np.asarray(ids, dtype=np.int64)) for gram, ids in buckets.items()}
+        with self._lock:
+            self._postings, self._docs = postings, doc_grams
+
+    # ------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 20, min_similarity: float = 0.5) -> List[Tuple[int, float]]:
+        """
+        (doc id, 유사도) 목록, 유사도 = 일치한 쿼리 trigram 비율
+        동점이면 trigram 수가 적은(짧은) 문서 → doc id 순
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        with self._lock:
+            lists = sorted((self._postings.get(gram, _EMPTY) for gram in grams), key=len)
+            total = len(lists)
+            need = max(1, math.ceil(min_similarity * total - 1e-9))
+            short, long = lists[: total - need + 1], lists[total - need + 1 :]
+            merged = np.concatenate(short) if short else _EMPTY
+            if not len(merged):
+                return []
+            candidates, counts = np.unique(merged, return_counts=True)
+            for ids in long:
+                if not len(ids):
+                    continue
+                pos = np.searchsorted(ids, candidates)
+                hit = pos < len(ids)
+                hit[hit] = ids[pos[hit]] == candidates[hit]
+                counts += hit
+            keep = counts >= need
+            candidates, counts = candidates[keep], counts[keep]
+            sizes = np.fromiter((len(self._docs[int(d)]) for d in candidates), dtype=np.int64, count=len(candidates))
+        order = np.lexsort((candidates, sizes, -counts))[:limit]
+        return [(int(candidates[i]), round(float(counts[i]) / total, 4)) for i in order]
+
+    # ------------------------------------------------------------
+    # snapshot
+    # ------------------------------------------------------------
+
+    def save(self, path: str, **meta: str) -> None:
+        """npz 한 파일로 저장 (임시 파일에 쓴 뒤 rename, 다른 워커가 읽는 중이어도 안전)"""
+        with self._lock:
+            grams = sorted(self._postings)
+            lengths = np.fromiter((len(self._postings[g]) for g in grams), dtype=np.int64, count=len(grams))
+            ids = np.concatenate([self._postings[g] for g in grams]) if grams else _EMPTY
+            doc_ids = np.fromiter(self._docs, dtype=np.int64, count=len(self._docs))
+            gram_no = {g: i for i, g in enumerate(grams)}
+            doc_lengths = np.fromiter((len(self._docs[int(d)]) for d in doc_ids), dtype=np.int64, count=len(doc_ids))
+            doc_grams = np.fromiter(
+                (gram_no[g] for d in doc_ids for g in self._docs[int(d)]), dtype=np.int64, count=int(doc_lengths.sum())
+            )
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    version=np.int64(SNAPSHOT_VERSION),
+                    grams=np.asarray(grams, dtype="<U3"),
+                    lengths=lengths,
+                    ids=ids,
+                    doc_ids=doc_ids,
+                    doc_lengths=doc_lengths,
+                    doc_grams=doc_grams,
+                    meta_keys=np.asarray(list(meta), dtype=str),
+                    meta_values=np.asarray(list(meta.values()), dtype=str),
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load(self, path: str) -> Optional[Dict[str, str]]:
+        """snapshot 로드 → 저장 시 meta (파일이 없거나 버전이 다르면 None, index는 그대로)"""
+        if not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != SNAPSHOT_VERSION:
+                return None
+            grams = data["grams"].tolist()
+            ids = data["ids"]
+            bounds = np.concatenate(([0], np.cumsum(data["lengths"])))
+            doc_bounds = np.concatenate(([0], np.cumsum(data["doc_lengths"])))
+            doc_grams = data["doc_grams"]
+            postings = {gram: ids[bounds[i] : bounds[i + 1]] for i, gram in enumerate(grams)}
+            docs = {
+                int(doc_id): frozenset(grams[g] for g in doc_grams[doc_bounds[i] : doc_bounds[i + 1]])
+                for i, doc_id in enumerate(data["doc_ids"])
+            }
+            meta = dict(zip(data["meta_keys"].tolist(), data["meta_values"].tolist()))
+        with self._lock:
+            self._postings, self._docs = postings, docs
+        return meta
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "docs": len(self._docs),
+                "trigrams": len(self._postings),
+                "postings": int(sum(len(ids) for ids in self._postings.values())),
+            }
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import logging
+import os
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Dict, List, Optional
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2]) + os.sep
+# 대기 중인 스레드(event loop select, threadpool queue 대기)의 샘플은 버린다
+_IDLE_MODULES = ("threading.py", "queue.py", "selectors.py")
+
+
+def _frame_label(frame: FrameType) -> str:
+    filename = frame.f_code.co_filename
+    if filename.startswith(_PROJECT_ROOT):
+        filename = filename[len(_PROJECT_ROOT):]
+    elif "site-packages" + os.sep in filename:
+        filename = filename.split("site-packages" + os.sep, 1)[1]
+    else:
+        filename = os.path.basename(filename)
+    return f"{frame.f_code.co_name} ({filename}:{frame.f_code.co_firstlineno})"
+
+
+def _is_idle(frame: FrameType) -> bool:
+    return frame.f_code.co_filename.endswith(_IDLE_MODULES)
+
+
+class StackSampler:
+    """
+    일정 간격으로 sys._current_frames()를 읽어 collapsed stack 카운트를 모으는 샘플러
+    - 대상 코드에 trace/profile hook을 걸지 않으므로 오버헤드는 샘플링 간격에만 비례
+    - 프로세스의 모든 스레드를 샘플링하므로 동시에 처리 중인 다른 요청의 stack이 섞일 수 있음
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter[str]:
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample_count += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own or _is_idle(frame):
+                    continue
+                stack: List[str] = []
+                current: Optional[FrameType] = frame
+                while current is not None:
+                    stack.append(_frame_label(current))
+                    current = current.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+
+def write_collapsed(path: Path, samples: Counter[str]) -> None:
+    """Brendan Gregg collapsed 형식 (flamegraph.pl / speedscope에서 바로 열 수 있음)"""
+    lines = [f"{stack} {count}" for stack, count in samples.most_common()]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def list_profiles(output_dir: str) -> List[Dict[str, object]]:
+    directory = Path(output_dir)
+    if not directory.is_dir():
+        return []
+    files = sorted(directory.glob("*.collapsed"), key=lambda p: p.stat().st_mtime, reverse=True)
+    return [{"name": p.name, "size": p.stat().st_size, "created_at": p.stat().st_mtime} for p in files]
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", value).strip("_")[:80] or "root"
+
+
+class SamplingProfilerMiddleware:
+    """
+    요청 단위 샘플링 프로파일러 (pure ASGI, PROFILER_ENABLED일 때만 등록)
+    - X-Profile: 1 + 올바른 X-Admin-Key 헤더가 있는 요청, 또는 sample_rate 확률로 선택된 요청만 프로파일링
+    - 동시에 1개 요청만 프로파일링 (나머지는 그대로 통과)
+    - 결과는 output_dir/<시각>-<method>-<route>.collapsed 로 저장, 응답 헤더 X-Profile-File에 파일명
+    """
+
+    def __init__(
+        self,
+        app,
+        output_dir: str,
+        interval_ms: float = 5.0,
+        sample_rate: float = 0.0,
+        admin_key: Optional[str] = None,
+        max_files: int = 200,
+    ) -> None:
+        self.app = app
+        self.output_dir = Path(output_dir)
+        self.interval = interval_ms / 1000.0
+        self.sample_rate = sample_rate
+        self.admin_key = admin_key
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def _requested(self, scope) -> bool:
+        if not self.admin_key:
+            return False
+        headers = dict(scope.get("headers") or [])
+        if headers.get(b"x-profile") not in (b"1", b"true"):
+            return False
+        key = headers.get(b"x-admin-key", b"").decode("latin-1")
+        return secrets.compare_digest(key, self.admin_key)
+
+    def _should_profile(self, scope) -> bool:
+        if self._requested(scope):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        if not self._lock.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        started = time.time()
+        stamp = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(started))}-{int(started * 1000) % 1000:03d}"
+        names: Dict[str, str] = {}
+
+        def profile_name() -> str:
+            # 라우팅이 끝난 뒤(scope["route"] 설정 후)에 route template으로 이름을 정한다
+            if "file" not in names:
+                route = getattr(scope.get("route"), "path", None) or scope.get("path", "")
+                names["file"] = f"{stamp}-{scope['method']}-{_slug(route)}.collapsed"
+            return names["file"]
+
+        async def send_with_profile(message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-file", profile_name().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = StackSampler(self.interval).start()
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            elapsed_ms = (time.time() - started) * 1000.0
+            try:
+                # sampler join(최대 interval) + 파일 쓰기는 event loop 밖에서
+                await anyio.to_thread.run_sync(self._finish, scope, profile_name(), sampler, elapsed_ms)
+            finally:
+                self._lock.release()
+
+    def _finish(self, scope, filename: str, sampler: StackSampler, elapsed_ms: float) -> None:
+        samples = sampler.stop()
+        try:
+            self._save(scope, filename, samples, elapsed_ms)
+        except OSError as e:
+            logger.warning(f"[Profiler] failed to write profile: {e}")
+
+    def _save(self, scope, filename: str, samples: Counter[str], elapsed_ms: float) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / filename
+        write_collapsed(path, samples)
+        logger.info(
+            f"[Profiler] {scope.get('method')} {scope.get('path')} {elapsed_ms:.1f}ms, "
+            f"{sum(samples.values())} samples → {path}"
+        )
+        self._prune()
+
+    def _prune(self) -> None:
+        files = sorted(self.output_dir.glob("*.collapsed"), key=lambda p: p.stat().st_mtime)
+        for old in files[: max(0, len(files) - self.max_files)]:
+            old.unlink(missing_ok=True)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core import metrics, serialization
+
+logger = logging.getLogger("app.request")
+
+# 에러 응답 body는 code만 읽으면 되므로 앞부분만 보관
+_ERROR_BODY_LIMIT = 16 * 1024
+
+
+class RequestStats:
+    """요청 1건의 처리 시간 + SQL 실행 통계"""
+
+    __slots__ = ("method", "path", "start", "query_count", "db_time_ms", "status_code")
+
+    def __init__(self, method: str, path: str) -> None:
+        self.method = method
+        self.path = path
+        self.start = time.perf_counter()
+        self.query_count = 0
+        self.db_time_ms = 0.0
+        self.status_code: Optional[int] = None
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.start) * 1000.0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    """현재 요청의 통계 객체 (요청 밖 — 스크립트, 백그라운드 작업 — 에서는 None)"""
+    return _current.get()
+
+
+def error_code(status: int, body: bytes) -> str:
+    """
+    에러 응답의 code: {"ok": false, "error": {"code": ...}} 또는 HTTPException의 {"detail": {"code": ...}}
+    code가 없는 응답(문자열 detail, 요청 검증 실패 등)은 HTTP_<status>
+    """
+    try:
+        data = serialization.loads(body)
+    except (TypeError, ValueError):
+        data = None
+    if isinstance(data, dict):
+        for key in ("error", "detail"):
+            value = data.get(key)
+            if isinstance(value, dict) and isinstance(value.get("code"), str):
+                return value["code"]
+    return f"HTTP_{status}"
+
+
+def route_template(scope: Dict[str, Any], default: Optional[str] = None) -> str:
+    """매칭된 라우트의 path template (예: /api/job-postings/{job_posting_id}), 매칭 실패 시 default 또는 원본 path"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or default or scope.get("path", "")
+
+
+# 같은 elapsed_ms를 받아 가는 다른 SQL 계측 (app.db.instrumentation의 slow query / N+1)
+# cursor 실행 타이머는 아래 리스너 한 쌍만 둔다
+SqlObserver = Callable[[str, Any, float], None]
+_observers: List[SqlObserver] = []
+
+
+def add_sql_observer(observer: SqlObserver) -> None:
+    """statement 실행이 끝날 때마다 observer(statement, parameters, elapsed_ms) 호출 (중복 등록 무시)"""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 시작 시각은 statement 단위 ExecutionContext에 둔다
+    # (conn.info는 풀링된 커넥션 수명 동안 남으므로, 실패해서 after가 불리지 않은 항목이 쌓인다)
+    if context is not None:
+        context.request_timing_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "request_timing_start", None)
+    if start is None:
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    stats = _current.get()
+    if stats is not None:
+        stats.query_count += 1
+        stats.db_time_ms += elapsed_ms
+    for observer in _observers:
+        observer(statement, parameters, elapsed_ms)
+
+
+def install_sql_listeners() -> None:
+    """모든 Engine의 cursor 실행에 통계 리스너 등록 (SessionLocal 직접 사용하는 서비스 포함)"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class RequestTimingMiddleware:
+    """
+    요청별 총 처리 시간, SQL 실행 횟수/누적 시간 측정 (pure ASGI middleware)
+    - 응답 헤더: Server-Timing: db;dur=..;desc="N queries", app;dur=..
+    - 로그: app.request 로거에 요청당 JSON 한 줄
+    - 메트릭: route template별 요청 수/지연 시간 히스토그램 (/metrics)
+      + 4xx/5xx 응답의 에러 code별 건수 (클라이언트가 실제로 받은 에러만, 응답 body의 code 기준)
+    """
+
+    def __init__(self, app, server_timing: bool = True, access_log: bool = True) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.access_log = access_log
+        install_sql_listeners()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope["method"], scope["path"])
+        token = _current.set(stats)
+        error_body = bytearray()
+
+        async def send_with_timing(message) -> None:
+            if message["type"] == "http.response.body" and (stats.status_code or 0) >= 400:
+                error_body.extend(message.get("body", b"")[: _ERROR_BODY_LIMIT - len(error_body)])
+            if message["type"] == "http.response.start":
+                stats.status_code = message["status"]
+            if message["type"] == "http.response.start" and self.server_timing:
+                app_ms = stats.elapsed_ms()
+                server_timing = (
+                    f'db;dur={stats.db_time_ms:.1f};desc="{stats.query_count} queries", '
+                    f"app;dur={app_ms:.1f}"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            status = stats.status_code or 500
+            if status >= 400:
+                metrics.count_error(error_code(status, bytes(error_body)))
+            # 매칭되지 않은 경로(404)는 label cardinality가 늘지 않도록 하나로 묶는다
+            metrics.observe_request(
+                stats.method,
+                route_template(scope, default="<unmatched>"),
+                status,
+                stats.elapsed_ms() / 1000.0,
+            )
+            if self.access_log:
+                self._log(scope, stats)
+
+    @staticmethod
+    def _log(scope, stats: RequestStats) -> None:
+        logger.info(
+            serialization.dumps(
+                {
+                    "event": "request",
+                    "method": stats.method,
+                    "path": stats.path,
+                    "route": route_template(scope),
+                    "status": stats.status_code or 500,
+                    "duration_ms": round(stats.elapsed_ms(), 2),
+                    "db_queries": stats.query_count,
+                    "db_time_ms": round(stats.db_time_ms, 2),
+                }
+            )
+        )
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.core import serialization
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson 기반 JSON 응답 (app 기본 response class)
+    - datetime/date → ISO 8601, Decimal → float 을 직접 처리
+    - 라우트에서 dict를 그대로 감싸 반환하면 jsonable_encoder 단계를 건너뜀
+    """
+
+    def render(self, content: Any) -> bytes:
+        return serialization.dumps_bytes(content)
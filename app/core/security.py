@@ -1,5 +1,8 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from jose import jwt
 from passlib.context import CryptContext
@@ -7,15 +10,129 @@ from passlib.context import CryptContext
 from app.core.settings import settings
 
 
-pwd_context = CryptContext(schemes=["bcrypt_sha256"], deprecated="auto")
+# min_rounds = default_rounds: cost factor를 올리면 기존 해시가 needs_update 대상이 됨
+pwd_context = CryptContext(
+    schemes=["bcrypt_sha256"],
+    deprecated="auto",
+    bcrypt_sha256__default_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    bcrypt_sha256__min_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+)
+
+
+class PasswordHasherBusy(Exception):
+    """비밀번호 해싱 executor가 포화 상태 (호출 측에서 503으로 변환)"""
+
+
+class BoundedHashExecutor:
+    """
+    bcrypt 전용 스레드 풀
+    - 동시에 실행 중 + 대기 중인 작업을 workers + max_queue 개로 제한
+    - 한도를 넘으면 기다리지 않고 PasswordHasherBusy를 즉시 발생
+    - async 라우트는 run_async로 await → 해싱을 기다리는 동안 Starlette 공용 threadpool을 점유하지 않음
+    - run(동기)은 스크립트용
+    """
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def _acquire(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy("password hashing executor is saturated")
+        with self._lock:
+            self._pending += 1
+
+    def _release(self, ok: bool) -> None:
+        with self._lock:
+            self._pending -= 1
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+        self._slots.release()
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+        ok = False
+        try:
+            result = self._executor.submit(self._call, fn, *args).result()
+            ok = True
+            return result
+        finally:
+            self._release(ok)
+
+    async def run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+        ok = False
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, self._call, fn, *args)
+            ok = True
+            return result
+        finally:
+            self._release(ok)
+
+    def _call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queue_depth": max(self._pending - self._running, 0),
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+            }
+
+
+hash_executor = BoundedHashExecutor(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return hash_executor.run(pwd_context.hash, password)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+    return hash_executor.run(pwd_context.verify, plain, hashed)
+
+
+async def hash_password_async(password: str) -> str:
+    return await hash_executor.run_async(pwd_context.hash, password)
+
+
+async def verify_and_update_password_async(plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password의 async 버전 (로그인 라우트용)"""
+    return await hash_executor.run_async(pwd_context.verify_and_update, plain, hashed)
+
+
+def verify_and_update_password(plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 + 필요 시 재해싱 (passlib needs_update)
+    - 반환: (검증 결과, 새 해시 또는 None)
+    - cost factor/스킴 변경 시 다음 로그인에서 자동으로 새 해시로 교체
+    """
+    return hash_executor.run(pwd_context.verify_and_update, plain, hashed)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -26,4 +143,3 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALG)
     return encoded_jwt
-
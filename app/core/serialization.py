@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - fallback when orjson is not installed
+    orjson = None
+    HAS_ORJSON = False
+
+
+def _default(value: Any) -> Any:
+    """orjson/json이 직접 처리하지 못하는 타입 변환 (DECIMAL 점수 컬럼 등)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if hasattr(value, "tolist"):  # numpy scalars / arrays
+        return value.tolist()
+    if not HAS_ORJSON and isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if HAS_ORJSON:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps_bytes(value: Any) -> bytes:
+        return orjson.dumps(value, default=_default, option=_OPTIONS)
+
+    def loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+else:  # pragma: no cover
+
+    def dumps_bytes(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+    def loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+
+def dumps(value: Any) -> str:
+    return dumps_bytes(value).decode("utf-8")
+
+
+__all__ = ["HAS_ORJSON", "dumps", "dumps_bytes", "loads"]
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -9,6 +11,13 @@ class Settings(BaseSettings):
     JWT_SECRET: str
     JWT_ALG: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 120
+    TOKEN_CACHE_SIZE: int = 10000  # 검증된 토큰 캐시 최대 항목 수 (0이면 비활성화)
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 5.0  # 다른 워커의 logout/revoke를 revoked_tokens에서 읽어 오는 간격
+
+    # bcrypt 전용 executor: 동시 해싱 수 / 대기열 한도 (초과 시 503)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 16
+    PASSWORD_BCRYPT_ROUNDS: int = 12  # 올리면 기존 해시는 다음 로그인 시 재해싱
 
     DB_HOST: str
     DB_PORT: int = 3306
@@ -16,6 +25,71 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     DB_NAME: str
 
+    # Connection pool (per uvicorn worker: pool_size + max_overflow connections at most)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds, keep below MySQL wait_timeout
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_PRE_PING: bool = True
+
+    # Optional read replicas: comma-separated SQLAlchemy URLs. GET 요청은 replica로 라운드로빈
+    DB_REPLICA_URLS: str = ""
+    DB_REPLICA_HEALTH_CHECK_INTERVAL: float = 10.0  # seconds between replica pings
+    DB_REPLICA_CONNECT_TIMEOUT: int = 2  # seconds, replica 연결 시도 제한 (health check / 요청 공통)
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0  # 쓰기 직후 해당 사용자의 읽기를 primary로 고정하는 시간
+
+    # 요청별 Server-Timing 헤더 + app.request 구조화 로그 (SQL 실행 횟수/누적 시간 포함)
+    REQUEST_TIMING_ENABLED: bool = True
+    METRICS_ENABLED: bool = True  # GET /metrics (Prometheus text format, worker 단위 집계)
+
+    # Opt-in SQL instrumentation (app/db/instrumentation.py), 0이면 비활성화
+    DB_SLOW_QUERY_MS: float = 0  # 이 시간 이상 걸린 statement를 app.db.slow 로거에 기록
+    DB_N_PLUS_ONE_THRESHOLD: int = 0  # 한 요청에서 같은 SQL이 이 횟수를 초과하면 경고
+    DB_N_PLUS_ONE_RAISE: bool = False  # true(또는 APP_ENV=test)면 경고 대신 NPlusOneDetected 발생
+
+    # 요청 단위 sampling profiler (app/core/profiler.py), 비활성화 시 미들웨어 자체를 등록하지 않음
+    PROFILER_ENABLED: bool = False
+    PROFILER_SAMPLE_RATE: float = 0.0  # 0~1, 무작위로 프로파일링할 요청 비율 (X-Profile 헤더 요청은 항상)
+    PROFILER_INTERVAL_MS: float = 5.0
+    PROFILER_OUTPUT_DIR: str = "profiles"
+    PROFILER_MAX_FILES: int = 200
+
+    # 채용공고 enum 속성 bitmap index (워커 단위, 검색 후보 축소용)
+    JOB_POSTING_INDEX_ENABLED: bool = True
+    JOB_POSTING_INDEX_REFRESH_SECONDS: float = 30.0  # 다른 워커의 변경을 updated_at 기준으로 가져오는 주기
+    JOB_POSTING_INDEX_MAX_IN: int = 1000  # 후보가 이 수 이하일 때만 SQL에 id IN (...)으로 넘긴다
+    # 공고 검색 facet 집계 캐시 (같은 검색 조건이면 TTL 동안 재사용)
+    JOB_POSTING_FACETS_CACHE_TTL_SECONDS: float = 30.0
+    JOB_POSTING_FACETS_CACHE_SIZE: int = 512
+
+    # 자동완성 prefix index (워커 단위): 다른 워커의 변경을 updated_at 기준으로 가져오는 주기
+    AUTOCOMPLETE_REFRESH_SECONDS: float = 60.0
+
+    # 카드 텍스트 trigram index: snapshot 디렉터리 (빈 값이면 저장 안 하고 매번 DB에서 build)
+    CARD_INDEX_SNAPSHOT_DIR: str = ""
+    CARD_INDEX_REFRESH_SECONDS: float = 60.0
+
+    # 카드 텍스트 → 매칭 벡터 파이프라인 (scripts/vectorize_cards.py)
+    EMBEDDING_ENCODER: str = "hashing"  # 또는 "package.module:ClassName" (dims 인자로 생성)
+    EMBEDDING_DIMS: int = 256
+    EMBEDDING_BATCH_SIZE: int = 500
+    EMBEDDING_WORKERS: int = 1  # 2 이상이면 process pool에서 encode
+
+    # 자동 매칭 hard constraint: 인재 희망 조건과 맞지 않는 공고는 점수 계산/저장 안 함 (빈 값이면 비활성화)
+    # 사용 가능: location,salary,company_size,industry
+    MATCHING_HARD_CONSTRAINTS: str = ""
+
+    # 기업용 인재 검색: 후보를 청크 단위로 점수 계산, 시간 예산을 넘기면 partial 응답
+    TALENT_SEARCH_BUDGET_MS: float = 500.0
+    TALENT_SEARCH_CHUNK_SIZE: int = 2000
+
+    # Admin API (/api/admin/*) is disabled unless a key is configured
+    ADMIN_API_KEY: Optional[str] = None
+
+    @property
+    def replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.DB_REPLICA_URLS.split(",") if url.strip()]
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,108 @@
+"""
+sparse 벡터 ({"indices": [...], "values": [...], "dim": N})
+- 스킬처럼 차원은 크고(수천) 값이 있는 칸은 몇 개뿐인 필드용, 0이 아닌 값만 저장
+- 저장 형식: indices 오름차순 · 중복 없음 · 0 값 제거 (normalize)
+- 내적: sparse-sparse는 정렬된 index 병합, sparse-dense는 index로 gather → 비용이 차원이 아닌 nnz에 비례
+- CSR: 여러 sparse 벡터를 (indptr, indices, values)로 묶어 dense 쿼리와 numpy로 한 번에 내적
+"""
+
+from __future__ import annotations
+
+from math import sqrt
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+
+class SparseVector(NamedTuple):
+    indices: List[int]
+    values: List[float]
+    dim: int
+
+
+Vector = Union[SparseVector, List[float]]
+
+
+def is_sparse(raw: Any) -> bool:
+    return isinstance(raw, dict) and "indices" in raw
+
+
+def normalize(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """입력 검증 + 저장 형식으로 정리 (그 외 키는 유지), 잘못된 입력은 ValueError"""
+    indices, values, dim = raw.get("indices"), raw.get("values"), raw.get("dim")
+    if not isinstance(indices, list) or not isinstance(values, list):
+        raise ValueError("sparse vector needs 'indices' and 'values' lists")
+    if len(indices) != len(values):
+        raise ValueError("'indices' and 'values' must have the same length")
+    if isinstance(dim, bool) or not isinstance(dim, int) or dim <= 0:
+        raise ValueError("sparse vector needs a positive integer 'dim'")
+    try:
+        pairs = sorted((int(i), float(v)) for i, v in zip(indices, values))
+    except (TypeError, ValueError):
+        raise ValueError("'indices' must be integers and 'values' numbers") from None
+    if pairs and (pairs[0][0] < 0 or pairs[-1][0] >= dim):
+        raise ValueError(f"indices must be in [0, {dim})")
+    if any(a[0] == b[0] for a, b in zip(pairs, pairs[1:])):
+        raise ValueError("duplicate indices")
+    pairs = [(i, v) for i, v in pairs if v != 0.0]
+    return {**raw, "indices": [i for i, _ in pairs], "values": [v for _, v in pairs], "dim": dim}
+
+
+def from_raw(raw: Dict[str, Any]) -> SparseVector:
+    data = normalize(raw)
+    return SparseVector(data["indices"], data["values"], data["dim"])
+
+
+def dim(vector: Vector) -> int:
+    return vector.dim if isinstance(vector, SparseVector) else len(vector)
+
+
+def norm(vector: Vector) -> float:
+    values = vector.values if isinstance(vector, SparseVector) else vector
+    return sqrt(sum(x * x for x in values))
+
+
+def dot(a: Vector, b: Vector) -> float:
+    """같은 차원이라고 가정"""
+    if isinstance(a, SparseVector) and isinstance(b, SparseVector):
+        # 정렬된 index 병합
+        total, i, j = 0.0, 0, 0
+        while i < len(a.indices) and j < len(b.indices):
+            if a.indices[i] == b.indices[j]:
+                total += a.values[i] * b.values[j]
+                i += 1
+                j += 1
+            elif a.indices[i] < b.indices[j]:
+                i += 1
+            else:
+                j += 1
+        return total
+    if isinstance(b, SparseVector):
+        a, b = b, a
+    if isinstance(a, SparseVector):
+        return sum(v * b[i] for i, v in zip(a.indices, a.values))
+    return sum(x * y for x, y in zip(a, b))
+
+
+def to_dense(vector: SparseVector) -> np.ndarray:
+    out = np.zeros(vector.dim, dtype=np.float64)
+    out[vector.indices] = vector.values
+    return out
+
+
+class CSR:
+    """sparse 벡터 n개 (None은 빈 행) → CSR, dense 쿼리와의 내적 / 행 norm"""
+
+    def __init__(self, vectors: Sequence[Optional[SparseVector]]) -> None:
+        lengths = np.fromiter((len(v.indices) if v else 0 for v in vectors), dtype=np.int64, count=len(vectors))
+        self.n = len(vectors)
+        self.indptr = np.concatenate(([0], np.cumsum(lengths)))
+        self.indices = np.fromiter((i for v in vectors if v for i in v.indices), dtype=np.int64, count=int(self.indptr[-1]))
+        self.values = np.fromiter((x for v in vectors if v for x in v.values), dtype=np.float64, count=int(self.indptr[-1]))
+        self._rows = np.repeat(np.arange(self.n), lengths)
+
+    def dot(self, query: np.ndarray) -> np.ndarray:
+        return np.bincount(self._rows, weights=self.values * query[self.indices], minlength=self.n)
+
+    def norms(self) -> np.ndarray:
+        return np.sqrt(np.bincount(self._rows, weights=self.values * self.values, minlength=self.n))
@@ -0,0 +1,74 @@
+"""
+텍스트 → 고정 차원 벡터 encoder
+- TextEncoder: name / dims / encode(texts) → float32 (n, dims), 행마다 L2 정규화 (빈 텍스트는 영벡터)
+- HashingEncoder: 외부 모델/네트워크 없이 동작하는 기본 encoder
+  · 단어 unigram + 인접 단어 bigram + 단어별 문자 trigram(한글 조사/어미 변형 흡수)을 feature로 사용
+  · feature는 crc32로 차원에 매핑하고 부호 hash로 충돌 편향 상쇄 (프로세스/워커가 달라도 같은 결과)
+  · 가중치는 sublinear TF (1 + log tf), 코퍼스 IDF는 쓰지 않는다 (카드가 추가될 때마다 기존 벡터가 바뀌지 않도록)
+- EMBEDDING_ENCODER에 "module:attr" 를 주면 (dims를 받는) 다른 encoder 구현으로 교체
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+import re
+import unicodedata
+import zlib
+from collections import Counter
+from typing import List, Protocol, Sequence
+
+import numpy as np
+
+_RE_WORD = re.compile(r"\w+")
+
+
+class TextEncoder(Protocol):
+    name: str
+    dims: int
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray: ...
+
+
+def features(text: str) -> List[str]:
+    words = _RE_WORD.findall(unicodedata.normalize("NFC", text).lower())
+    feats = [f"w:{w}" for w in words]
+    feats += [f"b:{a} {b}" for a, b in zip(words, words[1:])]
+    for word in words:
+        padded = f"<{word}>"
+        feats += [f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+    return feats
+
+
+class HashingEncoder:
+    """feature hashing + sublinear TF + L2 정규화"""
+
+    def __init__(self, dims: int = 256) -> None:
+        if dims <= 0:
+            raise ValueError("dims must be positive")
+        self.dims = dims
+        self.name = f"hashing-v1-{dims}"
+
+    def _hash(self, feature: str) -> tuple[int, float]:
+        h = zlib.crc32(feature.encode("utf-8"))
+        return h % self.dims, (1.0 if (h >> 31) & 1 else -1.0)
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dims), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, tf in Counter(features(text or "")).items():
+                col, sign = self._hash(feature)
+                out[row, col] += sign * (1.0 + math.log(tf))
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        np.divide(out, norms, out=out, where=norms > 0)
+        return out
+
+
+def get_encoder(spec: str = "hashing", dims: int = 256) -> TextEncoder:
+    """'hashing' 또는 'package.module:ClassName' (dims 인자로 생성)"""
+    if spec == "hashing":
+        return HashingEncoder(dims)
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"unknown encoder {spec!r} (use 'hashing' or 'module:attr')")
+    return getattr(importlib.import_module(module_name), attr)(dims=dims)
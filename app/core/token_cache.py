@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.core.cache import TTLCache
+from app.core.settings import settings
+
+
+class VerifiedTokenCache:
+    """
+    검증이 끝난 JWT의 디코딩 결과({"id", "role"}) 캐시
+    - key: 토큰의 SHA-256 digest (원문 토큰은 저장하지 않음)
+    - 각 항목은 토큰의 exp 시각에 만료되므로 캐시가 토큰 유효기간을 늘리지 않음
+    - logout/revoke된 토큰은 캐시에서 제거하고 exp까지 revocation list에 보관
+
+    revocation list는 프로세스(uvicorn worker) 단위이므로, 다른 워커의 revoke는
+    revoked_token_repo가 revoked_tokens 테이블에서 주기적으로 읽어 revoke_digest()로 반영한다.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._cache = TTLCache(maxsize=maxsize)
+        self._revoked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        return self._cache.get(self.digest(token))
+
+    def put(self, token: str, user: Dict[str, Any], exp: Any) -> None:
+        try:
+            expires_at = float(exp)
+        except (TypeError, ValueError):
+            return
+        key = self.digest(token)
+        if self._is_revoked(key):
+            return
+        self._cache.set(key, user, expires_at=expires_at)
+
+    def revoke(self, token: str, exp: Optional[float] = None) -> None:
+        expires_at = float(exp) if exp is not None else time.time() + settings.JWT_EXPIRE_MINUTES * 60
+        self.revoke_digest(self.digest(token), expires_at)
+
+    def revoke_digest(self, key: str, expires_at: float) -> None:
+        with self._lock:
+            self._prune_revoked()
+            self._revoked[key] = expires_at
+        self._cache.pop(key)
+
+    def is_revoked(self, token: str) -> bool:
+        return self._is_revoked(self.digest(token))
+
+    def _is_revoked(self, key: str) -> bool:
+        with self._lock:
+            expires_at = self._revoked.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                del self._revoked[key]
+                return False
+            return True
+
+    def _prune_revoked(self) -> None:
+        now = time.time()
+        for key in [k for k, exp in self._revoked.items() if exp <= now]:
+            del self._revoked[key]
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            revoked = len(self._revoked)
+        return {**self._cache.stats(), "revoked": revoked}
+
+
+token_cache = VerifiedTokenCache(maxsize=settings.TOKEN_CACHE_SIZE)
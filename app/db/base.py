@@ -1,6 +1,13 @@
+from sqlalchemy import BigInteger
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
     pass
 
+
+@compiles(BigInteger, "sqlite")
+def _compile_bigint_sqlite(type_, compiler, **kw):
+    # SQLite는 "INTEGER PRIMARY KEY"만 rowid autoincrement로 취급한다 (테스트/벤치마크용 SQLite DB)
+    return "INTEGER"
@@ -0,0 +1,107 @@
+"""
+워커 프로세스 단위 in-memory index 공통 동기화 (autocomplete_index / card_index / job_posting_index)
+- PendingWrites: 쓰기 경로의 track() 값을 세션에 모아 두고 commit 시 반영, rollback 시 폐기
+  (Session after_commit / after_rollback listener는 이 모듈에서 한 번만 등록)
+- Refresher: 마지막 refresh 후 interval이 지났으면 백그라운드 스레드에서 refresh 실행
+  (한 번에 하나만, 호출한 요청은 기다리지 않고 현재 index를 사용)
+- changed_since(): updated_at watermark 기준 증분 조회 조건
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# updated_at은 statement 시작 시각이라 늦게 commit된 트랜잭션은 watermark보다 과거 값을 가질 수 있다
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+_pending: Dict[str, "PendingWrites"] = {}
+
+
+def changed_since(stmt, column, watermark: Optional[datetime]):
+    """watermark 이후 바뀐 행 조건 (이미 반영된 행을 다시 읽어도 결과는 같으므로 넉넉히 겹쳐서 읽는다)"""
+    return stmt if watermark is None else stmt.where(column >= watermark - REFRESH_OVERLAP)
+
+
+def later(current: Optional[datetime], value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return current
+    return value if current is None or value > current else current
+
+
+class PendingWrites:
+    """세션별 변경 기록: add(db, key, value) → commit 시 apply({key: value}), rollback 시 폐기"""
+
+    def __init__(self, name: str, apply: Callable[[Dict[Hashable, Any]], None]) -> None:
+        self.info_key = f"{name}_pending"
+        self._apply = apply
+        _pending[self.info_key] = self
+
+    def add(self, db: Session, key: Hashable, value: Any) -> None:
+        db.info.setdefault(self.info_key, {})[key] = value
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    for info_key, writes in _pending.items():
+        pending = session.info.pop(info_key, None)
+        if pending:
+            writes._apply(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    for info_key in _pending:
+        session.info.pop(info_key, None)
+
+
+class Refresher:
+    """
+    refresh(db)를 interval()초마다 최대 한 번, 백그라운드 스레드에서 실행
+    - build 등 index 전체를 바꾸는 작업도 lock을 잡아 refresh와 겹치지 않게 한다
+    """
+
+    def __init__(self, name: str, refresh: Callable[[Session], None], interval: Callable[[], float]) -> None:
+        self.name = name
+        self.lock = threading.Lock()
+        self.refreshed_at = 0.0
+        self._refresh = refresh
+        self._interval = interval
+
+    def mark(self) -> None:
+        self.refreshed_at = time.time()
+
+    def refresh_if_stale(self) -> Optional[threading.Thread]:
+        """interval이 지났고 다른 refresh가 없으면 스레드 시작 → 시작한 스레드"""
+        if time.time() - self.refreshed_at < self._interval():
+            return None
+        if not self.lock.acquire(blocking=False):
+            return None  # 다른 요청이 refresh 중
+        thread = threading.Thread(target=self._run, name=f"{self.name}-refresh", daemon=True)
+        try:
+            thread.start()
+        except Exception:
+            self.lock.release()
+            raise
+        return thread
+
+    def _run(self) -> None:
+        try:
+            with SessionLocal() as db:
+                self._refresh(db)
+        except Exception as e:
+            logger.warning(f"[{self.name}] refresh failed: {e}")
+        finally:
+            # 실패해도 다음 시도는 interval 뒤로 (DB 장애 시 요청마다 스레드를 띄우지 않음)
+            self.mark()
+            self.lock.release()
@@ -0,0 +1,245 @@
+"""
+Opt-in SQL instrumentation
+- slow query log: DB_SLOW_QUERY_MS 보다 오래 걸린 statement를 파라미터/route와 함께 기록
+- N+1 detector: 한 요청(또는 watch() 블록) 안에서 같은 정규화 SQL이
+  DB_N_PLUS_ONE_THRESHOLD 회를 초과해 실행되면 경고, 테스트 모드에서는 예외
+
+설정이 꺼져 있으면 리스너/미들웨어 자체를 등록하지 않으므로 오버헤드가 없다.
+statement 실행 시간은 request_timing의 cursor 리스너가 한 번만 재고, 여기서는 observer로 받아 쓴다.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core import request_timing
+from app.core.settings import settings
+
+slow_logger = logging.getLogger("app.db.slow")
+n_plus_one_logger = logging.getLogger("app.db.n_plus_one")
+
+_PARAMS_PREVIEW_CHARS = 500
+
+_RE_IN_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))*\s*\)")
+_RE_STRING = re.compile(r"'(?:[^']|'')*'")
+_RE_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_RE_SPACE = re.compile(r"\s+")
+
+
+class NPlusOneDetected(AssertionError):
+    """같은 SQL이 한 요청 안에서 임계값 이상 반복 실행됨 (테스트 모드에서만 발생)"""
+
+
+def normalize_sql(statement: str) -> str:
+    """리터럴/바인드 파라미터/IN 목록 길이 차이를 지워서 같은 쿼리 모양끼리 묶는다"""
+    sql = _RE_STRING.sub("?", statement)
+    sql = _RE_NUMBER.sub("?", sql)
+    sql = _RE_IN_LIST.sub("(?)", sql)
+    return _RE_SPACE.sub(" ", sql).strip()
+
+
+class QueryWatch:
+    """한 요청(또는 테스트 블록) 동안 정규화 SQL별 실행 횟수"""
+
+    def __init__(self, label: str, threshold: int) -> None:
+        self.label = label
+        self.threshold = threshold
+        self.counts: Dict[str, int] = {}
+        self.scope: Optional[Dict[str, Any]] = None
+
+    def record(self, statement: str) -> None:
+        key = normalize_sql(statement)
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def route(self) -> str:
+        if self.scope is not None:
+            route = self.scope.get("route")
+            path = getattr(route, "path", None)
+            if path:
+                return f"{self.scope.get('method', '')} {path}".strip()
+        return self.label
+
+    def violations(self) -> List[Dict[str, Any]]:
+        if self.threshold <= 0:
+            return []
+        return [
+            {"count": count, "statement": sql}
+            for sql, count in sorted(self.counts.items(), key=lambda kv: -kv[1])
+            if count > self.threshold
+        ]
+
+
+_current: ContextVar[Optional[QueryWatch]] = ContextVar("query_watch", default=None)
+
+
+def _raise_enabled() -> bool:
+    return settings.DB_N_PLUS_ONE_RAISE or settings.APP_ENV == "test"
+
+
+@contextmanager
+def watch(
+    label: str = "",
+    threshold: Optional[int] = None,
+    raise_on_violation: Optional[bool] = None,
+) -> Iterator[QueryWatch]:
+    """
+    블록 안에서 실행된 SQL을 모아 N+1 패턴을 검사
+        with instrumentation.watch("auto-matching", threshold=5, raise_on_violation=True):
+            ...
+    """
+    install()
+    current = QueryWatch(label, settings.DB_N_PLUS_ONE_THRESHOLD if threshold is None else threshold)
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException:
+        # 원래 예외를 가리지 않도록 로그만 남긴다
+        _current.reset(token)
+        report(current, raise_on_violation=False)
+        raise
+    _current.reset(token)
+    report(current, _raise_enabled() if raise_on_violation is None else raise_on_violation)
+
+
+def report(current: QueryWatch, raise_on_violation: bool) -> None:
+    violations = current.violations()
+    if not violations:
+        return
+    route = current.route()
+    for item in violations:
+        n_plus_one_logger.warning(
+            f"[N+1] {route}: {item['count']}x (threshold {current.threshold}) {item['statement'][:300]}"
+        )
+    if raise_on_violation:
+        worst = violations[0]
+        raise NPlusOneDetected(
+            f"{route}: statement executed {worst['count']} times (threshold {current.threshold}): "
+            f"{worst['statement'][:300]}"
+        )
+
+
+def _observe(statement: str, parameters: Any, elapsed_ms: float) -> None:
+    current = _current.get()
+    if current is not None:
+        current.record(statement)
+
+    slow_ms = settings.DB_SLOW_QUERY_MS
+    if slow_ms and elapsed_ms >= slow_ms:
+        params = repr(parameters)
+        if len(params) > _PARAMS_PREVIEW_CHARS:
+            params = params[:_PARAMS_PREVIEW_CHARS] + "..."
+        route = current.route() if current is not None else "-"
+        slow_logger.warning(
+            f"[Slow Query] {elapsed_ms:.1f}ms route={route} "
+            f"sql={_RE_SPACE.sub(' ', statement).strip()} params={params}"
+        )
+
+
+class QueryCounter:
+    """count_queries() 블록에서 실행된 statement 목록"""
+
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def by_statement(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for statement in self.statements:
+            key = normalize_sql(statement)
+            counts[key] = counts.get(key, 0) + 1
+        return dict(sorted(counts.items(), key=lambda kv: -kv[1]))
+
+    def report(self) -> str:
+        return "\n".join(f"  {count}x {sql[:200]}" for sql, count in self.by_statement().items())
+
+
+@contextmanager
+def count_queries(bind: Any = Engine) -> Iterator[QueryCounter]:
+    """
+    블록 안에서 bind(기본: 모든 Engine)로 실행된 SQL 수 집계
+    contextvar가 아니라 엔진 이벤트로 세므로 TestClient처럼 다른 스레드에서 실행된 쿼리도 포함된다.
+        with count_queries(engine) as counter:
+            client.get("/api/job-postings/1")
+        assert counter.count <= 2, counter.report()
+    """
+    counter = QueryCounter()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        counter.statements.append(statement)
+
+    event.listen(bind, "after_cursor_execute", _record)
+    try:
+        yield counter
+    finally:
+        event.remove(bind, "after_cursor_execute", _record)
+
+
+def install() -> None:
+    """모든 Engine의 공용 cursor 리스너에 slow query / N+1 observer 등록 (중복 등록 방지)"""
+    request_timing.install_sql_listeners()
+    request_timing.add_sql_observer(_observe)
+
+
+def enabled() -> bool:
+    return bool(settings.DB_SLOW_QUERY_MS) or settings.DB_N_PLUS_ONE_THRESHOLD > 0
+
+
+class QueryWatchMiddleware:
+    """
+    요청마다 watch 범위를 열어 N+1 검사 + slow query 로그에 route를 붙인다 (pure ASGI)
+    - http.response.start를 잡아 두었다가 첫 body를 보내기 직전에 검사 → 예외 모드에서 위반이면
+      응답이 시작되기 전에 NPlusOneDetected가 올라가 바깥 error 미들웨어가 500을 보낼 수 있다
+    - 응답 시작 후(스트리밍 body, background task)에 실행된 SQL은 로그만 남긴다
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+        install()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        current = QueryWatch(f"{scope['method']} {scope['path']}", settings.DB_N_PLUS_ONE_THRESHOLD)
+        # router가 같은 scope dict에 matched route를 기록하므로 참조만 들고 있는다
+        current.scope = scope
+        held: Optional[Dict[str, Any]] = None
+        checked: Optional[Dict[str, int]] = None
+
+        async def send_wrapper(message) -> None:
+            nonlocal held, checked
+            if message["type"] == "http.response.start":
+                held = message
+                return
+            if held is not None:
+                start, held = held, None
+                checked = dict(current.counts)
+                report(current, _raise_enabled())
+                await send(start)
+            await send(message)
+
+        token = _current.set(current)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException:
+            _current.reset(token)
+            if checked is None:
+                # 원래 예외를 가리지 않도록 로그만 남긴다
+                report(current, raise_on_violation=False)
+            raise
+        _current.reset(token)
+        if checked is None:
+            report(current, _raise_enabled())
+        elif current.counts != checked:
+            report(current, raise_on_violation=False)
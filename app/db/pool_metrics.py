@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolStats:
+    """
+    커넥션 풀 이벤트에서 수집한 누적 통계 (엔진 1개당 1개)
+    - connects/checkouts/checkins/invalidations: 풀 이벤트 카운트
+    - wait_*: 커넥션 획득까지 걸린 시간 (TimedQueuePool에서 측정)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def record_wait(self, elapsed_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_ms += elapsed_ms
+            if elapsed_ms > self.wait_max_ms:
+                self.wait_max_ms = elapsed_ms
+            if timed_out:
+                self.timeouts += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            avg = self.wait_total_ms / self.wait_count if self.wait_count else 0.0
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_count": self.wait_count,
+                "wait_avg_ms": round(avg, 3),
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "wait_total_ms": round(self.wait_total_ms, 3),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that measures how long each checkout waits for a connection.
+    SQLAlchemy has no pool event for "started waiting", so the wait is timed
+    around ``_do_get`` (includes connect time when a new connection is opened).
+    """
+
+    stats: PoolStats | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.stats is not None:
+                self.stats.record_wait((time.perf_counter() - start) * 1000.0, timed_out=timed_out)
+
+    def recreate(self):
+        # engine.dispose() 시 새 풀이 생성되므로 통계 객체를 이어받는다
+        new_pool = super().recreate()
+        new_pool.stats = self.stats
+        return new_pool
+
+
+_registry: Dict[str, tuple[Engine, PoolStats]] = {}
+
+
+def instrument(engine: Engine, name: str) -> PoolStats:
+    """엔진의 풀 이벤트에 통계 리스너를 등록하고 name으로 등록"""
+    stats = PoolStats()
+    if isinstance(engine.pool, TimedQueuePool):
+        engine.pool.stats = stats
+
+    event.listen(engine, "connect", lambda *_: stats.incr("connects"))
+    event.listen(engine, "checkout", lambda *_: stats.incr("checkouts"))
+    event.listen(engine, "checkin", lambda *_: stats.incr("checkins"))
+    event.listen(engine, "invalidate", lambda *_: stats.incr("invalidations"))
+
+    _registry[name] = (engine, stats)
+    return stats
+
+
+def _live_status(engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool_class": type(pool).__name__}
+    return {
+        "pool_class": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "timeout": pool.timeout(),
+    }
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """등록된 모든 엔진의 현재 풀 상태 + 누적 통계"""
+    return {
+        name: {**_live_status(engine), **stats.as_dict()}
+        for name, (engine, stats) in _registry.items()
+    }
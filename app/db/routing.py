@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+class _Replica:
+    def __init__(self, name: str, engine: Engine) -> None:
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        self.checked_at = 0.0
+        # health check는 replica당 한 번에 하나만 (백그라운드 스레드)
+        self.probe_lock = threading.Lock()
+        self.probe: Optional[threading.Thread] = None
+
+
+class ReadRouter:
+    """
+    읽기 전용 세션의 엔진 선택
+    - replica 라운드로빈 (health check 실패한 replica는 건너뜀)
+    - health check는 백그라운드 스레드에서 replica당 하나씩만 실행, 요청은 마지막으로 확인된 상태를 사용
+      (죽은 replica의 connect timeout을 요청이 기다리지 않음)
+    - 최근에 쓰기를 한 사용자는 sticky_seconds 동안 primary로 고정 (read-your-writes)
+    - 사용 가능한 replica가 없으면 primary로 fallback
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: Dict[str, Engine],
+        health_check_interval: float = 10.0,
+        sticky_seconds: float = 5.0,
+    ) -> None:
+        self.primary = primary
+        self._replicas: List[_Replica] = [_Replica(name, eng) for name, eng in replicas.items()]
+        self._cycle = itertools.cycle(self._replicas) if self._replicas else None
+        self._health_check_interval = health_check_interval
+        self._sticky_seconds = sticky_seconds
+        self._last_write: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+        for replica in self._replicas:
+            event.listen(replica.engine, "handle_error", self._on_error(replica))
+
+    def _on_error(self, replica: _Replica):
+        def handler(context) -> None:
+            if context.is_disconnect:
+                logger.warning(f"[DB Routing] replica {replica.name} disconnected, marking unhealthy")
+                replica.healthy = False
+                replica.checked_at = time.monotonic()
+
+        return handler
+
+    def _check(self, replica: _Replica) -> bool:
+        """마지막으로 확인된 상태를 바로 반환, interval이 지났으면 백그라운드 probe 시작"""
+        if time.monotonic() - replica.checked_at >= self._health_check_interval:
+            if replica.probe_lock.acquire(blocking=False):
+                replica.checked_at = time.monotonic()
+                replica.probe = threading.Thread(
+                    target=self._probe, args=(replica,), name=f"replica-probe-{replica.name}", daemon=True
+                )
+                replica.probe.start()
+        return replica.healthy
+
+    def _probe(self, replica: _Replica) -> None:
+        try:
+            with replica.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            if not replica.healthy:
+                logger.info(f"[DB Routing] replica {replica.name} is healthy again")
+            replica.healthy = True
+        except Exception as e:
+            logger.warning(f"[DB Routing] health check failed for replica {replica.name}: {e}")
+            replica.healthy = False
+        finally:
+            replica.checked_at = time.monotonic()
+            replica.probe_lock.release()
+
+    def mark_write(self, user_id: Optional[int]) -> None:
+        if user_id is None or not self._replicas:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._last_write[int(user_id)] = now
+            if len(self._last_write) > 10_000:
+                self._last_write = {
+                    uid: ts for uid, ts in self._last_write.items() if now - ts <= self._sticky_seconds
+                }
+
+    def is_sticky(self, user_id: Optional[int]) -> bool:
+        if user_id is None or not self._replicas:
+            return False
+        with self._lock:
+            written_at = self._last_write.get(int(user_id))
+            if written_at is None:
+                return False
+            if time.monotonic() - written_at > self._sticky_seconds:
+                del self._last_write[int(user_id)]
+                return False
+            return True
+
+    def engine_for_read(self, user_id: Optional[int] = None) -> Engine:
+        if self._cycle is None or self.is_sticky(user_id):
+            return self.primary
+        for _ in range(len(self._replicas)):
+            with self._lock:
+                replica = next(self._cycle)
+            if self._check(replica):
+                return replica.engine
+        return self.primary
+
+    def status(self) -> List[dict]:
+        return [
+            {"name": r.name, "healthy": r.healthy, "checked_at": r.checked_at, "probing": r.probe_lock.locked()}
+            for r in self._replicas
+        ]
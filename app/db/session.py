@@ -1,8 +1,13 @@
-from sqlalchemy import create_engine
+from typing import Optional
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import URL
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.core import serialization
 from app.core.settings import settings
+from app.db import pool_metrics
+from app.db.routing import ReadRouter
 
 
 DB_URL = URL.create(
@@ -15,7 +20,42 @@ DB_URL = URL.create(
     query={"charset": "utf8mb4"},
 )
 
-engine = create_engine(DB_URL, pool_pre_ping=True, future=True)
+
+def _create_engine(url, **kwargs):
+    return create_engine(
+        url,
+        poolclass=pool_metrics.TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        # JSON 컬럼(matching_vectors.vector_* 등) 인코딩/디코딩에 orjson 사용
+        json_serializer=serialization.dumps,
+        json_deserializer=serialization.loads,
+        future=True,
+        **kwargs,
+    )
+
+
+engine = _create_engine(DB_URL)
+pool_metrics.instrument(engine, "primary")
+
+replica_engines = {}
+for index, replica_url in enumerate(settings.replica_urls):
+    # 죽은 replica에 대한 연결 시도가 오래 걸리지 않도록 짧은 connect timeout
+    replica_engines[f"replica-{index}"] = _create_engine(
+        replica_url, connect_args={"connect_timeout": settings.DB_REPLICA_CONNECT_TIMEOUT}
+    )
+    pool_metrics.instrument(replica_engines[f"replica-{index}"], f"replica-{index}")
+
+read_router = ReadRouter(
+    primary=engine,
+    replicas=replica_engines,
+    health_check_interval=settings.DB_REPLICA_HEALTH_CHECK_INTERVAL,
+    sticky_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+)
+
 # Avoid expiring attributes on commit so ORM instances can be safely
 # accessed after the transaction (e.g., when serializing in FastAPI).
 SessionLocal = sessionmaker(
@@ -25,3 +65,43 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,
     future=True,
 )
+
+# Sessions for read-only requests: never committed, always rolled back on close.
+# Use read_session() so the bind is chosen by read_router per request.
+ReadSessionLocal = sessionmaker(
+    bind=engine,
+    autoflush=False,
+    autocommit=False,
+    expire_on_commit=False,
+    future=True,
+)
+
+
+@event.listens_for(ReadSessionLocal, "after_begin")
+def _begin_read_only(session, transaction, connection):
+    # MySQL applies SET TRANSACTION to the next transaction, i.e. the one that
+    # starts with the first statement of this session.
+    if connection.dialect.name == "mysql":
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _track_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _reset_writes(session):
+    session.info.pop("has_writes", None)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _mark_user_write(session):
+    # read-your-writes: 쓰기를 커밋한 사용자의 다음 읽기는 잠시 primary로
+    if session.info.pop("has_writes", False):
+        read_router.mark_write(session.info.get("user_id"))
+
+
+def read_session(user_id: Optional[int] = None) -> Session:
+    """읽기 전용 세션 생성 (replica 또는 read-your-writes 대상이면 primary)"""
+    return ReadSessionLocal(bind=read_router.engine_for_read(user_id))
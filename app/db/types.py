@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from sqlalchemy.types import TEXT, TypeDecorator
 
+from app.core import serialization
+
 try:
     from sqlalchemy.dialects.mysql import JSON as MySQLJSON  # type: ignore
 
@@ -28,13 +29,13 @@ class JSONString(TypeDecorator):  # pragma: no cover - simple serialization help
     def process_bind_param(self, value: Any, dialect: Any) -> Any:
         if value is None:
             return None
-        return json.dumps(value, ensure_ascii=False)
+        return serialization.dumps(value)
 
     def process_result_value(self, value: Any, dialect: Any) -> Any:
         if value is None:
             return None
         try:
-            return json.loads(value)
+            return serialization.loads(value)
         except (TypeError, ValueError):
             return value
 
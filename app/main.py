@@ -1,7 +1,15 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.auth import router as auth_router
+from app.api.deps import require_admin
+from app.api.routes.admin import router as admin_router
+from app.api.routes.autocomplete import router as autocomplete_router
+from app.api.routes.card_search import router as card_search_router
 from app.api.routes.talent import router as talent_router, public_router as talent_public_router
 from app.api.routes.company import router as company_router, public_router as company_public_router, job_posting_public_router
 from app.api.routes.job_posting_card import router as job_posting_card_router
@@ -9,9 +17,52 @@ from app.api.routes.talent_card import router as talent_card_router
 from app.api.routes.matching_vector import router as matching_vector_router, public_router as matching_vector_public_router
 from app.api.routes.vector_matching import router as vector_matching_router
 from app.api.routes.matching_result import router as matching_result_router
+from app.core import metrics
+from app.core.profiler import SamplingProfilerMiddleware
+from app.core.request_timing import RequestTimingMiddleware
+from app.core.responses import FastJSONResponse
+from app.core.settings import settings
+from app.db import instrumentation
+from app.db.session import SessionLocal
+from app.repositories import autocomplete_index, card_index, job_posting_index, revoked_token_repo
+
+logger = logging.getLogger(__name__)
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        with SessionLocal() as db:
+            revoked_token_repo.sync(db)
+    except Exception as e:
+        logger.warning(f"[TokenRevocation] initial sync failed, retrying on next request: {e}")
+    if settings.JOB_POSTING_INDEX_ENABLED:
+        # 실패해도 서버는 뜨고, 검색은 index 없이 SQL로만 동작
+        try:
+            with SessionLocal() as db:
+                job_posting_index.build(db)
+        except Exception as e:
+            logger.warning(f"[PostingIndex] build failed, search falls back to SQL: {e}")
+    try:
+        with SessionLocal() as db:
+            autocomplete_index.build(db)
+    except Exception as e:
+        logger.warning(f"[Autocomplete] build failed, retrying on first request: {e}")
+    try:
+        with SessionLocal() as db:
+            card_index.load_or_build(db)
+    except Exception as e:
+        logger.warning(f"[CardIndex] load failed, retrying on first request: {e}")
+    yield
+    if card_index.ready():
+        # 다음 시작 때 snapshot 이후 변경분만 읽도록 현재 상태 저장
+        try:
+            card_index.save_snapshots()
+        except Exception as e:
+            logger.warning(f"[CardIndex] snapshot save failed: {e}")
 
-app = FastAPI(title="FitConnect API")
+
+app = FastAPI(title="FitConnect API", default_response_class=FastJSONResponse, lifespan=lifespan)
 
 origins = [
     "*"  # 개발 중에는 모두 허용, 배포시에는 프론트 도메인만 넣기
@@ -23,14 +74,44 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+if settings.PROFILER_ENABLED:
+    app.add_middleware(
+        SamplingProfilerMiddleware,
+        output_dir=settings.PROFILER_OUTPUT_DIR,
+        interval_ms=settings.PROFILER_INTERVAL_MS,
+        sample_rate=settings.PROFILER_SAMPLE_RATE,
+        admin_key=settings.ADMIN_API_KEY,
+        max_files=settings.PROFILER_MAX_FILES,
+    )
+
+if instrumentation.enabled():
+    app.add_middleware(instrumentation.QueryWatchMiddleware)
+
+if settings.REQUEST_TIMING_ENABLED or settings.METRICS_ENABLED:
+    # 가장 바깥에 등록해서 CORS 처리 시간까지 포함
+    app.add_middleware(
+        RequestTimingMiddleware,
+        server_timing=settings.REQUEST_TIMING_ENABLED,
+        access_log=settings.REQUEST_TIMING_ENABLED,
+    )
+
 
 @app.get("/health")
 def health():
     return {"ok": True, "service": "fitconnect", "status": "healthy"}
 
 
+if settings.METRICS_ENABLED:
+
+    # Admin API와 같은 X-Admin-Key 보호 (ADMIN_API_KEY 미설정 시 404)
+    @app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_admin)])
+    def prometheus_metrics():
+        return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 app.include_router(auth_router)
 app.include_router(talent_router)
 app.include_router(talent_public_router)
@@ -41,5 +122,8 @@ app.include_router(matching_result_router)
 app.include_router(company_router)
 app.include_router(company_public_router)
 app.include_router(job_posting_public_router)
+app.include_router(autocomplete_router)
+app.include_router(card_search_router)
 app.include_router(job_posting_card_router)
 app.include_router(talent_card_router)
+app.include_router(admin_router)
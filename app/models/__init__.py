@@ -14,5 +14,6 @@ from . import job_posting_card  # noqa: F401
 from . import talent_card  # noqa: F401
 from . import matching_vector  # noqa: F401
 from . import matching_result  # noqa: F401
+from . import revoked_token  # noqa: F401
 
 metadata = Base.metadata
@@ -86,6 +86,22 @@ class JobPosting(TimestampMixin, Base):
         sa.Index("ix_job_postings_company_status", "company_id", "status"),
         sa.Index("ix_job_postings_status", "status"),
         sa.Index("ix_job_postings_deadline_date", "deadline_date"),
+        # 공고 검색 (/api/job-postings/search): status + 필터 1개 조합, InnoDB secondary index에 PK가 붙어 id 정렬까지 커버
+        sa.Index("ix_job_postings_status_location", "status", "location_city"),
+        sa.Index("ix_job_postings_status_employment", "status", "employment_type", mysql_length={"employment_type": 20}),
+        sa.Index("ix_job_postings_status_career", "status", "career_level", mysql_length={"career_level": 30}),
+        sa.Index("ix_job_postings_status_salary", "status", "salary_range"),
+        sa.Index("ix_job_postings_status_deadline", "status", "deadline_date"),
+        sa.Index("ix_job_postings_updated_at", "updated_at"),  # bitmap index 증분 refresh
+        sa.Index(
+            "ft_job_postings_text",
+            "title",
+            "responsibilities",
+            "requirements_must",
+            "competencies",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
     )
 
     cards: Mapped[list["JobPostingCard"]] = relationship(
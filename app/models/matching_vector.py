@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Optional, TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, UniqueConstraint, func
+from sqlalchemy import BigInteger, Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, UniqueConstraint, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -39,6 +39,16 @@ class MatchingVector(Base):
     vector_vision: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONType, nullable=True)
     vector_culture: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONType, nullable=True)
 
+    # 벡터를 만든 모델 (필드별 값은 각 vector_* 의 "model" / "dim")
+    # - 모든 필드가 같은 모델이면 그 이름, 섞여 있으면 "mixed", 모델 표시가 없는 벡터는 NULL
+    # - dims: 모든 필드 차원이 같을 때만
+    model_version: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    dims: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # 자동 매칭을 미룬 채 저장된 벡터 (파이프라인 / backfill), 재매칭하면 False
+    needs_rematch: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=text("0"), index=True
+    )
+
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
         nullable=False,
@@ -51,6 +61,7 @@ class MatchingVector(Base):
     # - company: job_posting_id당 1개
     __table_args__ = (
         UniqueConstraint("user_id", "job_posting_id", name="uq_matching_vector_user_jobposting"),
+        Index("ix_matching_vectors_role_model_version", "role", "model_version"),
     )
 
     user: Mapped["User"] = relationship("User", back_populates="matching_vectors")
@@ -0,0 +1,163 @@
+"""
+자동완성 prefix index (워커 프로세스 단위)
+- position: 공개 공고(PUBLISHED/CLOSED)의 position, position_group
+- skill   : TalentCard.job_skills[].name
+- company : 활성 기업의 name
+
+시작 시 build(), 쓰기 경로(job_posting_repo, company_repo, talent_card 라우트)가 track()으로 변경을 기록
+→ 세션 commit 시 반영, rollback 시 폐기. 다른 워커의 변경은 refresh_if_stale()이 updated_at 기준으로 가져온다.
+삭제된 행은 updated_at으로 알 수 없으므로 search()에서 후보 값을 가진 행을 DB에서 한 번 더 확인한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.autocomplete import PrefixIndex
+from app.core.settings import settings
+from app.db import index_sync
+from app.models.company import Company
+from app.models.job_posting import JobPosting
+from app.models.talent_card import TalentCard
+
+logger = logging.getLogger(__name__)
+
+_PUBLIC_POSTING_STATUS = ("PUBLISHED", "CLOSED")
+
+
+def _position_values(posting: Any) -> List[str]:
+    if posting.deleted_at is not None or posting.status not in _PUBLIC_POSTING_STATUS:
+        return []
+    return [posting.position, posting.position_group]
+
+
+def _skill_values(card: Any) -> List[str]:
+    return [item.get("name") for item in card.job_skills or [] if isinstance(item, dict) and item.get("name")]
+
+
+def _company_values(company: Any) -> List[str]:
+    return [company.name] if company.status == "ACTIVE" else []
+
+
+# type → (모델, 읽을 컬럼, 값 추출 함수), 추출 함수는 ORM 객체와 select 결과 row 모두에 동작
+SOURCES: Dict[str, Tuple[Any, Tuple[str, ...], Callable[[Any], List[str]]]] = {
+    "position": (JobPosting, ("position", "position_group", "status", "deleted_at"), _position_values),
+    "skill": (TalentCard, ("job_skills",), _skill_values),
+    "company": (Company, ("name", "status"), _company_values),
+}
+TYPES = tuple(SOURCES)
+
+indexes: Dict[str, PrefixIndex] = {kind: PrefixIndex() for kind in TYPES}
+
+_state: Dict[str, Any] = {"ready": False, "watermarks": {}}
+# search()에서 값마다 DB로 확인할 보유 행 수 (많이 쓰인 값은 일부만 확인, 사라진 행은 그때그때 index에서 뺀다)
+_VERIFY_ROWS_PER_VALUE = 20
+
+
+def ready() -> bool:
+    return _state["ready"]
+
+
+def _load(db: Session, kind: str, since: Optional[datetime] = None) -> Tuple[List[Tuple[int, List[str]]], Optional[datetime]]:
+    model, columns, extract = SOURCES[kind]
+    stmt = select(model.id, model.updated_at, *[getattr(model, c) for c in columns])
+    rows, latest = [], None
+    for row in db.execute(index_sync.changed_since(stmt, model.updated_at, since)):
+        rows.append((row.id, extract(row)))
+        latest = index_sync.later(latest, row.updated_at)
+    return rows, latest
+
+
+def build(db: Session) -> None:
+    """전체 재구성 (시작 시 / 첫 요청 시)"""
+    with _refresher.lock:
+        started = time.perf_counter()
+        watermarks = {}
+        for kind in TYPES:
+            rows, watermarks[kind] = _load(db, kind)
+            indexes[kind].rebuild(rows)
+        _state.update(ready=True, watermarks=watermarks)
+        _refresher.mark()
+    sizes = " ".join(f"{kind}={len(indexes[kind])}" for kind in TYPES)
+    logger.info(f"[Autocomplete] built {sizes} in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+
+def ensure_ready(db: Session) -> None:
+    if not ready():
+        build(db)
+    else:
+        refresh_if_stale()
+
+
+def refresh_if_stale() -> None:
+    """AUTOCOMPLETE_REFRESH_SECONDS가 지났으면 백그라운드에서 updated_at >= watermark 인 행만 다시 읽는다"""
+    if ready():
+        _refresher.refresh_if_stale()
+
+
+def _refresh(db: Session) -> None:
+    for kind in TYPES:
+        rows, latest = _load(db, kind, since=_state["watermarks"].get(kind))
+        for row_id, values in rows:
+            indexes[kind].set(row_id, values)
+        if latest is not None:
+            _state["watermarks"][kind] = latest
+
+
+def _apply_pending(pending: Dict[Hashable, List[str]]) -> None:
+    for (kind, row_id), values in pending.items():
+        indexes[kind].set(row_id, values)
+
+
+_refresher = index_sync.Refresher("Autocomplete", _refresh, lambda: settings.AUTOCOMPLETE_REFRESH_SECONDS)
+_pending = index_sync.PendingWrites("autocomplete_index", _apply_pending)
+
+
+def track(db: Session, kind: str, obj: Any) -> None:
+    """쓰기 후 호출: 현재 값을 세션에 기록해 두고 commit 시 index에 반영"""
+    if not ready():
+        return
+    _pending.add(db, (kind, obj.id), SOURCES[kind][2](obj))
+
+
+def search(db: Session, kind: str, query: str, limit: int) -> List[Dict[str, object]]:
+    """
+    참조 수 순 자동완성 후보
+    index에는 다른 워커에서 삭제된 행이 남아 있을 수 있으므로 후보 값을 가진 행을 DB에서 한 번 더 읽어
+    사라진 행은 index에서 빼고 다시 검색한다
+    """
+    index = indexes[kind]
+    items = index.search(query, limit)
+    if not items:
+        return []
+    row_ids = {row_id for item in items for row_id in index.rows_with(item["value"], _VERIFY_ROWS_PER_VALUE)}
+    model = SOURCES[kind][0]
+    existing = set(db.execute(select(model.id).where(model.id.in_(row_ids))).scalars())
+    if len(existing) == len(row_ids):
+        return items
+    for row_id in row_ids - existing:
+        index.remove(row_id)
+    return index.search(query, limit)
+
+
+def stats() -> Dict[str, Any]:
+    return {
+        "ready": _state["ready"],
+        "refreshed_at": _refresher.refreshed_at,
+        **{kind: indexes[kind].stats() for kind in TYPES},
+    }
+
+
+def reset() -> None:
+    """index 비우기 (다음 ensure_ready()에서 다시 build)"""
+    with _refresher.lock:
+        for kind in TYPES:
+            indexes[kind].rebuild(())
+        _state.update(ready=False, watermarks={})
+        _refresher.refreshed_at = 0.0
@@ -0,0 +1,203 @@
+"""
+카드 텍스트 trigram index (워커 프로세스 단위)
+- talent     : TalentCard.headline / strengths / experiences
+- job_posting: JobPostingCard.headline / requirements / talent_persona
+
+시작 시 CARD_INDEX_SNAPSHOT_DIR의 snapshot을 읽고, 저장 이후 바뀐 카드만 updated_at 기준으로 다시 읽는다
+(snapshot이 없거나 디렉터리가 비어 있으면 DB에서 전체 build 후 저장).
+카드 라우트의 생성/수정은 track()으로 기록 → commit 시 반영, 다른 워커 변경은 refresh_if_stale()로 반영.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+import zipfile
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.ngram_index import NgramIndex
+from app.core.settings import settings
+from app.db import index_sync
+from app.models.job_posting_card import JobPostingCard
+from app.models.talent_card import TalentCard
+
+logger = logging.getLogger(__name__)
+
+# kind → (모델, 소유자 id 컬럼, 검색 대상 컬럼)
+SOURCES: Dict[str, Tuple[Any, str, Tuple[str, ...]]] = {
+    "talent": (TalentCard, "user_id", ("headline", "strengths", "experiences")),
+    "job_posting": (JobPostingCard, "job_posting_id", ("headline", "requirements", "talent_persona")),
+}
+KINDS = tuple(SOURCES)
+
+indexes: Dict[str, NgramIndex] = {kind: NgramIndex() for kind in KINDS}
+
+_state: Dict[str, Any] = {"ready": False, "watermarks": {}, "loaded_from": {}}
+
+
+def ready() -> bool:
+    return _state["ready"]
+
+
+def _text(row: Any, columns: Tuple[str, ...]) -> str:
+    """문자열 / 문자열 목록 컬럼을 한 텍스트로"""
+    parts: List[str] = []
+    for column in columns:
+        value = getattr(row, column)
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, list):
+            parts.extend(item for item in value if isinstance(item, str))
+    return "\n".join(parts)
+
+
+def _load(db: Session, kind: str, since: Optional[datetime] = None) -> Tuple[List[Tuple[int, str]], Optional[datetime]]:
+    model, _, columns = SOURCES[kind]
+    stmt = select(model.id, model.updated_at, *[getattr(model, c) for c in columns])
+    docs, latest = [], None
+    for row in db.execute(index_sync.changed_since(stmt, model.updated_at, since)):
+        docs.append((row.id, _text(row, columns)))
+        latest = index_sync.later(latest, row.updated_at)
+    return docs, latest
+
+
+def snapshot_path(kind: str) -> Optional[str]:
+    directory = settings.CARD_INDEX_SNAPSHOT_DIR
+    return os.path.join(directory, f"{kind}_cards.npz") if directory else None
+
+
+def save_snapshots() -> Dict[str, str]:
+    """kind별 snapshot 저장 → 저장한 경로"""
+    saved = {}
+    for kind in KINDS:
+        path = snapshot_path(kind)
+        if path is None:
+            continue
+        watermark = _state["watermarks"].get(kind)
+        indexes[kind].save(path, watermark=watermark.isoformat() if watermark else "")
+        saved[kind] = path
+    return saved
+
+
+def build(db: Session) -> None:
+    """DB에서 전체 재구성 후 snapshot 저장"""
+    with _refresher.lock:
+        started = time.perf_counter()
+        watermarks = {}
+        for kind in KINDS:
+            docs, watermarks[kind] = _load(db, kind)
+            indexes[kind].rebuild(docs)
+        _state.update(ready=True, watermarks=watermarks, loaded_from={k: "db" for k in KINDS})
+        _refresher.mark()
+    logger.info(
+        f"[CardIndex] built {' '.join(f'{k}={len(indexes[k])}' for k in KINDS)} "
+        f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+    )
+    save_snapshots()
+
+
+def load_or_build(db: Session) -> None:
+    """snapshot이 모두 있으면 로드 + 이후 변경분만 반영, 하나라도 없거나 읽을 수 없으면 전체 build"""
+    started = time.perf_counter()
+    metas = {}
+    for kind in KINDS:
+        path = snapshot_path(kind)
+        try:
+            meta = indexes[kind].load(path) if path else None
+        except (ValueError, OSError, KeyError, zipfile.BadZipFile) as e:
+            # 손상되거나 잘린 snapshot → DB에서 다시 만들고 덮어쓴다
+            logger.warning(f"[CardIndex] snapshot {path} unreadable, rebuilding from DB: {e!r}")
+            meta = None
+        if meta is None:
+            build(db)
+            return
+        metas[kind] = meta
+    try:
+        watermarks = {
+            kind: datetime.fromisoformat(meta["watermark"]) if meta.get("watermark") else None
+            for kind, meta in metas.items()
+        }
+    except ValueError as e:
+        logger.warning(f"[CardIndex] snapshot watermark invalid, rebuilding from DB: {e!r}")
+        build(db)
+        return
+    with _refresher.lock:
+        _state.update(ready=True, watermarks=watermarks, loaded_from={k: "snapshot" for k in KINDS})
+        _refresh(db)
+        _refresher.mark()
+    logger.info(
+        f"[CardIndex] loaded snapshot {' '.join(f'{k}={len(indexes[k])}' for k in KINDS)} "
+        f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+    )
+
+
+def _refresh(db: Session) -> None:
+    for kind in KINDS:
+        docs, latest = _load(db, kind, since=_state["watermarks"].get(kind))
+        for doc_id, text in docs:
+            indexes[kind].set(doc_id, text)
+        if latest is not None:
+            _state["watermarks"][kind] = latest
+
+
+def _apply_pending(pending: Dict[Hashable, str]) -> None:
+    for (kind, card_id), text in pending.items():
+        indexes[kind].set(card_id, text)
+
+
+_refresher = index_sync.Refresher("CardIndex", _refresh, lambda: settings.CARD_INDEX_REFRESH_SECONDS)
+_pending = index_sync.PendingWrites("card_index", _apply_pending)
+
+
+def ensure_ready(db: Session) -> None:
+    if not ready():
+        load_or_build(db)
+    else:
+        refresh_if_stale()
+
+
+def refresh_if_stale() -> None:
+    """CARD_INDEX_REFRESH_SECONDS가 지났으면 백그라운드에서 updated_at >= watermark 인 카드만 다시 읽는다"""
+    if ready():
+        _refresher.refresh_if_stale()
+
+
+def track(db: Session, kind: str, card: Any) -> None:
+    """카드 쓰기 후 호출: 현재 텍스트를 세션에 기록해 두고 commit 시 index에 반영"""
+    if not ready():
+        return
+    _pending.add(db, (kind, card.id), _text(card, SOURCES[kind][2]))
+
+
+def search(db: Session, kind: str, query: str, limit: int, min_similarity: float) -> List[Dict[str, Any]]:
+    """
+    유사도 순 카드 목록
+    index에는 삭제된 카드가 남아 있을 수 있으므로 상위 후보를 DB에서 한 번 더 읽어 존재하는 카드만 돌려준다
+    """
+    hits = indexes[kind].search(query, limit=limit * 2, min_similarity=min_similarity)
+    if not hits:
+        return []
+    model, owner, _ = SOURCES[kind]
+    owners = dict(
+        db.execute(select(model.id, getattr(model, owner)).where(model.id.in_([card_id for card_id, _ in hits]))).all()
+    )
+    items = [
+        {"card_id": card_id, owner: owners[card_id], "similarity": similarity}
+        for card_id, similarity in hits
+        if card_id in owners
+    ]
+    return items[:limit]
+
+
+def stats() -> Dict[str, Any]:
+    return {
+        "ready": _state["ready"],
+        "refreshed_at": _refresher.refreshed_at,
+        "snapshot_dir": settings.CARD_INDEX_SNAPSHOT_DIR or None,
+        **{kind: {**indexes[kind].stats(), "loaded_from": _state["loaded_from"].get(kind)} for kind in KINDS},
+    }
@@ -6,6 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.company import Company
+from app.repositories import autocomplete_index
 
 
 def get_by_owner(db: Session, user_id: int) -> Optional[Company]:
@@ -62,4 +63,5 @@ def update_full(
         company.profile_step = max(company.profile_step or 0, 2)
 
     db.flush()
+    autocomplete_index.track(db, "company", company)
     return company
@@ -0,0 +1,112 @@
+"""
+채용공고 enum 속성 bitmap index (워커 프로세스 단위)
+- 시작 시 build(), 이후 job_posting_repo의 create/update_partial/soft_delete가 track()으로 변경을 기록
+  → 세션 commit 시 반영, rollback 시 폐기
+- 다른 워커/배치에서 생긴 변경은 refresh_if_stale()이 updated_at 기준으로 주기적으로 가져온다
+  (index_sync.Refresher: 백그라운드 스레드에서 한 번에 하나만 실행, 요청은 기다리지 않고 현재 index를 사용)
+  (JOB_POSTING_INDEX_REFRESH_SECONDS 만큼 늦을 수 있으므로 후보 축소용으로만 쓰고, 최종 조건은 SQL에서 다시 확인)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Hashable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.bitmap_index import BitmapIndex
+from app.core.settings import settings
+from app.db import index_sync
+from app.models.job_posting import JobPosting
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("status", "location_city", "employment_type", "career_level", "education_level", "salary_range")
+
+index = BitmapIndex(FIELDS)
+
+_state: Dict[str, Any] = {"ready": False, "watermark": None}
+
+
+def ready() -> bool:
+    return settings.JOB_POSTING_INDEX_ENABLED and _state["ready"]
+
+
+def _values(posting: Any) -> Dict[str, Any]:
+    return {field: getattr(posting, field) for field in FIELDS}
+
+
+def _apply(rows) -> Optional[datetime]:
+    latest = None
+    for row in rows:
+        if row.deleted_at is None:
+            index.add(row.id, _values(row))
+        else:
+            index.remove(row.id)
+        latest = index_sync.later(latest, row.updated_at)
+    return latest
+
+
+def _columns():
+    return select(JobPosting.id, *[getattr(JobPosting, f) for f in FIELDS], JobPosting.deleted_at, JobPosting.updated_at)
+
+
+def build(db: Session) -> None:
+    """전체 재구성 (시작 시 / admin rebuild)"""
+    with _refresher.lock:
+        started = time.perf_counter()
+        watermark = db.execute(select(func.max(JobPosting.updated_at))).scalar()
+        index.rebuild((row.id, _values(row)) for row in db.execute(_columns().where(JobPosting.deleted_at.is_(None))))
+        _state.update(ready=True, watermark=watermark)
+        _refresher.mark()
+    logger.info(f"[PostingIndex] built {len(index)} postings in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+
+def refresh_if_stale() -> Optional[threading.Thread]:
+    """
+    마지막 refresh 후 JOB_POSTING_INDEX_REFRESH_SECONDS가 지났으면 백그라운드 스레드에서 refresh 시작
+    - 이미 refresh(또는 build) 중이면 아무것도 하지 않음, 호출한 요청은 현재 index를 그대로 사용
+    """
+    if not ready():
+        return None
+    return _refresher.refresh_if_stale()
+
+
+def _refresh(db: Session) -> None:
+    """updated_at >= watermark 인 행만 다시 읽는다 (_refresher.lock을 잡은 상태로 호출)"""
+    latest = _apply(db.execute(index_sync.changed_since(_columns(), JobPosting.updated_at, _state["watermark"])))
+    if latest is not None:
+        _state["watermark"] = latest
+
+
+def _apply_pending(pending: Dict[Hashable, Optional[Dict[str, Any]]]) -> None:
+    for posting_id, values in pending.items():
+        if values is None:
+            index.remove(posting_id)
+        else:
+            index.add(posting_id, values)
+
+
+_refresher = index_sync.Refresher("PostingIndex", _refresh, lambda: settings.JOB_POSTING_INDEX_REFRESH_SECONDS)
+_pending = index_sync.PendingWrites("job_posting_index", _apply_pending)
+
+
+def track(db: Session, posting: JobPosting) -> None:
+    """repo 쓰기 후 호출: 현재 값을 세션에 기록해 두고 commit 시 index에 반영"""
+    if not ready():
+        return
+    _pending.add(db, posting.id, None if posting.deleted_at is not None else _values(posting))
+
+
+def stats() -> Dict[str, Any]:
+    return {
+        "enabled": settings.JOB_POSTING_INDEX_ENABLED,
+        "ready": _state["ready"],
+        "watermark": _state["watermark"],
+        "refreshed_at": _refresher.refreshed_at,
+        **index.stats(),
+    }
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional, Sequence
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import Session
 from sqlalchemy import select, desc
 
 from app.models.job_posting import JobPosting
+from app.repositories import autocomplete_index, job_posting_index
 
 
 def create(db: Session, company_id: int, data: dict) -> JobPosting:
@@ -36,6 +40,8 @@ def create(db: Session, company_id: int, data: dict) -> JobPosting:
     )
     db.add(posting)
     db.flush()
+    job_posting_index.track(db, posting)
+    autocomplete_index.track(db, "position", posting)
     return posting
 
 
@@ -47,6 +53,117 @@ def list_by_company(db: Session, company_id: int, status: Optional[str] = None)
     return db.execute(stmt).scalars().all()
 
 
+_SEARCH_TEXT_COLUMNS = (
+    JobPosting.title,
+    JobPosting.responsibilities,
+    JobPosting.requirements_must,
+    JobPosting.competencies,
+)
+
+
+def _search_where(
+    db: Session,
+    stmt,
+    filters: Dict[str, Sequence[str]],
+    keyword: Optional[str],
+    deadline_from: Optional[date],
+    deadline_to: Optional[date],
+    open_on: Optional[date],
+):
+    """검색 조건 적용 → (stmt, relevance 식 또는 None)"""
+    stmt = stmt.where(JobPosting.deleted_at.is_(None))
+    for column, values in filters.items():
+        if values:
+            stmt = stmt.where(getattr(JobPosting, column).in_(list(values)))
+    if deadline_from is not None:
+        stmt = stmt.where(JobPosting.deadline_date >= deadline_from)
+    if deadline_to is not None:
+        stmt = stmt.where(JobPosting.deadline_date <= deadline_to)
+    if open_on is not None:
+        stmt = stmt.where(sa.or_(JobPosting.deadline_date.is_(None), JobPosting.deadline_date >= open_on))
+
+    relevance = None
+    if keyword:
+        if db.get_bind().dialect.name == "mysql":
+            relevance = sa.type_coerce(
+                mysql.match(*_SEARCH_TEXT_COLUMNS, against=keyword).in_natural_language_mode(), sa.Float
+            )
+            stmt = stmt.where(relevance > 0)
+        else:
+            for term in keyword.split():
+                stmt = stmt.where(sa.or_(*[col.contains(term, autoescape=True) for col in _SEARCH_TEXT_COLUMNS]))
+    return stmt, relevance
+
+
+def search(
+    db: Session,
+    filters: Dict[str, Sequence[str]],
+    keyword: Optional[str] = None,
+    deadline_from: Optional[date] = None,
+    deadline_to: Optional[date] = None,
+    open_on: Optional[date] = None,
+    after: Optional[Tuple[float, int]] = None,
+    limit: int = 20,
+    candidate_ids: Optional[Sequence[int]] = None,
+) -> List[Tuple[JobPosting, float]]:
+    """
+    공고 검색 (keyset pagination)
+    - filters: 컬럼명 → 허용 값 목록 (IN 조건, 빈 목록은 무시)
+    - keyword: MySQL은 FULLTEXT(ngram) MATCH ... AGAINST 관련도 순, 그 외 DB는 LIKE + 최신순 (관련도 0)
+    - open_on: 마감일이 없거나 open_on 이후인 공고만
+    - after: 이전 페이지 마지막 행의 (relevance, id)
+    - candidate_ids: bitmap index로 미리 좁힌 후보 (다른 조건은 그대로 SQL에서 다시 확인)
+    """
+    stmt = select(JobPosting)
+    if candidate_ids is not None:
+        stmt = stmt.where(JobPosting.id.in_(list(candidate_ids)))
+    stmt, relevance = _search_where(db, stmt, filters, keyword, deadline_from, deadline_to, open_on)
+
+    if relevance is not None:
+        stmt = stmt.add_columns(relevance)
+        if after is not None:
+            score, last_id = after
+            stmt = stmt.where(sa.or_(relevance < score, sa.and_(relevance == score, JobPosting.id < last_id)))
+        stmt = stmt.order_by(relevance.desc(), JobPosting.id.desc())
+    else:
+        stmt = stmt.add_columns(sa.literal(0.0, sa.Float))
+        if after is not None:
+            stmt = stmt.where(JobPosting.id < after[1])
+        stmt = stmt.order_by(JobPosting.id.desc())
+
+    return [(posting, float(score or 0.0)) for posting, score in db.execute(stmt.limit(limit)).all()]
+
+
+def search_ids(
+    db: Session,
+    filters: Dict[str, Sequence[str]],
+    keyword: Optional[str] = None,
+    deadline_from: Optional[date] = None,
+    deadline_to: Optional[date] = None,
+    open_on: Optional[date] = None,
+) -> List[int]:
+    """검색 조건을 만족하는 공고 id 전체 (정렬/페이지 없음, facet 계산용)"""
+    stmt, _ = _search_where(db, select(JobPosting.id), filters, keyword, deadline_from, deadline_to, open_on)
+    return list(db.execute(stmt).scalars().all())
+
+
+def search_group_counts(
+    db: Session,
+    fields: Sequence[str],
+    filters: Dict[str, Sequence[str]],
+    keyword: Optional[str] = None,
+    deadline_from: Optional[date] = None,
+    deadline_to: Optional[date] = None,
+    open_on: Optional[date] = None,
+) -> List[Tuple]:
+    """검색 조건을 만족하는 공고를 fields 값 조합별로 센 (값..., count) 목록 (GROUP BY 한 번)"""
+    columns = [getattr(JobPosting, field) for field in fields]
+    stmt, _ = _search_where(
+        db, select(*columns, sa.func.count()), filters, keyword, deadline_from, deadline_to, open_on
+    )
+    return [tuple(row) for row in db.execute(stmt.group_by(*columns)).all()]
+
+
 def get_by_id(db: Session, posting_id: int) -> Optional[JobPosting]:
     """채용공고 ID로 조회 (공개 API용)"""
     stmt = select(JobPosting).where(JobPosting.id == posting_id, JobPosting.deleted_at.is_(None)).limit(1)
@@ -100,6 +217,8 @@ def update_partial(db: Session, posting: JobPosting, data: dict) -> JobPosting:
         if k in allowed:
             setattr(posting, k, v)
     db.flush()
+    job_posting_index.track(db, posting)
+    autocomplete_index.track(db, "position", posting)
     return posting
 
 
@@ -108,4 +227,6 @@ def soft_delete(db: Session, posting: JobPosting) -> JobPosting:
 
     posting.deleted_at = datetime.utcnow()
     db.flush()
+    job_posting_index.track(db, posting)
+    autocomplete_index.track(db, "position", posting)
     return posting
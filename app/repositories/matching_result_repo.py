@@ -5,6 +5,7 @@ from typing import List, Optional
 from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
+from app.core import metrics
 from app.models.matching_result import MatchingResult
 
 
@@ -52,6 +53,7 @@ def upsert_result(
         existing.calculated_at = func.now()
         db.flush()
         db.refresh(existing)
+        metrics.matching_result_upserts_total.inc(operation="update")
         return existing
     else:
         # INSERT
@@ -72,6 +74,7 @@ def upsert_result(
         db.add(new_result)
         db.flush()
         db.refresh(new_result)
+        metrics.matching_result_upserts_total.inc(operation="insert")
         return new_result
 
 
@@ -180,6 +183,29 @@ def delete_by_vector_id(db: Session, vector_id: int) -> None:
     db.flush()
 
 
+def delete_pairs(
+    db: Session, talent_vector_ids: List[int], company_vector_ids: List[int], batch_size: int = 1000
+) -> int:
+    """
+    talent × company 벡터 조합의 매칭 결과 삭제 (hard constraint로 제외된 조합 정리용)
+    - IN 목록은 batch_size개씩 나눠 여러 DELETE로 실행
+    
+    Returns:
+        삭제된 행 수
+    """
+    if not talent_vector_ids or not company_vector_ids:
+        return 0
+    deleted = 0
+    for t in range(0, len(talent_vector_ids), batch_size):
+        for c in range(0, len(company_vector_ids), batch_size):
+            deleted += db.query(MatchingResult).filter(
+                MatchingResult.talent_vector_id.in_(talent_vector_ids[t:t + batch_size]),
+                MatchingResult.company_vector_id.in_(company_vector_ids[c:c + batch_size]),
+            ).delete(synchronize_session=False)
+    db.flush()
+    return deleted
+
+
 def count_matches_for_talent(db: Session, talent_user_id: int) -> int:
     """
     특정 인재의 매칭 결과 개수 조회
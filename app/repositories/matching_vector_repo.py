@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -68,6 +68,48 @@ def create(
     return row
 
 
+def get_by_keys(
+    db: Session, role: str, keys: Iterable[Tuple[int, Optional[int]]]
+) -> Dict[Tuple[int, Optional[int]], MatchingVector]:
+    """(user_id, job_posting_id) 목록에 해당하는 벡터를 한 번에 조회"""
+    keys = set(keys)
+    if not keys:
+        return {}
+    stmt = select(MatchingVector).where(
+        MatchingVector.role == role,
+        MatchingVector.user_id.in_(sorted({user_id for user_id, _ in keys})),
+    )
+    rows = db.execute(stmt).scalars().all()
+    return {(row.user_id, row.job_posting_id): row for row in rows if (row.user_id, row.job_posting_id) in keys}
+
+
+def get_by_ids(db: Session, ids: Sequence[int]) -> list[MatchingVector]:
+    """id 목록 → 벡터 (id 순), 쿼리 1회"""
+    if not ids:
+        return []
+    stmt = select(MatchingVector).where(MatchingVector.id.in_(list(ids))).order_by(MatchingVector.id)
+    return list(db.execute(stmt).scalars().all())
+
+
+def pending_rematch_ids(db: Session, after: int, limit: int) -> list[int]:
+    """needs_rematch 벡터 id (id keyset)"""
+    stmt = (
+        select(MatchingVector.id)
+        .where(MatchingVector.needs_rematch.is_(True), MatchingVector.id > after)
+        .order_by(MatchingVector.id)
+        .limit(limit)
+    )
+    return list(db.execute(stmt).scalars().all())
+
+
+def create_many(db: Session, role: str, items: Sequence[dict]) -> list[MatchingVector]:
+    """items = [{"user_id", "job_posting_id", "vector_*": ...}], flush 1회"""
+    rows = [MatchingVector(role=role, **item) for item in items]
+    db.add_all(rows)
+    db.flush()
+    return rows
+
+
 def update(
     db: Session,
     row: MatchingVector,
@@ -0,0 +1,91 @@
+"""
+revoked_tokens: 워커끼리 공유하는 토큰 revocation list
+- revoke(): 이 워커의 token_cache에 바로 반영 + 테이블에 기록 (요청 세션의 commit과 함께 저장)
+- 다른 워커는 sync_if_stale()이 TOKEN_REVOCATION_SYNC_SECONDS마다 백그라운드 스레드에서 created_at >= watermark 인 행을 읽어 반영
+  (그 사이에는 최대 TOKEN_REVOCATION_SYNC_SECONDS 만큼 다른 워커에서 토큰이 통과할 수 있다)
+- exp가 지난 행은 revoke() 때 함께 지운다
+"""
+
+from __future__ import annotations
+
+import calendar
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.core.token_cache import token_cache
+from app.db.session import SessionLocal
+from app.models.revoked_token import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+# created_at은 statement 시작 시각이라 늦게 commit된 트랜잭션은 watermark보다 과거 값을 가질 수 있다
+_SYNC_OVERLAP = timedelta(seconds=60)
+
+_state: Dict[str, Any] = {"watermark": None, "synced_at": 0.0}
+_sync_lock = threading.Lock()
+
+
+def revoke(db: Session, token: str, exp: Optional[float] = None) -> None:
+    expires_at = float(exp) if exp is not None else time.time() + settings.JWT_EXPIRE_MINUTES * 60
+    digest = token_cache.digest(token)
+    token_cache.revoke_digest(digest, expires_at)
+    db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= datetime.utcnow()))
+    db.merge(RevokedToken(token_digest=digest, expires_at=datetime.utcfromtimestamp(expires_at)))
+
+
+def sync(db: Session) -> int:
+    """watermark 이후 기록된(만료 전) revoke를 token_cache에 반영, 반영한 행 수"""
+    stmt = select(RevokedToken.token_digest, RevokedToken.expires_at, RevokedToken.created_at).where(
+        RevokedToken.expires_at > datetime.utcnow()
+    )
+    if _state["watermark"] is not None:
+        stmt = stmt.where(RevokedToken.created_at >= _state["watermark"] - _SYNC_OVERLAP)
+    count = 0
+    latest = None
+    for row in db.execute(stmt):
+        token_cache.revoke_digest(row.token_digest, calendar.timegm(row.expires_at.timetuple()))
+        if latest is None or row.created_at > latest:
+            latest = row.created_at
+        count += 1
+    if latest is not None:
+        _state["watermark"] = latest
+    _state["synced_at"] = time.time()
+    return count
+
+
+def sync_if_stale() -> Optional[threading.Thread]:
+    """마지막 sync 후 TOKEN_REVOCATION_SYNC_SECONDS가 지났으면 백그라운드 스레드에서 sync (요청은 기다리지 않음)"""
+    if time.time() - _state["synced_at"] < settings.TOKEN_REVOCATION_SYNC_SECONDS:
+        return None
+    if not _sync_lock.acquire(blocking=False):
+        return None  # 다른 요청이 sync 중
+    thread = threading.Thread(target=_sync_in_background, name="token-revocation-sync", daemon=True)
+    try:
+        thread.start()
+    except Exception:
+        _sync_lock.release()
+        raise
+    return thread
+
+
+def _sync_in_background() -> None:
+    try:
+        with SessionLocal() as db:
+            sync(db)
+    except Exception as e:
+        logger.warning(f"[TokenRevocation] sync failed: {e}")
+        # 실패해도 다음 시도는 interval 뒤로 (DB 장애 시 요청마다 스레드를 띄우지 않음)
+        _state["synced_at"] = time.time()
+    finally:
+        _sync_lock.release()
+
+
+def stats() -> Dict[str, Any]:
+    return {"watermark": _state["watermark"], "synced_at": _state["synced_at"]}
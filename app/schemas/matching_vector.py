@@ -40,6 +40,8 @@ class MatchingVectorOut(MatchingVectorBase):
     user_id: int
     role: str
     job_posting_id: Optional[int] = None
+    model_version: Optional[str] = None  # 벡터를 만든 모델 (필드별로 다르면 "mixed")
+    dims: Optional[int] = None
     updated_at: datetime
 
 
@@ -59,4 +61,6 @@ class MatchingVectorDetailOut(BaseModel):
     vector_career: Optional[Dict[str, Any]] = None
     vector_vision: Optional[Dict[str, Any]] = None
     vector_culture: Optional[Dict[str, Any]] = None
+    model_version: Optional[str] = None
+    dims: Optional[int] = None
     updated_at: datetime
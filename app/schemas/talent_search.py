@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class TalentSearchIn(BaseModel):
+    """기업용 인재 검색 요청 스키마 (job_posting_id 또는 query_vectors 중 하나)"""
+
+    # === 검색 기준 벡터 ===
+    job_posting_id: Optional[int] = Field(None, description="내 채용공고 ID (해당 공고의 매칭 벡터로 검색)")
+    query_vectors: Optional[Dict[str, List[float]]] = Field(
+        None, description="필드별 임의 벡터 (예: {\"vector_skills\": [...]}), 주어진 필드만 점수에 반영"
+    )
+
+    # === 구조화 필터 ===
+    desired_role: Optional[str] = Field(None, max_length=100, description="희망 직무 (부분 일치)")
+    residence_location: Optional[str] = Field(None, max_length=100, description="주거 지역 (부분 일치)")
+    desired_work_location: Optional[str] = Field(None, max_length=100, description="희망 근무 지역 (부분 일치)")
+    min_experience_years: Optional[int] = Field(None, ge=0, le=60, description="총 경력 연수 하한")
+    max_experience_years: Optional[int] = Field(None, ge=0, le=60, description="총 경력 연수 상한")
+    submitted_only: bool = Field(True, description="프로필 제출 완료한 인재만")
+
+    # === 페이지네이션 ===
+    min_score: float = Field(0.0, ge=0.0, le=100.0)
+    limit: int = Field(20, ge=1, le=100)
+    cursor: Optional[str] = None
+
+    model_config = ConfigDict(extra="forbid")
+
+    @model_validator(mode="after")
+    def _one_query(self) -> "TalentSearchIn":
+        if (self.job_posting_id is None) == (not self.query_vectors):
+            raise ValueError("exactly one of job_posting_id or query_vectors is required")
+        if (
+            self.min_experience_years is not None
+            and self.max_experience_years is not None
+            and self.min_experience_years > self.max_experience_years
+        ):
+            raise ValueError("min_experience_years must be <= max_experience_years")
+        return self
@@ -0,0 +1,313 @@
+"""
+카드 텍스트 → 매칭 벡터 6종 파이프라인
+- TalentCard / JobPostingCard의 필드를 벡터 카테고리별 텍스트로 묶어 encoder로 변환
+  (카테고리 텍스트가 비어 있으면 카드 전체 텍스트를 사용, 카드가 통째로 비어 있으면 건너뜀)
+- id keyset으로 EMBEDDING_BATCH_SIZE 씩 읽고, EMBEDDING_WORKERS > 1 이면 process pool에서 encode
+  (다음 배치를 읽는 동안 이전 배치를 encode, 대기 중인 배치는 workers × 2 개까지만)
+- 배치마다 matching_vector_service.bulk_upsert 후 commit
+- 공고 카드는 공고당 첫 번째 카드만 사용 (카드 PATCH API와 동일), 벡터 소유자는 기업 owner
+- 자동 매칭을 미루고 저장한 벡터는 needs_rematch=True로 남는다
+- backfill: model_version이 현재 encoder와 다른 벡터만 다시 인코딩하고,
+  전체 대상이 끝난 뒤에 needs_rematch 벡터를 한 번에 재매칭 (중간에는 서로 다른 버전끼리 비교하지 않도록)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.core.text_encoder import TextEncoder, get_encoder
+from app.models.company import Company
+from app.models.job_posting import JobPosting
+from app.models.job_posting_card import JobPostingCard
+from app.models.matching_vector import MatchingVector
+from app.models.talent_card import TalentCard
+from app.services import matching_vector_service
+from app.services.matching_vector_service import VECTOR_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# 벡터 카테고리 → 카드 컬럼
+TALENT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "vector_roles": ("header_title", "badge_title", "badge_employment", "headline"),
+    "vector_skills": ("job_skills", "general_capabilities"),
+    "vector_growth": ("growth_potential", "strengths"),
+    "vector_career": ("experiences", "performance_summary"),
+    "vector_vision": ("headline", "growth_potential"),
+    "vector_culture": ("collaboration_style", "general_capabilities"),
+}
+JOB_POSTING_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "vector_roles": ("header_title", "badge_role", "headline", "responsibilities"),
+    "vector_skills": ("requirements", "required_competencies"),
+    "vector_growth": ("challenge_task",),
+    "vector_career": ("posting_info", "requirements"),
+    "vector_vision": ("company_info",),
+    "vector_culture": ("talent_persona", "company_info"),
+}
+KINDS = ("talent", "job_posting")
+
+
+@dataclass
+class CardText:
+    user_id: int
+    job_posting_id: Optional[int]
+    texts: List[str]  # VECTOR_FIELDS 순서
+
+
+def _flatten(value: Any) -> List[str]:
+    """str / list / dict(JSON 컬럼) → 문자열 목록"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value] if value.strip() else []
+    if isinstance(value, dict):
+        return [s for v in value.values() for s in _flatten(v)]
+    if isinstance(value, (list, tuple)):
+        return [s for v in value for s in _flatten(v)]
+    return [str(value)]
+
+
+def card_texts(card: Any, mapping: Dict[str, Tuple[str, ...]]) -> Optional[List[str]]:
+    """카테고리별 텍스트 (VECTOR_FIELDS 순서), 카드가 비어 있으면 None"""
+    texts = ["\n".join(s for column in mapping[field] for s in _flatten(getattr(card, column))) for field in VECTOR_FIELDS]
+    columns = dict.fromkeys(column for field in VECTOR_FIELDS for column in mapping[field])
+    whole = "\n".join(s for column in columns for s in _flatten(getattr(card, column)))
+    if not whole.strip():
+        return None
+    return [text if text.strip() else whole for text in texts]
+
+
+def _talent_batches(db: Session, batch_size: int, ids: Optional[Sequence[int]]) -> Iterator[List[CardText]]:
+    after = 0
+    while True:
+        stmt = select(TalentCard).where(TalentCard.id > after).order_by(TalentCard.id).limit(batch_size)
+        if ids is not None:
+            stmt = stmt.where(TalentCard.id.in_(list(ids)))
+        cards = db.execute(stmt).scalars().all()
+        if not cards:
+            return
+        after = cards[-1].id
+        yield [
+            CardText(card.user_id, None, texts)
+            for card in cards
+            if (texts := card_texts(card, TALENT_FIELDS)) is not None
+        ]
+
+
+def _job_posting_batches(db: Session, batch_size: int, ids: Optional[Sequence[int]]) -> Iterator[List[CardText]]:
+    first_cards = _first_posting_cards()
+    after = 0
+    while True:
+        stmt = (
+            select(JobPostingCard, Company.owner_user_id)
+            .join(JobPosting, JobPosting.id == JobPostingCard.job_posting_id)
+            .join(Company, Company.id == JobPosting.company_id)
+            .where(JobPostingCard.id > after, JobPostingCard.id.in_(first_cards), JobPosting.deleted_at.is_(None))
+            .order_by(JobPostingCard.id)
+            .limit(batch_size)
+        )
+        if ids is not None:
+            stmt = stmt.where(JobPostingCard.id.in_(list(ids)))
+        rows = db.execute(stmt).all()
+        if not rows:
+            return
+        after = rows[-1][0].id
+        yield [
+            CardText(owner_user_id, card.job_posting_id, texts)
+            for card, owner_user_id in rows
+            if (texts := card_texts(card, JOB_POSTING_FIELDS)) is not None
+        ]
+
+
+def _stale(model: str):
+    return or_(MatchingVector.model_version.is_(None), MatchingVector.model_version != model)
+
+
+def _first_posting_cards():
+    return select(func.min(JobPostingCard.id)).group_by(JobPostingCard.job_posting_id)
+
+
+def _stale_batches(db: Session, kind: str, model: str, batch_size: int) -> Iterator[List[CardText]]:
+    """model_version != model 인 벡터를 id keyset으로 읽고 원본 카드와 묶는다 (카드가 없는 벡터는 건너뜀)"""
+    role = "talent" if kind == "talent" else "company"
+    after = 0
+    while True:
+        if kind == "talent":
+            stmt = select(MatchingVector.id, MatchingVector.user_id, MatchingVector.job_posting_id, TalentCard).join(
+                TalentCard, TalentCard.user_id == MatchingVector.user_id
+            )
+            mapping = TALENT_FIELDS
+        else:
+            stmt = select(MatchingVector.id, MatchingVector.user_id, MatchingVector.job_posting_id, JobPostingCard).join(
+                JobPostingCard, JobPostingCard.job_posting_id == MatchingVector.job_posting_id
+            ).where(JobPostingCard.id.in_(_first_posting_cards()))
+            mapping = JOB_POSTING_FIELDS
+        stmt = (
+            stmt.where(MatchingVector.role == role, MatchingVector.id > after, _stale(model))
+            .order_by(MatchingVector.id)
+            .limit(batch_size)
+        )
+        rows = db.execute(stmt).all()
+        if not rows:
+            return
+        after = rows[-1][0]
+        yield [
+            CardText(user_id, job_posting_id, texts)
+            for _, user_id, job_posting_id, card in rows
+            if (texts := card_texts(card, mapping)) is not None
+        ]
+
+
+def _encode(encoder: TextEncoder, batch: List[CardText]) -> np.ndarray:
+    """(카드 수, 6, dims), process pool worker에서도 호출되므로 모듈 최상위 함수"""
+    texts = [text for card in batch for text in card.texts]
+    return encoder.encode(texts).reshape(len(batch), len(VECTOR_FIELDS), encoder.dims)
+
+
+def _items(batch: List[CardText], vectors: np.ndarray, model: str) -> List[Dict[str, Any]]:
+    return [
+        {
+            "user_id": card.user_id,
+            "job_posting_id": card.job_posting_id,
+            **{
+                field: {"vector": np.round(vectors[i, k], 6).tolist(), "model": model}
+                for k, field in enumerate(VECTOR_FIELDS)
+            },
+        }
+        for i, card in enumerate(batch)
+    ]
+
+
+def _write_batches(
+    db: Session,
+    role: str,
+    batches: Iterator[List[CardText]],
+    encoder: TextEncoder,
+    workers: int,
+    rematch: bool,
+) -> Dict[str, int]:
+    """encode → bulk_upsert → commit 반복, 건수 합계"""
+    totals = {"cards": 0, "created": 0, "updated": 0}
+
+    def write(batch: List[CardText], vectors: np.ndarray) -> None:
+        if not batch:
+            return
+        result = matching_vector_service.bulk_upsert(db, role, _items(batch, vectors, encoder.name), rematch=rematch)
+        db.commit()
+        totals["cards"] += len(batch)
+        totals["created"] += result["created"]
+        totals["updated"] += result["updated"]
+
+    if workers <= 1:
+        for batch in batches:
+            write(batch, _encode(encoder, batch) if batch else None)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: deque = deque()
+            for batch in batches:
+                pending.append((batch, pool.submit(_encode, encoder, batch)))
+                if len(pending) >= workers * 2:
+                    done, future = pending.popleft()
+                    write(done, future.result())
+            while pending:
+                done, future = pending.popleft()
+                write(done, future.result())
+    return totals
+
+
+def _summary(started: float, **values: Any) -> Dict[str, Any]:
+    seconds = time.perf_counter() - started
+    return {
+        **values,
+        "seconds": round(seconds, 3),
+        "cards_per_minute": round(values["cards"] / seconds * 60, 1) if seconds > 0 else None,
+    }
+
+
+def run(
+    db: Session,
+    kind: str,
+    encoder: Optional[TextEncoder] = None,
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    ids: Optional[Sequence[int]] = None,
+    rematch: bool = False,
+) -> Dict[str, Any]:
+    """
+    kind(talent / job_posting) 카드 전체(또는 ids)를 벡터화해서 저장
+    - 배치마다 commit 하므로 중간에 실패해도 앞 배치 결과는 남는다
+    - rematch=True면 저장한 벡터마다 자동 매칭까지 수행 (대량 실행 시 느림),
+      아니면 needs_rematch로 표시만 해 두고 backfill / rematch_pending에서 재계산
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {KINDS}")
+    encoder = encoder or get_encoder(settings.EMBEDDING_ENCODER, settings.EMBEDDING_DIMS)
+    batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+    workers = workers if workers is not None else settings.EMBEDDING_WORKERS
+    role = "talent" if kind == "talent" else "company"
+    batches = (_talent_batches if kind == "talent" else _job_posting_batches)(db, batch_size, ids)
+
+    started = time.perf_counter()
+    totals = _write_batches(db, role, batches, encoder, workers, rematch)
+    summary = _summary(started, kind=kind, model=encoder.name, **totals)
+    logger.info(f"[CardEmbedding] {summary}")
+    return summary
+
+
+def count_stale(db: Session, model: str) -> Dict[str, int]:
+    """role별 model_version != model 인 벡터 수"""
+    rows = db.execute(
+        select(MatchingVector.role, func.count()).where(_stale(model)).group_by(MatchingVector.role)
+    ).all()
+    return {role: int(count) for role, count in rows}
+
+
+def backfill(
+    db: Session,
+    encoder: Optional[TextEncoder] = None,
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    rematch: bool = True,
+) -> Dict[str, Any]:
+    """
+    현재 encoder와 모델 버전이 다른 벡터만 원본 카드로 다시 인코딩
+    - 배치마다 commit, 재인코딩한 벡터는 needs_rematch로 표시
+    - 모든 대상을 다 바꾼 뒤 needs_rematch 벡터를 한 번에 재매칭 (rematch=False면 표시만 남김)
+    - 원본 카드가 없는 벡터(API로 직접 넣은 벡터 등)는 그대로 두고 skipped로 집계
+    - 중간에 중단돼도 다시 실행하면 남은 벡터의 재인코딩 + 이전 실행분까지 재매칭된다
+    """
+    encoder = encoder or get_encoder(settings.EMBEDDING_ENCODER, settings.EMBEDDING_DIMS)
+    batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+    workers = workers if workers is not None else settings.EMBEDDING_WORKERS
+
+    started = time.perf_counter()
+    stale = count_stale(db, encoder.name)
+    totals = {"cards": 0, "created": 0, "updated": 0}
+    for kind in KINDS:
+        role = "talent" if kind == "talent" else "company"
+        written = _write_batches(
+            db, role, _stale_batches(db, kind, encoder.name, batch_size), encoder, workers, rematch=False
+        )
+        for key, value in written.items():
+            totals[key] += value
+
+    rematched = matching_vector_service.rematch_pending(db) if rematch else 0
+    summary = _summary(
+        started,
+        model=encoder.name,
+        stale=sum(stale.values()),
+        skipped=sum(stale.values()) - totals["cards"],
+        rematched=rematched,
+        **totals,
+    )
+    logger.info(f"[CardEmbedding] backfill {summary}")
+    return summary
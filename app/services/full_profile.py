@@ -31,7 +31,7 @@ def _bulk_delete_insert(session, model, user_id: int, rows: Iterable[dict]):
 
 
 def save_full_profile(user_id: int, payload: FullProfileIn) -> FullProfileOut:
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             # Upsert talent profile
             profile = session.get(TalentProfile, user_id)
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+from datetime import date
+
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.bitmap_index import from_ids, iter_ids
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.settings import settings
+from app.models.enums import LocationEnum, SalaryRangeEnum
 from app.repositories import company_repo
+from app.repositories import job_posting_index
 from app.repositories import job_posting_repo
 
 ALLOWED_EMPLOYMENT = {
@@ -23,6 +31,15 @@ ALLOWED_EMPLOYMENT = {
 }
 
 ALLOWED_STATUS = {"DRAFT", "PUBLISHED", "CLOSED", "ARCHIVED"}
+# 공개 검색에서 조회 가능한 상태 (DRAFT/ARCHIVED는 작성 기업만)
+SEARCHABLE_STATUS = {"PUBLISHED", "CLOSED"}
+ALLOWED_LOCATION = {e.value for e in LocationEnum}
+ALLOWED_SALARY = {e.value for e in SalaryRangeEnum}
+FACET_FIELDS = ("location_city", "employment_type", "career_level", "education_level", "salary_range")
+
+_facets_cache = TTLCache(
+    maxsize=settings.JOB_POSTING_FACETS_CACHE_SIZE, ttl=settings.JOB_POSTING_FACETS_CACHE_TTL_SECONDS
+)
 
 
 def _val_error(msg: str) -> HTTPException:
@@ -116,3 +133,222 @@ def delete(db: Session, owner_user_id: int, posting_id: int):
 
     posting = job_posting_repo.soft_delete(db, posting)
     return posting
+
+
+def _decode_search_cursor(cursor: str) -> tuple[float, int]:
+    values = decode_cursor(cursor, size=2)
+    try:
+        return float(values[0]), int(values[1])
+    except (TypeError, ValueError):
+        raise _val_error("cursor invalid")
+
+
+def _search_filters(
+    statuses: list[str] | None,
+    location_city: list[str] | None,
+    employment_type: list[str] | None,
+    career_level: list[str] | None,
+    education_level: list[str] | None,
+    salary_range: list[str] | None,
+    deadline_from: date | None,
+    deadline_to: date | None,
+) -> dict[str, list[str]]:
+    """검색 조건 검증 → 컬럼명별 허용 값 목록 (status 기본 PUBLISHED)"""
+    statuses = statuses or ["PUBLISHED"]
+    for value_set, values, name in (
+        (SEARCHABLE_STATUS, statuses, "status"),
+        (ALLOWED_LOCATION, location_city, "location_city"),
+        (ALLOWED_EMPLOYMENT, employment_type, "employment_type"),
+        (ALLOWED_SALARY, salary_range, "salary_range"),
+    ):
+        if values and any(v not in value_set for v in values):
+            raise _val_error(f"{name} invalid")
+    if deadline_from and deadline_to and deadline_from > deadline_to:
+        raise _val_error("deadline_from must be before deadline_to")
+    return {
+        "status": statuses,
+        "location_city": location_city or [],
+        "employment_type": employment_type or [],
+        "career_level": career_level or [],
+        "education_level": education_level or [],
+        "salary_range": salary_range or [],
+    }
+
+
+def search(
+    db: Session,
+    *,
+    keyword: str | None = None,
+    statuses: list[str] | None = None,
+    location_city: list[str] | None = None,
+    employment_type: list[str] | None = None,
+    career_level: list[str] | None = None,
+    education_level: list[str] | None = None,
+    salary_range: list[str] | None = None,
+    deadline_from: date | None = None,
+    deadline_to: date | None = None,
+    open_only: bool = True,
+    cursor: str | None = None,
+    limit: int = 20,
+):
+    """
+    공고 검색 (공개 API용)
+    - 같은 필터 안의 값은 OR, 필터끼리는 AND
+    - keyword가 있으면 관련도 순, 없으면 최신순
+    - 다음 페이지가 있으면 next_cursor 반환 (같은 검색 조건으로 cursor만 바꿔 호출)
+    """
+    filters = _search_filters(
+        statuses, location_city, employment_type, career_level, education_level, salary_range, deadline_from, deadline_to
+    )
+    keyword = (keyword or "").strip() or None
+    after = _decode_search_cursor(cursor) if cursor else None
+
+    # bitmap index로 enum 조건을 먼저 교집합 → 후보가 없으면 SQL 생략, 적으면 id IN (...)으로 범위 축소
+    candidate_ids = None
+    if job_posting_index.ready():
+        job_posting_index.refresh_if_stale()
+        bits = job_posting_index.index.match(filters)
+        if not bits:
+            return [], None
+        if bits.bit_count() <= settings.JOB_POSTING_INDEX_MAX_IN:
+            candidate_ids = iter_ids(bits)
+
+    rows = job_posting_repo.search(
+        db,
+        filters=filters,
+        keyword=keyword,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+        open_on=date.today() if open_only else None,
+        after=after,
+        limit=limit + 1,
+        candidate_ids=candidate_ids,
+    )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_posting, last_relevance = rows[-1]
+        next_cursor = encode_cursor(last_relevance, last_posting.id)
+    return rows, next_cursor
+
+
+def _sorted_counts(counts: dict) -> list[dict]:
+    items = [(value, count) for value, count in counts.items() if value is not None and count]
+    items.sort(key=lambda item: (-item[1], str(item[0])))
+    return [{"value": value, "count": count} for value, count in items]
+
+
+def _facets_from_index(db: Session, filters: dict, keyword, deadline_from, deadline_to, open_on) -> dict:
+    """
+    bitmap index popcount로 facet 집계
+    - enum 조건은 index에서, 키워드/마감일 조건은 SQL로 id만 한 번 읽어 bitset으로 만든 뒤 교집합
+    """
+    job_posting_index.refresh_if_stale()
+    extra = None
+    if keyword or deadline_from or deadline_to or open_on:
+        extra = from_ids(
+            job_posting_repo.search_ids(
+                db,
+                filters={"status": filters["status"]},
+                keyword=keyword,
+                deadline_from=deadline_from,
+                deadline_to=deadline_to,
+                open_on=open_on,
+            )
+        )
+
+    index = job_posting_index.index
+
+    def matched(conditions: dict) -> int:
+        bits = index.match(conditions)
+        return bits & extra if extra is not None else bits
+
+    return {
+        "total": matched(filters).bit_count(),
+        "facets": {
+            field: _sorted_counts(index.counts(field, matched({**filters, field: []})))
+            for field in FACET_FIELDS
+        },
+    }
+
+
+def _facets_from_groups(db: Session, filters: dict, keyword, deadline_from, deadline_to, open_on) -> dict:
+    """index가 없을 때: facet 컬럼 조합별 GROUP BY 한 번 → 조합마다 다른 facet 조건을 확인하며 합산"""
+    rows = job_posting_repo.search_group_counts(
+        db,
+        FACET_FIELDS,
+        filters={"status": filters["status"]},
+        keyword=keyword,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+        open_on=open_on,
+    )
+    allowed = [set(filters[field]) for field in FACET_FIELDS]
+    counts: list[dict] = [{} for _ in FACET_FIELDS]
+    total = 0
+    for *values, count in rows:
+        passed = [not allowed[i] or value in allowed[i] for i, value in enumerate(values)]
+        failed = passed.count(False)
+        if failed == 0:
+            total += count
+        for i, value in enumerate(values):
+            # 자기 facet 조건은 빼고 나머지 facet 조건을 모두 통과한 조합만 센다
+            if failed == 0 or (failed == 1 and not passed[i]):
+                counts[i][value] = counts[i].get(value, 0) + count
+    return {
+        "total": total,
+        "facets": {field: _sorted_counts(counts[i]) for i, field in enumerate(FACET_FIELDS)},
+    }
+
+
+def facets(
+    db: Session,
+    *,
+    keyword: str | None = None,
+    statuses: list[str] | None = None,
+    location_city: list[str] | None = None,
+    employment_type: list[str] | None = None,
+    career_level: list[str] | None = None,
+    education_level: list[str] | None = None,
+    salary_range: list[str] | None = None,
+    deadline_from: date | None = None,
+    deadline_to: date | None = None,
+    open_only: bool = True,
+):
+    """
+    공고 검색 facet 별 건수 (search()와 같은 조건)
+    - 각 facet의 건수는 그 facet 자신의 조건만 빼고 계산 (서울을 선택해도 다른 지역 건수가 보이도록)
+    - total: 모든 조건을 적용한 건수
+    - 같은 조건은 JOB_POSTING_FACETS_CACHE_TTL_SECONDS 동안 캐시
+    """
+    filters = _search_filters(
+        statuses, location_city, employment_type, career_level, education_level, salary_range, deadline_from, deadline_to
+    )
+    keyword = (keyword or "").strip() or None
+    open_on = date.today() if open_only else None
+
+    key = (
+        keyword,
+        deadline_from,
+        deadline_to,
+        open_on,
+        tuple((field, tuple(sorted(set(values)))) for field, values in filters.items()),
+    )
+    cached = _facets_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if job_posting_index.ready():
+        result = _facets_from_index(db, filters, keyword, deadline_from, deadline_to, open_on)
+    else:
+        result = _facets_from_groups(db, filters, keyword, deadline_from, deadline_to, open_on)
+    _facets_cache.set(key, result)
+    return result
+
+
+def facets_cache_stats() -> dict:
+    return _facets_cache.stats()
+
+
+def clear_facets_cache() -> None:
+    _facets_cache.clear()
@@ -0,0 +1,313 @@
+"""
+자동 매칭 hard constraint (인재 희망 조건 → 공고/기업 속성)
+- location     : desired_work_location  ↔ JobPosting.location_city
+- salary       : desired_salary(최소)   ↔ JobPosting.salary_range 상한
+- company_size : desired_company_size   ↔ Company.size (구간이 겹치면 통과)
+- industry     : desired_industry       ↔ Company.industry (단어 경계 기준 포함 여부)
+
+희망 조건이 비어 있거나 해석할 수 없으면(예: "무관", "협의") 해당 조건은 적용하지 않는다.
+공고/기업 쪽 값이 없거나 "연봉 추후 협상"인 경우도 통과시킨다.
+MATCHING_HARD_CONSTRAINTS에 나열된 조건만 사용하며, 비어 있으면 전체 비활성화.
+
+후보 배열(벡터 id별 속성)은 값 종류가 적으므로 고유값마다 한 번만 판정하고 np.unique inverse로 펼쳐서 mask를 만든다.
+속성은 호출자가 이미 고른 후보 벡터 id에 대해서만 IN_BATCH_SIZE개씩 join 쿼리로 읽는다.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.company import Company
+from app.models.enums import LocationEnum, SalaryRangeEnum
+from app.models.job_posting import JobPosting
+from app.models.matching_vector import MatchingVector
+from app.models.profile import TalentProfile
+
+CONSTRAINT_FIELDS = ("location", "salary", "company_size", "industry")
+
+_LOCATIONS = tuple(e.value for e in LocationEnum)
+_ANY = ("무관", "전국", "협의", "상관없음")
+_RE_AMOUNT = re.compile(r"(\d+(?:\.\d+)?)\s*(억|만|천)?")
+_UNITS = {"억": 10000.0, "천": 1000.0}
+_RE_INDUSTRY_SPLIT = re.compile(r"[,/|·]|\s+또는\s+")
+_RE_WORD = re.compile(r"\w+")
+IN_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Preferences:
+    locations: Optional[FrozenSet[str]] = None
+    min_salary: Optional[float] = None  # 만원
+    company_size: Optional[Tuple[float, float]] = None  # 인원 (하한, 상한)
+    industries: Optional[Tuple[str, ...]] = None
+
+    def is_empty(self) -> bool:
+        return not (self.locations or self.min_salary or self.company_size or self.industries)
+
+
+def enabled_constraints() -> FrozenSet[str]:
+    raw = {item.strip() for item in settings.MATCHING_HARD_CONSTRAINTS.split(",") if item.strip()}
+    return frozenset(raw & set(CONSTRAINT_FIELDS))
+
+
+def _is_any(text: Optional[str]) -> bool:
+    return not text or not text.strip() or any(word in text for word in _ANY)
+
+
+def _amounts(text: str) -> list[float]:
+    """
+    '5,000만원 이상' → [5000], '1.2억' → [12000] (만원 단위)
+    - 억 바로 뒤(공백만 사이)의 천/만 단위는 같은 금액: '1억 2천만원', '1억2000만원' → [12000]
+    """
+    text = text.replace(",", "")
+    values: list[float] = []
+    prev_unit, prev_end = None, 0
+    for match in _RE_AMOUNT.finditer(text):
+        number, unit = match.groups()
+        value = float(number) * _UNITS.get(unit, 1.0)
+        if prev_unit == "억" and unit != "억" and not text[prev_end:match.start()].strip():
+            values[-1] += value
+        else:
+            values.append(value)
+        prev_unit, prev_end = unit, match.end()
+    return values
+
+
+def parse_locations(text: Optional[str]) -> Optional[FrozenSet[str]]:
+    """'서울·경기 전체' → {'서울', '경기'}, 지역명을 찾지 못하면 None"""
+    if _is_any(text):
+        return None
+    found = frozenset(loc for loc in _LOCATIONS if loc in text)
+    return found or None
+
+
+def parse_min_salary(text: Optional[str]) -> Optional[float]:
+    if _is_any(text):
+        return None
+    values = _amounts(text)
+    return min(values) if values else None
+
+
+def parse_headcount(text: Optional[str]) -> Optional[Tuple[float, float]]:
+    """'51~200명' → (51, 200), '1000명 이상' → (1000, inf), '50명 이하' → (0, 50)"""
+    if _is_any(text):
+        return None
+    numbers = [float(n) for n in re.findall(r"\d+", text.replace(",", ""))]
+    if not numbers:
+        return None
+    if len(numbers) >= 2:
+        return min(numbers), max(numbers)
+    if "이하" in text or "미만" in text:
+        return 0.0, numbers[0]
+    return numbers[0], float("inf")
+
+
+def parse_industries(text: Optional[str]) -> Optional[Tuple[str, ...]]:
+    if _is_any(text):
+        return None
+    tokens = tuple(t.strip().lower() for t in _RE_INDUSTRY_SPLIT.split(text) if t.strip())
+    return tokens or None
+
+
+def parse_preferences(
+    work_location: Optional[str],
+    salary: Optional[str],
+    company_size: Optional[str],
+    industry: Optional[str],
+    constraints: FrozenSet[str],
+) -> Preferences:
+    return Preferences(
+        locations=parse_locations(work_location) if "location" in constraints else None,
+        min_salary=parse_min_salary(salary) if "salary" in constraints else None,
+        company_size=parse_headcount(company_size) if "company_size" in constraints else None,
+        industries=parse_industries(industry) if "industry" in constraints else None,
+    )
+
+
+# ------------------------------------------------------------
+# 공고/기업 쪽 값 판정
+# ------------------------------------------------------------
+
+def salary_upper_bound(salary_range: Optional[str]) -> Optional[float]:
+    """SalaryRangeEnum 값의 상한 (만원), '이상'이면 inf, 협상/미기재면 None"""
+    if not salary_range or salary_range == SalaryRangeEnum.NEGOTIABLE.value:
+        return None
+    if "이상" in salary_range:
+        return float("inf")
+    values = _amounts(salary_range)
+    return max(values) if values else None
+
+
+def salary_ok(min_salary: Optional[float], salary_range: Optional[str]) -> bool:
+    upper = salary_upper_bound(salary_range)
+    return min_salary is None or upper is None or upper >= min_salary
+
+
+def company_size_ok(wanted: Optional[Tuple[float, float]], size: Optional[str]) -> bool:
+    actual = parse_headcount(size)
+    if wanted is None or actual is None:
+        return True
+    return actual[0] <= wanted[1] and actual[1] >= wanted[0]
+
+
+def _words(text: str) -> Tuple[str, ...]:
+    return tuple(_RE_WORD.findall(text.lower()))
+
+
+def _contains_words(words: Tuple[str, ...], part: Tuple[str, ...]) -> bool:
+    n = len(part)
+    return n > 0 and any(words[i:i + n] == part for i in range(len(words) - n + 1))
+
+
+def industry_ok(wanted: Optional[Tuple[str, ...]], industry: Optional[str]) -> bool:
+    """단어 단위로 한쪽이 다른 쪽에 연속해서 포함되면 통과 ('IT' ↔ 'IT 서비스', 'IT' ↛ 'Digital Media')"""
+    if not wanted or not industry or not industry.strip():
+        return True
+    words = _words(industry)
+    return any(_contains_words(words, _words(token)) or _contains_words(_words(token), words) for token in wanted)
+
+
+def location_ok(wanted: Optional[FrozenSet[str]], location: Optional[str]) -> bool:
+    return not wanted or not location or location in wanted
+
+
+# ------------------------------------------------------------
+# 후보 mask
+# ------------------------------------------------------------
+
+def _lookup(values: Sequence[Optional[str]], predicate: Callable[[Optional[str]], bool]) -> np.ndarray:
+    """고유값마다 predicate를 한 번만 계산하고 inverse index로 전체 후보에 펼친다"""
+    if len(values) == 0:
+        return np.ones(0, dtype=bool)
+    unique, inverse = np.unique(np.asarray([v or "" for v in values], dtype=str), return_inverse=True)
+    decided = np.fromiter((predicate(v or None) for v in unique), dtype=bool, count=len(unique))
+    return decided[inverse]
+
+
+def company_candidate_mask(
+    prefs: Preferences,
+    locations: Sequence[Optional[str]],
+    salary_ranges: Sequence[Optional[str]],
+    sizes: Sequence[Optional[str]],
+    industries: Sequence[Optional[str]],
+) -> np.ndarray:
+    """인재 1명의 희망 조건 × 공고/기업 후보 N개 → 통과 여부 bool[N]"""
+    mask = np.ones(len(locations), dtype=bool)
+    if prefs.locations:
+        mask &= _lookup(locations, lambda v: location_ok(prefs.locations, v))
+    if prefs.min_salary:
+        mask &= _lookup(salary_ranges, lambda v: salary_ok(prefs.min_salary, v))
+    if prefs.company_size:
+        mask &= _lookup(sizes, lambda v: company_size_ok(prefs.company_size, v))
+    if prefs.industries:
+        mask &= _lookup(industries, lambda v: industry_ok(prefs.industries, v))
+    return mask
+
+
+def talent_candidate_mask(
+    constraints: FrozenSet[str],
+    location: Optional[str],
+    salary_range: Optional[str],
+    size: Optional[str],
+    industry: Optional[str],
+    desired_locations: Sequence[Optional[str]],
+    desired_salaries: Sequence[Optional[str]],
+    desired_sizes: Sequence[Optional[str]],
+    desired_industries: Sequence[Optional[str]],
+) -> np.ndarray:
+    """공고 1개 × 인재 후보 N명의 희망 조건(원문) → 통과 여부 bool[N]"""
+    mask = np.ones(len(desired_locations), dtype=bool)
+    if "location" in constraints:
+        mask &= _lookup(desired_locations, lambda v: location_ok(parse_locations(v), location))
+    if "salary" in constraints:
+        mask &= _lookup(desired_salaries, lambda v: salary_ok(parse_min_salary(v), salary_range))
+    if "company_size" in constraints:
+        mask &= _lookup(desired_sizes, lambda v: company_size_ok(parse_headcount(v), size))
+    if "industry" in constraints:
+        mask &= _lookup(desired_industries, lambda v: industry_ok(parse_industries(v), industry))
+    return mask
+
+
+def _excluded(ids: Sequence[int], mask: np.ndarray) -> Set[int]:
+    return set(np.asarray(ids, dtype=np.int64)[~mask].tolist())
+
+
+def _rows_for(db: Session, stmt, candidate_ids: Sequence[int]) -> list:
+    """후보 id만 IN_BATCH_SIZE개씩 나눠 조회 (IN 목록 길이 제한)"""
+    rows = []
+    for start in range(0, len(candidate_ids), IN_BATCH_SIZE):
+        rows.extend(db.execute(stmt.where(MatchingVector.id.in_(candidate_ids[start:start + IN_BATCH_SIZE]))).all())
+    return rows
+
+
+def excluded_company_vectors(
+    db: Session, talent_user_id: int, candidate_ids: Sequence[int], constraints: FrozenSet[str]
+) -> Set[int]:
+    """후보 company 벡터 중 인재의 희망 조건을 만족하지 않는 벡터 id"""
+    profile = db.execute(
+        select(
+            TalentProfile.desired_work_location,
+            TalentProfile.desired_salary,
+            TalentProfile.desired_company_size,
+            TalentProfile.desired_industry,
+        ).where(TalentProfile.user_id == talent_user_id)
+    ).first()
+    if profile is None:
+        return set()
+    prefs = parse_preferences(*profile, constraints=constraints)
+    if prefs.is_empty() or not candidate_ids:
+        return set()
+
+    rows = _rows_for(
+        db,
+        select(MatchingVector.id, JobPosting.location_city, JobPosting.salary_range, Company.size, Company.industry)
+        .select_from(MatchingVector)
+        .outerjoin(JobPosting, JobPosting.id == MatchingVector.job_posting_id)
+        .outerjoin(Company, Company.id == JobPosting.company_id),
+        candidate_ids,
+    )
+    if not rows:
+        return set()
+    ids, locations, salaries, sizes, industries = zip(*rows)
+    return _excluded(ids, company_candidate_mask(prefs, locations, salaries, sizes, industries))
+
+
+def excluded_talent_vectors(
+    db: Session, job_posting_id: Optional[int], candidate_ids: Sequence[int], constraints: FrozenSet[str]
+) -> Set[int]:
+    """후보 talent 벡터 중 공고/기업 속성이 희망 조건에 맞지 않는 벡터 id"""
+    if job_posting_id is None or not candidate_ids:
+        return set()
+    posting = db.execute(
+        select(JobPosting.location_city, JobPosting.salary_range, Company.size, Company.industry)
+        .select_from(JobPosting)
+        .outerjoin(Company, Company.id == JobPosting.company_id)
+        .where(JobPosting.id == job_posting_id)
+    ).first()
+    if posting is None:
+        return set()
+
+    rows = _rows_for(
+        db,
+        select(
+            MatchingVector.id,
+            TalentProfile.desired_work_location,
+            TalentProfile.desired_salary,
+            TalentProfile.desired_company_size,
+            TalentProfile.desired_industry,
+        )
+        .select_from(MatchingVector)
+        .outerjoin(TalentProfile, TalentProfile.user_id == MatchingVector.user_id),
+        candidate_ids,
+    )
+    if not rows:
+        return set()
+    ids, locations, salaries, sizes, industries = zip(*rows)
+    return _excluded(ids, talent_candidate_mask(constraints, *posting, locations, salaries, sizes, industries))
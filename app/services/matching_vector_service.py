@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from fastapi import HTTPException, status
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
+from app.core import memory, metrics, sparse_vector
 from app.repositories import matching_vector_repo
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,8 @@ VECTOR_FIELDS = (
     "vector_vision",
     "vector_culture",
 )
+# 필드별 모델이 서로 다른 벡터의 model_version 값 (자동 매칭 후보를 모델로 좁히지 않음)
+MIXED_VERSION = "mixed"
 
 
 def _error(status_code: int, code: str, message: str) -> HTTPException:
@@ -34,7 +39,53 @@ def _require_owned(db_row, user_id: int):
 
 
 def _filter_payload(data: Dict[str, Any]) -> Dict[str, Any]:
-    return {field: data[field] for field in VECTOR_FIELDS if field in data}
+    return {field: _stamp_dim(field, data[field]) for field in VECTOR_FIELDS if field in data}
+
+
+def _stamp_dim(field: str, raw: Any) -> Any:
+    """
+    {"vector": [...]} 에 "dim"을 채운다 (요청에 dim이 있으면 길이와 같아야 함)
+    sparse ({"indices", "values", "dim"})는 index 정렬 + 0 값 제거 형식으로 저장
+    """
+    if sparse_vector.is_sparse(raw):
+        try:
+            return sparse_vector.normalize(raw)
+        except ValueError as e:
+            raise _error(status.HTTP_422_UNPROCESSABLE_ENTITY, "INVALID_VECTOR_DATA", f"{field}: {e}") from None
+    if not isinstance(raw, dict) or not isinstance(raw.get("vector"), list):
+        return raw
+    dim = len(raw["vector"])
+    if raw.get("dim") is not None and raw["dim"] != dim:
+        raise _error(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            "INVALID_VECTOR_DATA",
+            f"{field} dim ({raw['dim']}) does not match vector length ({dim})",
+        )
+    return {**raw, "dim": dim}
+
+
+def field_version(raw: Any) -> Tuple[Optional[str], Optional[int]]:
+    """벡터 필드의 (model, dim), 모델 표시가 없는 벡터는 model=None"""
+    if isinstance(raw, list):
+        return None, len(raw)
+    if not isinstance(raw, dict):
+        return None, None
+    values = raw.get("vector", raw.get("values"))
+    dim = raw.get("dim", len(values) if isinstance(values, list) else None)
+    return raw.get("model"), dim
+
+
+def version_columns(values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    필드 값들 → 행 단위 model_version / dims 컬럼
+    - 모든 필드가 같은 모델이면 그 모델, 섞여 있으면 MIXED_VERSION, 모델 표시가 없으면 NULL
+    - dims는 모든 필드 차원이 같을 때만
+    """
+    versions = [field_version(values.get(field)) for field in VECTOR_FIELDS if values.get(field) is not None]
+    models = {model for model, _ in versions}
+    dims = {dim for _, dim in versions}
+    model_version = None if models <= {None} else (models.pop() if len(models) == 1 else MIXED_VERSION)
+    return {"model_version": model_version, "dims": dims.pop() if len(dims) == 1 else None}
 
 
 def create(db: Session, user_id: int, role: str, payload: Dict[str, Any]):
@@ -91,7 +142,8 @@ def create(db: Session, user_id: int, role: str, payload: Dict[str, Any]):
     # Ensure payload uses only allowed fields
     filtered = _filter_payload(payload)
     row = matching_vector_repo.create(
-        db, user_id=user_id, role=role, job_posting_id=job_posting_id, payload=filtered
+        db, user_id=user_id, role=role, job_posting_id=job_posting_id,
+        payload={**filtered, **version_columns(filtered)},
     )
     
     # ✅ 벡터 생성 후 자동 매칭 계산
@@ -115,7 +167,8 @@ def update(db: Session, user_id: int, matching_vector_id: int, payload: Dict[str
     if not filtered:
         raise _error(status.HTTP_422_UNPROCESSABLE_ENTITY, "NO_FIELDS_TO_UPDATE", "Provide at least one field to update")
 
-    result = matching_vector_repo.update(db, row=row, payload=filtered)
+    merged = {**{field: getattr(row, field) for field in VECTOR_FIELDS}, **filtered}
+    result = matching_vector_repo.update(db, row=row, payload={**filtered, **version_columns(merged)})
     
     # ✅ 벡터 수정 후 자동 재매칭 계산
     try:
@@ -130,6 +183,102 @@ def update(db: Session, user_id: int, matching_vector_id: int, payload: Dict[str
     return result
 
 
+def bulk_upsert(db: Session, role: str, items: Sequence[Dict[str, Any]], rematch: bool = False) -> Dict[str, int]:
+    """
+    파이프라인용 일괄 저장 (카드 → 벡터 등)
+    - items = [{"user_id", "job_posting_id", "vector_roles": {...}, ...}]
+    - 기존 벡터를 한 번에 조회해서 있으면 update, 없으면 insert (flush 1회)
+    - rematch=False면 자동 매칭을 생략하고 needs_rematch=True로 표시 (나중에 rematch_pending으로 재계산)
+    """
+    if role not in ALLOWED_ROLES:
+        raise _error(status.HTTP_422_UNPROCESSABLE_ENTITY, "INVALID_ROLE", "role must be 'talent' or 'company'")
+    existing = matching_vector_repo.get_by_keys(db, role, [(i["user_id"], i.get("job_posting_id")) for i in items])
+
+    rows, new_items = [], []
+    for item in items:
+        payload = _filter_payload(item)
+        row = existing.get((item["user_id"], item.get("job_posting_id")))
+        if row is None:
+            new_items.append(
+                {"user_id": item["user_id"], "job_posting_id": item.get("job_posting_id"), **payload,
+                 **version_columns(payload), "needs_rematch": not rematch}
+            )
+            continue
+        merged = {**{field: getattr(row, field) for field in VECTOR_FIELDS}, **payload}
+        for key, value in {**payload, **version_columns(merged), "needs_rematch": not rematch}.items():
+            setattr(row, key, value)
+        rows.append(row)
+    rows += matching_vector_repo.create_many(db, role, new_items)
+
+    if rematch:
+        _rematch_rows(db, rows)
+    return {"created": len(new_items), "updated": len(rows) - len(new_items)}
+
+
+def _rematch_rows(db: Session, rows: Sequence[Any]) -> None:
+    """행마다 자동 매칭, 성공한 행은 needs_rematch 해제"""
+    for row in rows:
+        calculate = _calculate_all_matches_for_talent if row.role == "talent" else _calculate_all_matches_for_company
+        try:
+            calculate(db, row)
+            row.needs_rematch = False
+        except Exception as e:
+            logger.error(f"Auto-matching failed for vector {row.id}: {e}")
+
+
+def rematch_vectors(db: Session, vector_ids: Sequence[int]) -> int:
+    """
+    벡터 재인코딩 이후 한꺼번에 재매칭 (flush만, commit은 호출자)
+    - 이전 모델로 계산된 결과는 먼저 지운다 (버전이 달라진 상대와의 결과가 남지 않도록)
+    """
+    from app.repositories import matching_result_repo
+
+    rows = matching_vector_repo.get_by_ids(db, vector_ids)
+    for row in rows:
+        matching_result_repo.delete_by_vector_id(db, row.id)
+    _rematch_rows(db, rows)
+    db.flush()
+    return len(rows)
+
+
+def rematch_pending(db: Session, batch_size: int = 100) -> int:
+    """
+    needs_rematch 벡터 전체를 batch_size씩 재매칭하고 배치마다 commit
+    (중단돼도 다음 실행에서 남은 벡터부터 이어서 처리)
+    """
+    total, after = 0, 0
+    while True:
+        ids = matching_vector_repo.pending_rematch_ids(db, after=after, limit=batch_size)
+        if not ids:
+            return total
+        after = ids[-1]
+        total += rematch_vectors(db, ids)
+        db.commit()
+
+
+def compatible_candidates(query, vector):
+    """
+    후보 벡터 query(Query / Select)를 vector와 같은 모델 버전으로 제한
+    - 모델 표시가 없는 벡터(NULL)는 NULL끼리만, 버전이 섞인 벡터는 제한 없이 쌍마다 match()에서 판단
+    - dims를 알면 같은 차원끼리만 (NULL 모델도 차원이 다르면 match()가 VECTOR_DIMENSION_MISMATCH)
+      NULL 모델 중 dims 컬럼 추가 전에 저장되어 차원을 모르는 행은 제외하지 않고 match()에서 판단
+    - 자동 매칭 / 인재 검색 공통
+    """
+    from app.models.matching_vector import MatchingVector
+
+    if vector.model_version == MIXED_VERSION:
+        return query
+    if vector.model_version is None:
+        query = query.filter(MatchingVector.model_version.is_(None))
+        if vector.dims is not None:
+            query = query.filter(or_(MatchingVector.dims == vector.dims, MatchingVector.dims.is_(None)))
+        return query
+    query = query.filter(MatchingVector.model_version == vector.model_version)
+    if vector.dims is not None:
+        query = query.filter(MatchingVector.dims == vector.dims)
+    return query
+
+
 def delete(db: Session, user_id: int, matching_vector_id: int):
     row = matching_vector_repo.get_by_id(db, matching_vector_id)
     row = _require_owned(row, user_id)
@@ -174,6 +323,8 @@ def get_vector_detail_by_id(db: Session, vector_id: int) -> Dict[str, Any]:
         "vector_career": row.vector_career,
         "vector_vision": row.vector_vision,
         "vector_culture": row.vector_culture,
+        "model_version": row.model_version,
+        "dims": row.dims,
         "updated_at": row.updated_at,
     }
 
@@ -204,21 +355,37 @@ def _calculate_all_matches_for_talent(db: Session, talent_vector):
         talent_vector: MatchingVector 객체 (role='talent')
     """
     from app.models.matching_vector import MatchingVector
-    from app.services import vector_matching_service
+    from app.services import matching_constraints, vector_matching_service
     from app.repositories import matching_result_repo
     
     # 1. 모든 company 벡터 조회
-    company_vectors = db.query(MatchingVector).filter(
-        MatchingVector.role == "company"
+    started = time.perf_counter()
+    mem = memory.PeakTracker().start()
+    company_vectors = compatible_candidates(
+        db.query(MatchingVector).filter(MatchingVector.role == "company"), talent_vector
     ).all()
     
-    logger.info(f"[Auto-Matching] Talent vector {talent_vector.id} → {len(company_vectors)} company vectors")
+    # 희망 조건(hard constraint)에 맞지 않는 공고는 점수 계산 제외 + 기존 결과 삭제
+    excluded = set()
+    constraints = matching_constraints.enabled_constraints()
+    if constraints:
+        excluded = matching_constraints.excluded_company_vectors(
+            db, talent_vector.user_id, [row.id for row in company_vectors], constraints
+        )
+        matching_result_repo.delete_pairs(db, [talent_vector.id], sorted(excluded))
+    
+    logger.info(
+        f"[Auto-Matching] Talent vector {talent_vector.id} → {len(company_vectors)} company vectors"
+        + (f" ({len(excluded)} excluded by preferences)" if excluded else "")
+    )
     
     success_count = 0
     error_count = 0
     
     # 2. 각 company 벡터와 매칭 계산
     for company_vector in company_vectors:
+        if company_vector.id in excluded:
+            continue
         try:
             # 매칭 계산 (기존 vector_matching_service 활용)
             match_result = vector_matching_service.match(
@@ -246,7 +413,11 @@ def _calculate_all_matches_for_talent(db: Session, talent_vector):
             continue
     
     db.flush()
-    logger.info(f"[Auto-Matching] Talent {talent_vector.id} completed: {success_count} success, {error_count} errors")
+    metrics.observe_auto_matching("talent", time.perf_counter() - started, success_count, error_count, len(excluded))
+    logger.info(
+        f"[Auto-Matching] Talent {talent_vector.id} completed: {success_count} success, {error_count} errors, "
+        f"{mem.describe()}"
+    )
 
 
 def _calculate_all_matches_for_company(db: Session, company_vector):
@@ -258,21 +429,37 @@ def _calculate_all_matches_for_company(db: Session, company_vector):
         company_vector: MatchingVector 객체 (role='company')
     """
     from app.models.matching_vector import MatchingVector
-    from app.services import vector_matching_service
+    from app.services import matching_constraints, vector_matching_service
     from app.repositories import matching_result_repo
     
     # 1. 모든 talent 벡터 조회
-    talent_vectors = db.query(MatchingVector).filter(
-        MatchingVector.role == "talent"
+    started = time.perf_counter()
+    mem = memory.PeakTracker().start()
+    talent_vectors = compatible_candidates(
+        db.query(MatchingVector).filter(MatchingVector.role == "talent"), company_vector
     ).all()
     
-    logger.info(f"[Auto-Matching] Company vector {company_vector.id} (JobPosting {company_vector.job_posting_id}) → {len(talent_vectors)} talent vectors")
+    # 희망 조건(hard constraint)에 맞지 않는 인재는 점수 계산 제외 + 기존 결과 삭제
+    excluded = set()
+    constraints = matching_constraints.enabled_constraints()
+    if constraints:
+        excluded = matching_constraints.excluded_talent_vectors(
+            db, company_vector.job_posting_id, [row.id for row in talent_vectors], constraints
+        )
+        matching_result_repo.delete_pairs(db, sorted(excluded), [company_vector.id])
+    
+    logger.info(
+        f"[Auto-Matching] Company vector {company_vector.id} (JobPosting {company_vector.job_posting_id}) → {len(talent_vectors)} talent vectors"
+        + (f" ({len(excluded)} excluded by preferences)" if excluded else "")
+    )
     
     success_count = 0
     error_count = 0
     
     # 2. 각 talent 벡터와 매칭 계산
     for talent_vector in talent_vectors:
+        if talent_vector.id in excluded:
+            continue
         try:
             # 매칭 계산
             match_result = vector_matching_service.match(
@@ -300,4 +487,8 @@ def _calculate_all_matches_for_company(db: Session, company_vector):
             continue
     
     db.flush()
-    logger.info(f"[Auto-Matching] Company {company_vector.id} completed: {success_count} success, {error_count} errors")
+    metrics.observe_auto_matching("company", time.perf_counter() - started, success_count, error_count, len(excluded))
+    logger.info(
+        f"[Auto-Matching] Company {company_vector.id} completed: {success_count} success, {error_count} errors, "
+        f"{mem.describe()}"
+    )
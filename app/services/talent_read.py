@@ -6,7 +6,7 @@ from typing import Optional, Type, TypeVar
 import sqlalchemy as sa
 from pydantic import BaseModel
 
-from app.db.session import SessionLocal
+from app.db.session import read_session
 from app.models.activity import Activity
 from app.models.certification import Certification
 from app.models.document import Document
@@ -39,14 +39,14 @@ def _list_for_user(
     if order_by:
         stmt = stmt.order_by(*order_by)
 
-    with SessionLocal() as session:
+    with read_session(user_id) as session:
         rows = session.execute(stmt).scalars().all()
 
     return [schema.model_validate(row, from_attributes=True) for row in rows]
 
 
 def get_basic_profile(user_id: int) -> Optional[TalentBasicOut]:
-    with SessionLocal() as session:
+    with read_session(user_id) as session:
         profile = session.get(TalentProfile, user_id)
 
     if profile is None or getattr(profile, "deleted_at", None) is not None:
@@ -0,0 +1,278 @@
+"""
+기업용 인재 검색 (구조화 필터 + 벡터 유사도)
+1) 프로필/경력 필터를 SQL로 먼저 적용해 후보 talent 벡터를 좁힌다
+2) 후보를 id keyset + LIMIT TALENT_SEARCH_CHUNK_SIZE 쿼리로 나눠 읽으면서 필드별 cosine을 numpy로 한 번에 계산
+   (sparse 벡터 후보는 청크마다 CSR로 묶어 nnz 만큼만 계산)
+3) 청크마다 상위 limit+1개만 남겨 메모리는 청크 크기에 비례
+4) TALENT_SEARCH_BUDGET_MS를 넘기면 남은 후보는 건너뛰고 partial=true로 응답
+   (이때 next_cursor는 없음: 점수 cursor는 전체 후보 순위 기준이라 읽지 않은 후보가 영영 빠지게 된다)
+
+점수는 vector_matching_service.match()와 같은 방식 (필드별 cosine 평균 → 0~100 정규화).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core import sparse_vector
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.settings import settings
+from app.models.experience import Experience
+from app.models.matching_vector import MatchingVector
+from app.models.profile import TalentProfile
+from app.repositories import company_repo, job_posting_repo, matching_vector_repo
+from app.schemas.talent_search import TalentSearchIn
+from app.services.matching_vector_service import VECTOR_FIELDS, compatible_candidates
+
+logger = logging.getLogger(__name__)
+
+
+def _error(status_code: int, code: str, message: str) -> HTTPException:
+    return HTTPException(status_code=status_code, detail={"code": code, "message": message})
+
+
+def _vector_values(raw: Any) -> Optional[List[float]]:
+    """저장 형식({"vector": [...]}, {"values": [...]}, [...])에서 숫자 목록만 꺼낸다 (형식이 다르거나 sparse면 None)"""
+    if sparse_vector.is_sparse(raw):
+        return None
+    if isinstance(raw, dict):
+        raw = raw.get("vector", raw.get("values"))
+    return raw if isinstance(raw, list) and raw else None
+
+
+def _sparse_values(raw: Any) -> Optional[sparse_vector.SparseVector]:
+    if not sparse_vector.is_sparse(raw):
+        return None
+    try:
+        return sparse_vector.from_raw(raw)
+    except ValueError:
+        return None
+
+
+def _query_values(raw: Any) -> Optional[Any]:
+    """기준 벡터는 dense로 (sparse면 펼친다)"""
+    sparse = _sparse_values(raw)
+    return sparse_vector.to_dense(sparse) if sparse is not None else _vector_values(raw)
+
+
+def _normalize(cosine: np.ndarray) -> np.ndarray:
+    return (np.clip(cosine, -1.0, 1.0) + 1.0) / 2.0 * 100.0
+
+
+def _query_vectors(
+    db: Session, owner_user_id: int, payload: TalentSearchIn
+) -> Tuple[Dict[str, np.ndarray], Optional[MatchingVector]]:
+    """검색 기준 벡터 (필드 → 단위 벡터) + 기준 공고 벡터 행 (query_vectors로 검색하면 None)"""
+    row = None
+    if payload.job_posting_id is not None:
+        company = company_repo.get_by_owner(db, owner_user_id)
+        if company is None:
+            raise _error(status.HTTP_404_NOT_FOUND, "COMPANY_NOT_FOUND", "Company not found")
+        posting = job_posting_repo.get_by_id_and_company(db, posting_id=payload.job_posting_id, company_id=company.id)
+        if posting is None:
+            raise _error(status.HTTP_404_NOT_FOUND, "JOB_POSTING_NOT_FOUND", "Job posting not found")
+        row = matching_vector_repo.get_by_user_and_job_posting(db, owner_user_id, posting.id)
+        if row is None:
+            raise _error(
+                status.HTTP_404_NOT_FOUND, "MATCHING_VECTOR_NOT_FOUND", "Job posting has no matching vector yet"
+            )
+        raw = {field: _query_values(getattr(row, field)) for field in VECTOR_FIELDS}
+    else:
+        unknown = sorted(set(payload.query_vectors) - set(VECTOR_FIELDS))
+        if unknown:
+            raise _error(
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                "INVALID_VECTOR_FIELD",
+                f"Unknown vector fields: {', '.join(unknown)} (allowed: {', '.join(VECTOR_FIELDS)})",
+            )
+        raw = payload.query_vectors
+
+    vectors: Dict[str, np.ndarray] = {}
+    for field in VECTOR_FIELDS:
+        values = raw.get(field)
+        if values is None or len(values) == 0:
+            continue
+        vector = np.asarray(values, dtype=np.float64)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            raise _error(status.HTTP_422_UNPROCESSABLE_ENTITY, "ZERO_VECTOR", f"{field} is a zero magnitude vector")
+        vectors[field] = vector / norm
+    if not vectors:
+        raise _error(status.HTTP_422_UNPROCESSABLE_ENTITY, "INCOMPLETE_VECTOR_FIELDS", "No usable query vector")
+    return vectors, row
+
+
+def _experience_years():
+    return (
+        select(Experience.user_id, func.coalesce(func.sum(Experience.duration_years), 0).label("years"))
+        .where(Experience.deleted_at.is_(None))
+        .group_by(Experience.user_id)
+        .subquery()
+    )
+
+
+def _candidate_stmt(payload: TalentSearchIn, fields: Sequence[str], query_row: Optional[MatchingVector] = None):
+    stmt = (
+        select(
+            MatchingVector.id,
+            MatchingVector.user_id,
+            TalentProfile.name,
+            TalentProfile.tagline,
+            TalentProfile.desired_role,
+            *[getattr(MatchingVector, field) for field in fields],
+        )
+        .join(TalentProfile, TalentProfile.user_id == MatchingVector.user_id)
+        .where(MatchingVector.role == "talent", TalentProfile.deleted_at.is_(None))
+    )
+    if query_row is not None:
+        # 다른 모델로 만든 벡터는 차원이 같아도 비교하지 않는다 (자동 매칭과 같은 규칙)
+        stmt = compatible_candidates(stmt, query_row)
+    if payload.submitted_only:
+        stmt = stmt.where(TalentProfile.is_submitted.is_(True))
+    for column, value in (
+        (TalentProfile.desired_role, payload.desired_role),
+        (TalentProfile.residence_location, payload.residence_location),
+        (TalentProfile.desired_work_location, payload.desired_work_location),
+    ):
+        if value:
+            stmt = stmt.where(column.contains(value, autoescape=True))
+    if payload.min_experience_years is not None or payload.max_experience_years is not None:
+        years = _experience_years()
+        total = func.coalesce(years.c.years, 0)
+        stmt = stmt.outerjoin(years, years.c.user_id == MatchingVector.user_id)
+        if payload.min_experience_years is not None:
+            stmt = stmt.where(total >= payload.min_experience_years)
+        if payload.max_experience_years is not None:
+            stmt = stmt.where(total <= payload.max_experience_years)
+    return stmt
+
+
+def _score_chunk(rows: Sequence[Any], queries: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """청크의 (통과 여부 bool[n], 총점 float[n], 필드별 점수 float[필드, n])"""
+    n = len(rows)
+    cosines = np.empty((len(queries), n), dtype=np.float64)
+    valid = np.ones(n, dtype=bool)
+    for k, (field, query) in enumerate(queries.items()):
+        dim = query.shape[0]
+        raws = [getattr(row, field) for row in rows]
+        values = [_vector_values(raw) for raw in raws]
+        ok = np.fromiter((v is not None and len(v) == dim for v in values), dtype=bool, count=n)
+        dots = np.zeros(n, dtype=np.float64)
+        norms = np.zeros(n, dtype=np.float64)
+        if ok.any():
+            matrix = np.asarray([v for v, keep in zip(values, ok) if keep], dtype=np.float64)
+            dots[ok] = matrix @ query
+            norms[ok] = np.linalg.norm(matrix, axis=1)
+        sparse = [_sparse_values(raw) for raw in raws]
+        sparse_ok = np.fromiter((v is not None and v.dim == dim for v in sparse), dtype=bool, count=n)
+        if sparse_ok.any():
+            csr = sparse_vector.CSR([v if keep else None for v, keep in zip(sparse, sparse_ok)])
+            dots = np.where(sparse_ok, csr.dot(query), dots)
+            norms = np.where(sparse_ok, csr.norms(), norms)
+            ok |= sparse_ok
+        valid &= ok & (norms > 0)
+        cosines[k] = dots / np.where(norms > 0, norms, 1.0)
+    return valid, _normalize(cosines.mean(axis=0)), _normalize(cosines)
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    values = decode_cursor(cursor, size=2)
+    try:
+        return float(values[0]), int(values[1])
+    except (TypeError, ValueError):
+        raise _error(status.HTTP_422_UNPROCESSABLE_ENTITY, "VALIDATION_ERROR", "cursor invalid")
+
+
+def search(db: Session, owner_user_id: int, payload: TalentSearchIn) -> Dict[str, Any]:
+    """
+    인재 검색 (점수 내림차순, 동점은 벡터 id 내림차순)
+    - next_cursor: 다음 페이지 cursor (같은 조건으로 cursor만 바꿔 호출)
+    - partial: 시간 예산 초과로 후보 일부만 평가한 경우 true, next_cursor는 None
+    """
+    started = time.perf_counter()
+    queries, query_row = _query_vectors(db, owner_user_id, payload)
+    after = _decode_search_cursor(payload.cursor) if payload.cursor else None
+    keep = payload.limit + 1
+    budget = settings.TALENT_SEARCH_BUDGET_MS / 1000.0
+
+    # (score, vector_id, row, field_scores) 상위 keep개
+    pool: List[Tuple[float, int, Any, np.ndarray]] = []
+    scanned = 0
+    partial = False
+    stmt = _candidate_stmt(payload, list(queries), query_row).order_by(MatchingVector.id)
+    chunk_size = settings.TALENT_SEARCH_CHUNK_SIZE
+    after_id = 0
+    while True:
+        if scanned and time.perf_counter() - started > budget:
+            partial = True
+            break
+        # 청크마다 별도 쿼리 (id keyset + LIMIT) → 예산을 넘기면 남은 후보는 DB에서 읽지도 않는다
+        rows = db.execute(stmt.where(MatchingVector.id > after_id).limit(chunk_size)).all()
+        if not rows:
+            break
+        after_id = rows[-1].id
+        scanned += len(rows)
+        valid, scores, field_scores = _score_chunk(rows, queries)
+        ids = np.fromiter((row.id for row in rows), dtype=np.int64, count=len(rows))
+        mask = valid & (scores >= payload.min_score)
+        if after is not None:
+            mask &= (scores < after[0]) | ((scores == after[0]) & (ids < after[1]))
+        selected = np.flatnonzero(mask)
+        if len(selected) > keep:
+            # 점수 상위 keep개만 (동점 처리는 아래 정렬에서)
+            top = np.argpartition(-scores[selected], keep - 1)[:keep]
+            threshold = scores[selected][top].min()
+            selected = selected[scores[selected] >= threshold]
+        pool.extend((float(scores[i]), int(ids[i]), rows[i], field_scores[:, i]) for i in selected)
+        pool.sort(key=lambda item: (-item[0], -item[1]))
+        del pool[keep:]
+        if len(rows) < chunk_size:
+            break
+
+    page = pool[: payload.limit]
+    next_cursor = None
+    if len(pool) > payload.limit and not partial:
+        next_cursor = encode_cursor(page[-1][0], page[-1][1])
+
+    years: Dict[int, int] = {}
+    if page:
+        years_sq = _experience_years()
+        years = dict(
+            db.execute(
+                select(years_sq.c.user_id, years_sq.c.years).where(years_sq.c.user_id.in_([row.user_id for _, _, row, _ in page]))
+            ).all()
+        )
+
+    fields = list(queries)
+    items = [
+        {
+            "talent_user_id": row.user_id,
+            "matching_vector_id": vector_id,
+            "name": row.name,
+            "tagline": row.tagline,
+            "desired_role": row.desired_role,
+            "experience_years": int(years.get(row.user_id) or 0),
+            "score": round(score, 2),
+            "field_scores": {field: round(float(value), 2) for field, value in zip(fields, field_scores)},
+        }
+        for score, vector_id, row, field_scores in page
+    ]
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    logger.info(
+        f"[TalentSearch] owner={owner_user_id} scanned={scanned} returned={len(items)} "
+        f"partial={partial} {elapsed_ms:.1f}ms"
+    )
+    return {
+        "items": items,
+        "next_cursor": next_cursor,
+        "partial": partial,
+        "scanned": scanned,
+        "elapsed_ms": round(elapsed_ms, 1),
+    }
@@ -43,7 +43,7 @@ def _reject_none_for_required(payload: dict, required_fields: list[str]):
 # Education
 def create_education(user_id: int, payload: dict) -> Education:
     _validate_date_range(payload.get("start_ym"), payload.get("end_ym"))
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = Education(user_id=user_id, **payload)
             session.add(row)
@@ -56,7 +56,7 @@ def update_education(user_id: int, edu_id: int, payload: dict) -> Education:
     if "start_ym" in payload or "end_ym" in payload:
         _validate_date_range(payload.get("start_ym"), payload.get("end_ym"))
     _reject_none_for_required(payload, ["school_name", "status"])
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = _require_owned(session, Education, edu_id, user_id)
             for k, v in payload.items():
@@ -67,7 +67,7 @@ def update_education(user_id: int, edu_id: int, payload: dict) -> Education:
 
 
 def delete_education(user_id: int, edu_id: int) -> Education:
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = _require_owned(session, Education, edu_id, user_id)
             row.deleted_at = datetime.utcnow()
@@ -79,7 +79,7 @@ def delete_education(user_id: int, edu_id: int) -> Education:
 # Experience
 def create_experience(user_id: int, payload: dict) -> Experience:
     _validate_date_range(payload.get("start_ym"), payload.get("end_ym"))
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             title = payload.get("title") or ""
             row = Experience(
@@ -105,7 +105,7 @@ def update_experience(user_id: int, exp_id: int, payload: dict) -> Experience:
     if "start_ym" in payload or "end_ym" in payload:
         _validate_date_range(payload.get("start_ym"), payload.get("end_ym"))
     _reject_none_for_required(payload, ["company_name", "title"])
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = _require_owned(session, Experience, exp_id, user_id)
             for k, v in payload.items():
@@ -117,7 +117,7 @@ def update_experience(user_id: int, exp_id: int, payload: dict) -> Experience:
 
 
 def delete_experience(user_id: int, exp_id: int) -> Experience:
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = _require_owned(session, Experience, exp_id, user_id)
             row.deleted_at = datetime.utcnow()
@@ -128,7 +128,7 @@ def delete_experience(user_id: int, exp_id: int) -> Experience:
 
 # Activity
 def create_activity(user_id: int, payload: dict) -> Activity:
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = Activity(user_id=user_id, **payload)
             session.add(row)
@@ -139,7 +139,7 @@ def create_activity(user_id: int, payload: dict) -> Activity:
 
 def update_activity(user_id: int, activity_id: int, payload: dict) -> Activity:
     _reject_none_for_required(payload, ["name"])
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = _require_owned(session, Activity, activity_id, user_id)
             for k, v in payload.items():
@@ -150,7 +150,7 @@ def update_activity(user_id: int, activity_id: int, payload: dict) -> Activity:
 
 
 def delete_activity(user_id: int, activity_id: int) -> Activity:
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = _require_owned(session, Activity, activity_id, user_id)
             row.deleted_at = datetime.utcnow()
@@ -161,7 +161,7 @@ def delete_activity(user_id: int, activity_id: int) -> Activity:
 
 # Certification
 def create_certification(user_id: int, payload: dict) -> Certification:
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = Certification(user_id=user_id, **payload)
             session.add(row)
@@ -172,7 +172,7 @@ def create_certification(user_id: int, payload: dict) -> Certification:
 
 def update_certification(user_id: int, cert_id: int, payload: dict) -> Certification:
     _reject_none_for_required(payload, ["name"])
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = _require_owned(session, Certification, cert_id, user_id)
             for k, v in payload.items():
@@ -183,7 +183,7 @@ def update_certification(user_id: int, cert_id: int, payload: dict) -> Certifica
 
 
 def delete_certification(user_id: int, cert_id: int) -> Certification:
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = _require_owned(session, Certification, cert_id, user_id)
             row.deleted_at = datetime.utcnow()
@@ -194,7 +194,7 @@ def delete_certification(user_id: int, cert_id: int) -> Certification:
 
 # Document
 def create_document(user_id: int, payload: dict) -> Document:
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             data = payload.copy()
             if "storage_url" in data and data["storage_url"] is not None:
@@ -208,7 +208,7 @@ def create_document(user_id: int, payload: dict) -> Document:
 
 def update_document(user_id: int, doc_id: int, payload: dict) -> Document:
     _reject_none_for_required(payload, ["doc_type", "storage_url", "original_name"])
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = _require_owned(session, Document, doc_id, user_id)
             for k, v in payload.items():
@@ -221,7 +221,7 @@ def update_document(user_id: int, doc_id: int, payload: dict) -> Document:
 
 
 def delete_document(user_id: int, doc_id: int) -> Document:
-    with SessionLocal() as session:
+    with SessionLocal(info={"user_id": user_id}) as session:
         with session.begin():
             row = _require_owned(session, Document, doc_id, user_id)
             row.deleted_at = datetime.utcnow()
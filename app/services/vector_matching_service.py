@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from math import sqrt
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, List
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core import sparse_vector
+from app.core.sparse_vector import Vector
 from app.repositories import matching_vector_repo
-from app.services.matching_vector_service import ALLOWED_ROLES, VECTOR_FIELDS
+from app.services.matching_vector_service import ALLOWED_ROLES, VECTOR_FIELDS, field_version
 
 
 def _error(status_code: int, code: str, message: str) -> HTTPException:
@@ -41,7 +42,31 @@ def _ensure_complete(row: Any, label: str) -> None:
         )
 
 
-def _extract_vector(raw: Any, field_name: str, label: str) -> List[float]:
+def _ensure_same_model(source: Any, target: Any) -> None:
+    """필드별 모델이 다르면 점수 비교가 무의미하므로 계산하지 않는다"""
+    mismatched = [
+        field
+        for field in VECTOR_FIELDS
+        if field_version(getattr(source, field))[0] != field_version(getattr(target, field))[0]
+    ]
+    if mismatched:
+        raise _error(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            "VECTOR_VERSION_MISMATCH",
+            f"Vectors were produced by different models: {', '.join(mismatched)}",
+        )
+
+
+def _extract_vector(raw: Any, field_name: str, label: str) -> Vector:
+    """dense는 숫자 목록, {"indices", "values", "dim"}은 SparseVector"""
+    if sparse_vector.is_sparse(raw):
+        try:
+            return sparse_vector.from_raw(raw)
+        except ValueError as e:
+            raise _error(
+                status.HTTP_422_UNPROCESSABLE_ENTITY, "INVALID_VECTOR_DATA", f"{label} {field_name}: {e}"
+            ) from None
+
     data = raw
     if isinstance(raw, dict):
         if "vector" in raw:
@@ -81,10 +106,10 @@ def _extract_vector(raw: Any, field_name: str, label: str) -> List[float]:
     return vector
 
 
-def _cosine_similarity(a: Iterable[float], b: Iterable[float], field_name: str, label: str) -> float:
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = sqrt(sum(x * x for x in a))
-    norm_b = sqrt(sum(y * y for y in b))
+def _cosine_similarity(a: Vector, b: Vector, field_name: str, label: str) -> float:
+    dot = sparse_vector.dot(a, b)
+    norm_a = sparse_vector.norm(a)
+    norm_b = sparse_vector.norm(b)
 
     if norm_a == 0 or norm_b == 0:
         raise _error(
@@ -108,6 +133,7 @@ def match(db: Session, source_id: int, target_id: int) -> Dict[str, Any]:
     _ensure_opposite_roles(source.role, target.role)
     _ensure_complete(source, "Source")
     _ensure_complete(target, "Target")
+    _ensure_same_model(source, target)
 
     field_scores: Dict[str, float] = {}
     cosine_scores: List[float] = []
@@ -116,7 +142,7 @@ def match(db: Session, source_id: int, target_id: int) -> Dict[str, Any]:
         source_vector = _extract_vector(getattr(source, field), field, "Source")
         target_vector = _extract_vector(getattr(target, field), field, "Target")
 
-        if len(source_vector) != len(target_vector):
+        if sparse_vector.dim(source_vector) != sparse_vector.dim(target_vector):
             raise _error(
                 status.HTTP_422_UNPROCESSABLE_ENTITY,
                 "VECTOR_DIMENSION_MISMATCH",
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+⏱  JSON 직렬화 벤치마크
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+1) 응답: 매칭 결과 목록(기본 500건)을 두 경로로 렌더링하여 비교
+   - legacy: float()/isoformat() 수동 변환 → jsonable_encoder → stdlib JSONResponse
+   - fast:   raw dict (Decimal/datetime 그대로) → FastJSONResponse (orjson)
+
+2) JSON 컬럼: 매칭 벡터 행(6개 vector_* 필드)을 엔진 json_serializer/deserializer로 인코딩/디코딩
+   - stdlib: json.dumps / json.loads (SQLAlchemy MySQL dialect 기본값)
+   - fast:   app.core.serialization.dumps / loads (orjson)
+
+📝 사용법:
+    poetry run python scripts/bench_json.py
+    poetry run python scripts/bench_json.py --rows 500 --repeat 200 --vectors 2000 --dims 256
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core import serialization
+from app.core.responses import FastJSONResponse
+from app.core.serialization import HAS_ORJSON
+
+SCORE_FIELDS = ("roles", "skills", "growth", "career", "vision", "culture")
+
+
+def _raw_rows(rows: int) -> list[dict]:
+    base = datetime(2025, 10, 1, 12, 0, 0)
+    return [
+        {
+            "job_posting_id": i,
+            "company_user_id": 1000 + i,
+            "total_score": Decimal("73.25") + Decimal(i % 20),
+            "scores": {name: Decimal("61.50") + Decimal(i % 30) for name in SCORE_FIELDS},
+            "calculated_at": base + timedelta(seconds=i),
+        }
+        for i in range(rows)
+    ]
+
+
+def _legacy_payload(raw: list[dict]) -> dict:
+    matches = [
+        {
+            "job_posting_id": row["job_posting_id"],
+            "company_user_id": row["company_user_id"],
+            "total_score": float(row["total_score"]),
+            "scores": {k: float(v) if v else None for k, v in row["scores"].items()},
+            "calculated_at": row["calculated_at"].isoformat(),
+        }
+        for row in raw
+    ]
+    return {"ok": True, "data": {"talent_user_id": 1, "total_matches": len(matches), "matches": matches}}
+
+
+def _fast_payload(raw: list[dict]) -> dict:
+    return {"ok": True, "data": {"talent_user_id": 1, "total_matches": len(raw), "matches": raw}}
+
+
+def _time(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def run_columns(vectors: int, dims: int) -> dict:
+    rng = random.Random(42)
+    fields = [
+        {"vector": [rng.uniform(-1, 1) for _ in range(dims)]}
+        for _ in range(vectors * 6)
+    ]
+    stdlib_encoded = [json.dumps(value) for value in fields]
+    fast_encoded = [serialization.dumps(value) for value in fields]
+
+    def stdlib_dumps():
+        for value in fields:
+            json.dumps(value)
+
+    def fast_dumps():
+        for value in fields:
+            serialization.dumps(value)
+
+    def stdlib_loads():
+        for value in stdlib_encoded:
+            json.loads(value)
+
+    def fast_loads():
+        for value in fast_encoded:
+            serialization.loads(value)
+
+    timings = {name: _time(fn, 1) for name, fn in (
+        ("stdlib_dumps", stdlib_dumps),
+        ("fast_dumps", fast_dumps),
+        ("stdlib_loads", stdlib_loads),
+        ("fast_loads", fast_loads),
+    )}
+    return {
+        "vectors": vectors,
+        "dims": dims,
+        "orjson": HAS_ORJSON,
+        **{f"{name}_ms": round(value * 1000, 1) for name, value in timings.items()},
+        "dumps_speedup": round(timings["stdlib_dumps"] / timings["fast_dumps"], 2),
+        "loads_speedup": round(timings["stdlib_loads"] / timings["fast_loads"], 2),
+    }
+
+
+def run(rows: int, repeat: int) -> dict:
+    raw = _raw_rows(rows)
+
+    def legacy():
+        JSONResponse(jsonable_encoder(_legacy_payload(raw))).body
+
+    def fast():
+        FastJSONResponse(_fast_payload(raw)).body
+
+    legacy_s = _time(legacy, repeat)
+    fast_s = _time(fast, repeat)
+    return {
+        "rows": rows,
+        "repeat": repeat,
+        "orjson": HAS_ORJSON,
+        "legacy_ms": round(legacy_s * 1000, 3),
+        "fast_ms": round(fast_s * 1000, 3),
+        "legacy_rps": round(1 / legacy_s, 1),
+        "fast_rps": round(1 / fast_s, 1),
+        "speedup": round(legacy_s / fast_s, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON response / JSON column benchmark")
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--vectors", type=int, default=2000, help="매칭 벡터 행 수 (행당 JSON 컬럼 6개)")
+    parser.add_argument("--dims", type=int, default=256)
+    args = parser.parse_args()
+
+    result = run(args.rows, args.repeat)
+    print("━" * 60)
+    print(f"📦 매칭 결과 {result['rows']}건 응답 렌더링 (orjson={result['orjson']})")
+    print("━" * 60)
+    print(f"  legacy : {result['legacy_ms']:8.3f} ms/req  ({result['legacy_rps']} req/s)")
+    print(f"  fast   : {result['fast_ms']:8.3f} ms/req  ({result['fast_rps']} req/s)")
+    print(f"  speedup: x{result['speedup']}")
+
+    columns = run_columns(args.vectors, args.dims)
+    print("━" * 60)
+    print(f"🧮 매칭 벡터 {columns['vectors']}행 × 6 필드 × {columns['dims']}차원 JSON 컬럼")
+    print("━" * 60)
+    print(f"  encode : stdlib {columns['stdlib_dumps_ms']} ms  →  fast {columns['fast_dumps_ms']} ms  (x{columns['dumps_speedup']})")
+    print(f"  decode : stdlib {columns['stdlib_loads_ms']} ms  →  fast {columns['fast_loads_ms']} ms  (x{columns['loads_speedup']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+🚦 HTTP 부하 테스트 드라이버 (httpx + asyncio)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+실행 중인 서버에 실제 트래픽과 비슷한 endpoint 비율로 요청을 보내고
+endpoint별 / 전체 p50, p95, p99 지연 시간과 처리량(req/s)을 출력한다.
+
+사전 준비 (대량 시드 데이터, load-* 계정):
+    poetry run python scripts/seed_mock_data.py --talents 100000 --postings 20000 --dims 64
+
+1) load-talent / load-company 계정 일부로 로그인 → 토큰, user_id 확보
+2) 인재 매칭 결과에서 job_posting_id / company_user_id 수집
+3) --duration 동안 --concurrency 개의 worker가 가중치(--mix)에 따라 요청
+
+📝 사용법:
+    poetry run python scripts/loadtest.py --base-url http://127.0.0.1:8000
+    poetry run python scripts/loadtest.py --concurrency 64 --duration 60 --output loadtest.json
+    poetry run python scripts/loadtest.py --mix "job_posting=50,talent_matches=50,login=1"
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+from jose import jwt
+
+EMAIL_PREFIX = "load-"
+PASSWORD = "password123"
+
+# endpoint 이름 → 기본 가중치 (읽기 위주의 실제 트래픽 비율을 가정)
+DEFAULT_MIX = {
+    "job_posting": 25,
+    "talent_matches": 25,
+    "posting_talents": 15,
+    "company_profile": 10,
+    "talent_profile": 10,
+    "my_vectors": 10,
+    "health": 5,
+    "login": 0,  # bcrypt 비용이 커서 기본 제외, 필요 시 --mix login=1
+}
+
+
+class Pool:
+    """부하 테스트에 사용할 계정/ID 모음"""
+
+    def __init__(self) -> None:
+        self.talents: List[Tuple[int, str]] = []  # (user_id, token)
+        self.companies: List[Tuple[int, str]] = []
+        self.job_posting_ids: List[int] = []
+        self.company_user_ids: List[int] = []
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """nearest-rank percentile"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def _login(client: httpx.AsyncClient, email: str) -> Optional[Tuple[int, str]]:
+    res = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+    if res.status_code == 503:
+        # 해싱 executor 포화 (AUTH_BUSY): 조용히 계정을 빼면 측정 대상이 달라지므로 중단
+        raise SystemExit(
+            f"❌ 로그인 503 ({email}): 서버 bcrypt 한도(PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE)를 넘었습니다. "
+            "--login-concurrency를 낮추세요."
+        )
+    if res.status_code != 200:
+        return None
+    token = res.json()["access_token"]
+    return int(jwt.get_unverified_claims(token)["sub"]), token
+
+
+async def prepare(client: httpx.AsyncClient, talents: int, companies: int, login_concurrency: int) -> Pool:
+    pool = Pool()
+    # 동시 로그인 수를 서버 해싱 한도보다 작게 유지 (초과분은 503)
+    slots = asyncio.Semaphore(login_concurrency)
+
+    async def login(email: str) -> Optional[Tuple[int, str]]:
+        async with slots:
+            return await _login(client, email)
+
+    talent_logins = await asyncio.gather(
+        *[login(f"{EMAIL_PREFIX}talent{i:06d}@fitconnect.test") for i in range(talents)]
+    )
+    company_logins = await asyncio.gather(
+        *[login(f"{EMAIL_PREFIX}company{i:06d}@fitconnect.test") for i in range(companies)]
+    )
+    pool.talents = [item for item in talent_logins if item]
+    pool.companies = [item for item in company_logins if item]
+    if not pool.talents:
+        raise SystemExit("❌ load-talent 계정으로 로그인 실패: 대량 시드 모드로 데이터를 먼저 생성하세요.")
+
+    posting_ids, company_ids = set(), set()
+    for user_id, token in pool.talents:
+        res = await client.get(
+            f"/api/matching-results/talents/{user_id}/job-postings",
+            params={"limit": 50},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        if res.status_code == 200:
+            for match in res.json()["data"]["matches"]:
+                posting_ids.add(match["job_posting_id"])
+                company_ids.add(match["company_user_id"])
+    pool.job_posting_ids = sorted(posting_ids)
+    pool.company_user_ids = sorted(company_ids) or [uid for uid, _ in pool.companies]
+    if not pool.job_posting_ids:
+        raise SystemExit("❌ 매칭 결과가 없습니다: --results-per-posting 옵션으로 시드 데이터를 다시 생성하세요.")
+    return pool
+
+
+def build_requests(pool: Pool) -> Dict[str, Callable[[random.Random], Tuple[str, str, dict]]]:
+    """endpoint 이름 → (method, path, httpx kwargs) 생성 함수"""
+
+    def auth(token: str) -> dict:
+        return {"headers": {"Authorization": f"Bearer {token}"}}
+
+    def talent(rng):
+        return rng.choice(pool.talents)
+
+    def any_user(rng):
+        return rng.choice(pool.companies or pool.talents)
+
+    def talent_matches(rng):
+        user_id, token = talent(rng)
+        return "GET", f"/api/matching-results/talents/{user_id}/job-postings", {"params": {"limit": 20}, **auth(token)}
+
+    def posting_talents(rng):
+        job_posting_id = rng.choice(pool.job_posting_ids)
+        return "GET", f"/api/matching-results/job-postings/{job_posting_id}/talents", {"params": {"limit": 20}, **auth(any_user(rng)[1])}
+
+    def login(rng):
+        email = f"{EMAIL_PREFIX}talent{rng.randrange(len(pool.talents)):06d}@fitconnect.test"
+        return "POST", "/auth/login", {"json": {"email": email, "password": PASSWORD}}
+
+    return {
+        "job_posting": lambda rng: ("GET", f"/api/job-postings/{rng.choice(pool.job_posting_ids)}", {}),
+        "talent_matches": talent_matches,
+        "posting_talents": posting_talents,
+        "company_profile": lambda rng: ("GET", f"/api/companies/user/{rng.choice(pool.company_user_ids)}", {}),
+        "talent_profile": lambda rng: ("GET", f"/api/talents/{talent(rng)[0]}/profile", {}),
+        "my_vectors": lambda rng: ("GET", "/api/me/matching-vectors", auth(talent(rng)[1])),
+        "health": lambda rng: ("GET", "/health", {}),
+        "login": login,
+    }
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    requests: Dict[str, Callable],
+    names: List[str],
+    weights: List[int],
+    deadline: float,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, int],
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        method, path, kwargs = requests[name](rng)
+        start = time.perf_counter()
+        try:
+            res = await client.request(method, path, **kwargs)
+            failed = res.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        latencies[name].append((time.perf_counter() - start) * 1000.0)
+        if failed:
+            errors[name] += 1
+
+
+def summarize(latencies: Dict[str, List[float]], errors: Dict[str, int], elapsed: float) -> Dict[str, dict]:
+    def stats(values: List[float], error_count: int) -> dict:
+        ordered = sorted(values)
+        return {
+            "count": len(ordered),
+            "errors": error_count,
+            "rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": round(percentile(ordered, 50), 2),
+            "p95_ms": round(percentile(ordered, 95), 2),
+            "p99_ms": round(percentile(ordered, 99), 2),
+            "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+        }
+
+    report = {name: stats(values, errors[name]) for name, values in sorted(latencies.items())}
+    report["TOTAL"] = stats([v for values in latencies.values() for v in values], sum(errors.values()))
+    return report
+
+
+def parse_mix(raw: Optional[str]) -> Dict[str, int]:
+    mix = dict(DEFAULT_MIX)
+    if raw:
+        mix = {name: 0 for name in DEFAULT_MIX}
+        for item in raw.split(","):
+            name, _, weight = item.partition("=")
+            if name.strip() not in DEFAULT_MIX:
+                raise SystemExit(f"❌ 알 수 없는 endpoint: {name} (가능: {', '.join(DEFAULT_MIX)})")
+            mix[name.strip()] = int(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+async def run(args) -> Dict[str, dict]:
+    mix = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        print("🔐 계정 로그인 및 ID 수집 중...")
+        pool = await prepare(client, args.accounts, max(1, args.accounts // 4), args.login_concurrency)
+        print(f"   인재 {len(pool.talents)}명 / 기업 {len(pool.companies)}개 / 공고 {len(pool.job_posting_ids)}개")
+
+        requests = build_requests(pool)
+        latencies: Dict[str, List[float]] = defaultdict(list)
+        errors: Dict[str, int] = defaultdict(int)
+        names, weights = list(mix), list(mix.values())
+
+        print(f"🚦 {args.duration}s 동안 동시 {args.concurrency}개 요청 ({', '.join(f'{n}={w}' for n, w in mix.items())})")
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*[
+            worker(client, requests, names, weights, deadline, latencies, errors, seed=args.seed + i)
+            for i in range(args.concurrency)
+        ])
+        return summarize(latencies, errors, time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FitConnect HTTP load test")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간 (초)")
+    parser.add_argument("--accounts", type=int, default=20, help="로그인할 load-talent 계정 수 (기업은 1/4)")
+    parser.add_argument(
+        "--login-concurrency", type=int, default=8,
+        help="준비 단계 동시 로그인 수 (서버 PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE 보다 작게, 기본 2 + 16)",
+    )
+    parser.add_argument("--mix", help="endpoint=weight 목록, 예: job_posting=50,talent_matches=50")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    print("━" * 78)
+    print(f"  {'endpoint':<18}{'count':>8}{'err':>6}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>10}")
+    print("━" * 78)
+    for name, s in report.items():
+        print(
+            f"  {name:<18}{s['count']:>8}{s['errors']:>6}{s['rps']:>9}"
+            f"{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}{s['max_ms']:>10}"
+        )
+    print("━" * 78)
+    print("  (지연 시간 단위: ms)")
+
+    if args.output:
+        args.output.write_text(json.dumps({"args": {k: str(v) for k, v in vars(args).items()}, "report": report}, indent=2))
+        print(f"\n💾 결과 저장: {args.output}")
+
+    if report["TOTAL"]["errors"]:
+        print(f"\n⚠️  에러 응답 {report['TOTAL']['errors']}건")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,10 @@
     
 🔄 기존 데이터 삭제 후 재생성:
     poetry run python scripts/seed_mock_data.py --clean
+
+📦 대량 시드 모드 (부하 테스트용, bulk INSERT + numpy mock 벡터/점수):
+    poetry run python scripts/seed_mock_data.py --talents 100000 --postings 20000 --dims 64
+    poetry run python scripts/seed_mock_data.py --talents 100000 --postings 20000 --dims 64 --clean  # load-* 데이터 재생성
 """
 import sys
 from pathlib import Path
@@ -25,6 +29,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from datetime import datetime, date
 from math import sqrt
 from typing import List, Dict, Any, Optional
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.models.user import User
@@ -1229,6 +1234,222 @@ def generate_matching_results(db: Session, talents: List[Dict], companies: List[
     return created_count
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 📦 대량 시드 모드 (--talents / --postings / --dims)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+BULK_EMAIL_PREFIX = "load-"
+VECTOR_FIELDS = ["vector_roles", "vector_skills", "vector_growth", "vector_career", "vector_vision", "vector_culture"]
+
+
+def _batched(rows: List[Dict], size: int):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _bulk_insert(db: Session, model, rows: List[Dict], batch_size: int) -> None:
+    """ORM 객체 없이 Core INSERT (executemany)로 batch 단위 저장"""
+    for batch in _batched(rows, batch_size):
+        db.execute(insert(model), batch)
+
+
+def _ids_by_email(db: Session, pattern: str) -> List[int]:
+    return list(db.execute(select(User.id).where(User.email.like(pattern)).order_by(User.id)).scalars())
+
+
+def clean_bulk_data(db: Session) -> None:
+    """🧹 대량 시드 데이터(load-* 계정) 삭제"""
+    print("━" * 60)
+    print("🧹 기존 대량 시드 데이터 삭제 중...")
+    print("━" * 60)
+
+    user_ids = select(User.id).where(User.email.like(f"{BULK_EMAIL_PREFIX}%"))
+    company_ids = select(Company.id).where(Company.owner_user_id.in_(user_ids))
+    deleted = db.execute(delete(MatchingResult).where(MatchingResult.talent_user_id.in_(user_ids))).rowcount
+    db.execute(delete(MatchingVector).where(MatchingVector.user_id.in_(user_ids)))
+    db.execute(delete(JobPosting).where(JobPosting.company_id.in_(company_ids)))
+    db.execute(delete(Company).where(Company.owner_user_id.in_(user_ids)))
+    db.execute(delete(TalentProfile).where(TalentProfile.user_id.in_(user_ids)))
+    users = db.execute(delete(User).where(User.email.like(f"{BULK_EMAIL_PREFIX}%"))).rowcount
+    db.commit()
+    print(f"✓ 유저 {users}명, 매칭 결과 {deleted}개 삭제\n")
+
+
+def _unit_vectors(rng, count: int, dims: int):
+    """(count, 6, dims) float32 mock 벡터, 필드별 L2 정규화"""
+    import numpy as np
+
+    vectors = rng.standard_normal((count, len(VECTOR_FIELDS), dims), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=2, keepdims=True)
+    return vectors
+
+
+def _vector_rows(vectors, base: List[Dict]) -> List[Dict]:
+    rounded = vectors.round(5).tolist()
+    return [
+        {**row, **{field: {"dim": len(values[i]), "vector": values[i]} for i, field in enumerate(VECTOR_FIELDS)}}
+        for row, values in zip(base, rounded)
+    ]
+
+
+def seed_bulk(
+    db: Session,
+    talents: int,
+    postings: int,
+    dims: int,
+    companies: Optional[int] = None,
+    results_per_posting: int = 50,
+    batch_size: int = 2000,
+    seed: int = 42,
+) -> Dict[str, int]:
+    """
+    📦 부하 테스트용 대량 데이터 생성
+    - users / talent_profiles / companies / job_postings / matching_vectors / matching_results
+    - 모두 Core bulk INSERT (batch_size 단위)
+    - 벡터와 점수는 numpy로 일괄 생성/계산 (공고당 results_per_posting명의 인재를 샘플링)
+    """
+    import numpy as np
+
+    from app.models.enums import LocationEnum, SalaryRangeEnum
+
+    rng = np.random.default_rng(seed)
+    companies = companies or max(1, postings // 4)
+    password_hash = hash_password("password123")  # 모든 계정 공통, 1회만 해싱
+    now = datetime.utcnow()
+
+    def pick(values: List[str], n: int) -> List[str]:
+        return [values[i] for i in rng.integers(0, len(values), size=n)]
+
+    print("━" * 60)
+    print(f"📦 대량 시드: 인재 {talents:,}명 / 기업 {companies:,}개 / 공고 {postings:,}개 / {dims}차원")
+    print("━" * 60)
+
+    # 1. Users
+    _bulk_insert(db, User, [
+        {"email": f"{BULK_EMAIL_PREFIX}talent{i:06d}@fitconnect.test", "password_hash": password_hash, "role": "talent"}
+        for i in range(talents)
+    ] + [
+        {"email": f"{BULK_EMAIL_PREFIX}company{i:06d}@fitconnect.test", "password_hash": password_hash, "role": "company"}
+        for i in range(companies)
+    ], batch_size)
+    talent_ids = _ids_by_email(db, f"{BULK_EMAIL_PREFIX}talent%")
+    company_user_ids = _ids_by_email(db, f"{BULK_EMAIL_PREFIX}company%")
+    print(f"  ✓ 유저 {len(talent_ids) + len(company_user_ids):,}명")
+
+    # 2. TalentProfile (희망 조건은 기존 MOCK_TALENTS 값 분포에서 선택)
+    def mock_values(key: str) -> List[str]:
+        return sorted({t[key] for t in MOCK_TALENTS if t.get(key)})
+
+    columns = {
+        key: pick(mock_values(key), talents)
+        for key in ("desired_role", "desired_salary", "desired_industry", "desired_company_size", "desired_work_location")
+    }
+    _bulk_insert(db, TalentProfile, [
+        {"user_id": uid, "name": f"Load Talent {i}", "is_submitted": True, **{k: v[i] for k, v in columns.items()}}
+        for i, uid in enumerate(talent_ids)
+    ], batch_size)
+    print(f"  ✓ 인재 프로필 {talents:,}개")
+
+    # 3. Company
+    sizes = pick(["1 ~ 10명", "10 ~ 50명", "50 ~ 100명", "100 ~ 200명", "200 ~ 500명", "500 ~ 1000명", "1000명 이상"], companies)
+    industries = pick(mock_values("desired_industry"), companies)
+    _bulk_insert(db, Company, [
+        {"owner_user_id": uid, "name": f"Load Company {i}", "industry": industries[i], "size": sizes[i],
+         "location_city": "서울", "is_submitted": 1, "profile_step": 3}
+        for i, uid in enumerate(company_user_ids)
+    ], batch_size)
+    # id 목록을 IN 파라미터로 넘기지 않고 대량 계정 email 접두어로 join (수십만 개 bind 방지)
+    company_rows = db.execute(
+        select(Company.id, Company.owner_user_id)
+        .join(User, User.id == Company.owner_user_id)
+        .where(User.email.like(f"{BULK_EMAIL_PREFIX}%"))
+        .order_by(Company.id)
+    ).all()
+    print(f"  ✓ 기업 {len(company_rows):,}개")
+
+    # 4. JobPosting (기업에 라운드로빈 배분)
+    locations = pick([e.value for e in LocationEnum], postings)
+    salaries = pick([e.value for e in SalaryRangeEnum], postings)
+    employment = pick(["정규직", "계약직", "인턴"], postings)
+    owners = [company_rows[i % len(company_rows)] for i in range(postings)]
+    _bulk_insert(db, JobPosting, [
+        {"company_id": owners[i].id, "title": f"Load Posting {i}", "employment_type": employment[i],
+         "location_city": locations[i], "career_level": "경력 무관", "education_level": "학력 무관",
+         "salary_range": salaries[i], "status": "PUBLISHED"}
+        for i in range(postings)
+    ], batch_size)
+    posting_rows = db.execute(
+        select(JobPosting.id, JobPosting.company_id)
+        .join(Company, Company.id == JobPosting.company_id)
+        .join(User, User.id == Company.owner_user_id)
+        .where(User.email.like(f"{BULK_EMAIL_PREFIX}%"))
+        .order_by(JobPosting.id)
+    ).all()
+    owner_by_company = {row.id: row.owner_user_id for row in company_rows}
+    print(f"  ✓ 채용공고 {len(posting_rows):,}개")
+
+    # 5. MatchingVector
+    talent_vectors = _unit_vectors(rng, len(talent_ids), dims)
+    posting_vectors = _unit_vectors(rng, len(posting_rows), dims)
+    _bulk_insert(db, MatchingVector, _vector_rows(talent_vectors, [
+        {"user_id": uid, "role": "talent", "job_posting_id": None, "updated_at": now} for uid in talent_ids
+    ]), batch_size)
+    _bulk_insert(db, MatchingVector, _vector_rows(posting_vectors, [
+        {"user_id": owner_by_company[row.company_id], "role": "company", "job_posting_id": row.id, "updated_at": now}
+        for row in posting_rows
+    ]), batch_size)
+    vector_rows = db.execute(
+        select(MatchingVector.id, MatchingVector.user_id, MatchingVector.job_posting_id)
+        .join(User, User.id == MatchingVector.user_id)
+        .where(User.email.like(f"{BULK_EMAIL_PREFIX}%"))
+    ).all()
+    talent_vector_id = {r.user_id: r.id for r in vector_rows if r.job_posting_id is None}
+    posting_vector_id = {r.job_posting_id: r.id for r in vector_rows if r.job_posting_id is not None}
+    print(f"  ✓ 매칭 벡터 {len(vector_rows):,}개")
+
+    # 6. MatchingResult: 공고마다 인재 k명 샘플링 → 필드별 cosine을 einsum으로 일괄 계산
+    k = min(results_per_posting, len(talent_ids))
+    result_count = 0
+    talent_ids_arr = np.asarray(talent_ids)
+    chunk = max(1, batch_size // max(k, 1))
+    for start in range(0, len(posting_rows), chunk):
+        rows_chunk = posting_rows[start:start + chunk]
+        sampled = np.stack([rng.choice(len(talent_ids), size=k, replace=False) for _ in rows_chunk])
+        cosine = np.einsum("pkfd,pfd->pkf", talent_vectors[sampled], posting_vectors[start:start + len(rows_chunk)])
+        field_scores = (np.clip(cosine, -1.0, 1.0) + 1.0) * 50.0
+        total_scores = (np.clip(cosine.mean(axis=2), -1.0, 1.0) + 1.0) * 50.0
+
+        batch = []
+        for p, posting in enumerate(rows_chunk):
+            company_user_id = owner_by_company[posting.company_id]
+            for j, talent_index in enumerate(sampled[p]):
+                talent_user_id = int(talent_ids_arr[talent_index])
+                scores = field_scores[p, j].round(2).tolist()
+                batch.append({
+                    "talent_vector_id": talent_vector_id[talent_user_id],
+                    "company_vector_id": posting_vector_id[posting.id],
+                    "talent_user_id": talent_user_id,
+                    "company_user_id": company_user_id,
+                    "job_posting_id": posting.id,
+                    "total_score": round(float(total_scores[p, j]), 2),
+                    **{f"score_{field.removeprefix('vector_')}": scores[i] for i, field in enumerate(VECTOR_FIELDS)},
+                })
+        if not batch:
+            continue
+        db.execute(insert(MatchingResult), batch)
+        result_count += len(batch)
+    print(f"  ✓ 매칭 결과 {result_count:,}개 (공고당 {k}명)")
+
+    db.commit()
+    print("\n✅ 대량 시드 완료!\n")
+    return {
+        "talents": len(talent_ids),
+        "companies": len(company_rows),
+        "postings": len(posting_rows),
+        "vectors": len(vector_rows),
+        "results": result_count,
+    }
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 🚀 메인 실행 함수
@@ -1239,7 +1460,35 @@ def main():
     
     parser = argparse.ArgumentParser(description="FitConnect Mock 데이터 생성 스크립트")
     parser.add_argument("--clean", action="store_true", help="기존 Mock 데이터 삭제 후 생성")
+    parser.add_argument("--talents", type=int, help="대량 시드 모드: 인재 수")
+    parser.add_argument("--postings", type=int, help="대량 시드 모드: 채용공고 수")
+    parser.add_argument("--companies", type=int, help="대량 시드 모드: 기업 수 (기본: 공고 수 / 4)")
+    parser.add_argument("--dims", type=int, default=64, help="대량 시드 모드: 벡터 차원")
+    parser.add_argument("--results-per-posting", type=int, default=50, help="대량 시드 모드: 공고당 매칭 결과 수")
+    parser.add_argument("--batch-size", type=int, default=2000, help="대량 시드 모드: INSERT batch 크기")
     args = parser.parse_args()
+
+    if args.talents or args.postings:
+        db = SessionLocal()
+        try:
+            if args.clean:
+                clean_bulk_data(db)
+            seed_bulk(
+                db,
+                talents=args.talents or 0,
+                postings=args.postings or 0,
+                dims=args.dims,
+                companies=args.companies,
+                results_per_posting=args.results_per_posting,
+                batch_size=args.batch_size,
+            )
+            print("🔐 로그인 정보: load-talent000000@fitconnect.test / load-company000000@fitconnect.test (password123)")
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return
     
     print("\n" + "=" * 60)
     print("🎭 FitConnect Mock 데이터 생성 스크립트")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+🧬 카드 텍스트 → 매칭 벡터 생성
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+TalentCard / JobPostingCard 텍스트에서 vector_roles ~ vector_culture 6종을 만들어 저장한다.
+기본 encoder는 네트워크 없이 동작하는 hashing encoder (EMBEDDING_ENCODER / EMBEDDING_DIMS).
+
+📝 사용법:
+    poetry run python scripts/vectorize_cards.py                      # 인재 + 공고 카드 전체
+    poetry run python scripts/vectorize_cards.py --kind talent --workers 4 --batch-size 1000
+    poetry run python scripts/vectorize_cards.py --kind job_posting --ids 12 15 --rematch
+    poetry run python scripts/vectorize_cards.py --backfill           # 현재 encoder와 버전이 다른 벡터만 재인코딩
+    poetry run python scripts/vectorize_cards.py --backfill --no-rematch
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.settings import settings
+from app.core.text_encoder import get_encoder
+from app.db.session import SessionLocal
+from app.services import card_embedding
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Card text → matching vector pipeline")
+    parser.add_argument("--kind", choices=[*card_embedding.KINDS, "all"], default="all")
+    parser.add_argument("--ids", type=int, nargs="*", help="카드 id (생략 시 전체)")
+    parser.add_argument("--encoder", default=settings.EMBEDDING_ENCODER)
+    parser.add_argument("--dims", type=int, default=settings.EMBEDDING_DIMS)
+    parser.add_argument("--batch-size", type=int, default=settings.EMBEDDING_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=settings.EMBEDDING_WORKERS)
+    parser.add_argument(
+        "--rematch", action=argparse.BooleanOptionalAction, default=None,
+        help="자동 매칭 재계산 (기본: 일반 실행은 생략, --backfill은 전체 재인코딩 후 한 번에 수행)",
+    )
+    parser.add_argument("--backfill", action="store_true", help="model_version이 현재 encoder와 다른 벡터만 재인코딩")
+    args = parser.parse_args()
+
+    encoder = get_encoder(args.encoder, args.dims)
+    kinds = card_embedding.KINDS if args.kind == "all" else (args.kind,)
+    print("━" * 60)
+    print(f"🧬 encoder={encoder.name} batch={args.batch_size} workers={args.workers}")
+    print("━" * 60)
+    with SessionLocal() as db:
+        if args.backfill:
+            summary = card_embedding.backfill(
+                db, encoder=encoder, batch_size=args.batch_size, workers=args.workers,
+                rematch=args.rematch is not False,
+            )
+            print(
+                f"  대상 {summary['stale']}건 → 재인코딩 {summary['cards']}건 (카드 없음 {summary['skipped']}건), "
+                f"재매칭 {summary['rematched']}건  {summary['seconds']:.2f}s  {summary['cards_per_minute']} cards/min"
+            )
+            return
+        for kind in kinds:
+            summary = card_embedding.run(
+                db, kind, encoder=encoder, batch_size=args.batch_size, workers=args.workers,
+                ids=args.ids, rematch=bool(args.rematch),
+            )
+            print(
+                f"  {kind:<12} {summary['cards']:>7}건 (신규 {summary['created']}, 갱신 {summary['updated']})"
+                f"  {summary['seconds']:>8.2f}s  {summary['cards_per_minute']} cards/min"
+            )
+
+
+if __name__ == "__main__":
+    main()
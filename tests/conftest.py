@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+# app.core.settings requires these at import time; tests never touch the real DB.
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("DB_HOST", "localhost")
+os.environ.setdefault("DB_USER", "test")
+os.environ.setdefault("DB_PASSWORD", "test")
+os.environ.setdefault("DB_NAME", "test")
+
+QUERY_BASELINE_PATH = Path(__file__).parent / "query_baseline.json"
+VECTOR_FIELDS = ("roles", "skills", "growth", "career", "vision", "culture")
+
+
+@pytest.fixture()
+def db_engine() -> Iterator[Engine]:
+    from app.core import serialization
+    from app.models import Base
+
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        json_serializer=serialization.dumps,
+        json_deserializer=serialization.loads,
+        future=True,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def client(db_engine: Engine, monkeypatch: pytest.MonkeyPatch):
+    """모든 세션 팩토리(get_db, get_read_db, 서비스의 SessionLocal/read_session)를 SQLite 엔진으로 연결한 TestClient"""
+    from fastapi.testclient import TestClient
+
+    from app.db import session as db_session
+    from app.main import app
+
+    monkeypatch.setattr(db_session.SessionLocal, "kw", {**db_session.SessionLocal.kw, "bind": db_engine})
+    monkeypatch.setattr(db_session.ReadSessionLocal, "kw", {**db_session.ReadSessionLocal.kw, "bind": db_engine})
+    monkeypatch.setattr(db_session.read_router, "primary", db_engine)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture()
+def assert_max_queries(db_engine: Engine):
+    """
+    route별 최대 쿼리 수(tests/query_baseline.json)를 넘으면 실패
+    - 새 route는 baseline에 항목을 추가하고, 쿼리 수를 줄였다면 baseline 값도 낮춘다
+        with assert_max_queries("GET /api/job-postings/{job_posting_id}"):
+            client.get(f"/api/job-postings/{posting_id}")
+    """
+    from app.db.instrumentation import count_queries
+
+    baseline = json.loads(QUERY_BASELINE_PATH.read_text())
+
+    @contextmanager
+    def _assert(route: str):
+        assert route in baseline, f"{route} has no entry in {QUERY_BASELINE_PATH.name}"
+        with count_queries(db_engine) as counter:
+            yield counter
+        assert counter.count <= baseline[route], (
+            f"{route} issued {counter.count} queries (baseline {baseline[route]}):\n{counter.report()}"
+        )
+
+    return _assert
+
+
+@pytest.fixture()
+def auth_headers():
+    """user → Bearer access token 헤더"""
+    from app.core.security import create_access_token
+
+    def _headers(user) -> dict:
+        token = create_access_token({"sub": str(user.id), "email": user.email, "role": user.role})
+        return {"Authorization": f"Bearer {token}"}
+
+    return _headers
+
+
+@pytest.fixture()
+def vector_payload():
+    """모든 matching vector 필드에 같은 값을 넣은 dict (MatchingVector(**...) / POST body 공용), list는 {"vector": list}로"""
+
+    def _payload(value) -> dict:
+        field = {"vector": value} if isinstance(value, list) else value
+        return {f"vector_{name}": field for name in VECTOR_FIELDS}
+
+    return _payload
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.autocomplete import PrefixIndex, normalize
+from app.models.company import Company
+from app.models.job_posting import JobPosting
+from app.models.talent_card import TalentCard
+from app.models.user import User
+from app.repositories import autocomplete_index
+
+AUTOCOMPLETE = "/api/autocomplete"
+
+
+def test_hangul_prefix_matches_partial_syllables() -> None:
+    assert normalize("과") == "ㄱㅗㅏ"
+    index = PrefixIndex()
+    index.set(1, ["백엔드 개발자", "Python"])
+    index.set(2, ["백엔드 개발자", "백엔드"])
+    index.set(3, ["네이버 클라우드"])
+
+    values = lambda q: [item["value"] for item in index.search(q)]  # noqa: E731
+    assert values("백") == ["백엔드 개발자", "백엔드"]  # 많이 쓰인 값 먼저
+    assert values("백ㅇ") == ["백엔드 개발자", "백엔드"]
+    assert values("개ㅂ") == ["백엔드 개발자"]  # 단어 시작 위치 + 받침으로 입력 중인 다음 글자
+    assert values("PY") == ["Python"]
+    assert values("클라") == ["네이버 클라우드"]
+    assert values("밴") == []
+
+
+def test_set_applies_only_the_difference() -> None:
+    index = PrefixIndex()
+    index.rebuild([(1, ["Python", "Go"]), (2, ["Python"])])
+    index.set(1, ["Go", "Rust"])
+    assert index.search("py") == [{"value": "Python", "count": 1}]
+    index.remove(2)
+    assert index.search("py") == []
+    assert index.stats() == {"rows": 1, "values": 2, "keys": 2}
+
+
+@pytest.fixture()
+def seeded(db_engine):
+    with Session(db_engine, expire_on_commit=False) as session:
+        owner = User(email="owner@example.com", password_hash="x", role="company")
+        talent = User(email="talent@example.com", password_hash="x", role="talent")
+        session.add_all([owner, talent])
+        session.flush()
+        company = Company(owner_user_id=owner.id, name="핏커넥트", industry="IT", location_city="서울")
+        session.add(company)
+        session.flush()
+        common = dict(
+            company_id=company.id, employment_type="정규직", location_city="서울", career_level="신입", education_level="무관"
+        )
+        session.add_all([
+            JobPosting(title="a", position="백엔드 개발자", position_group="개발", status="PUBLISHED", **common),
+            JobPosting(title="b", position="백엔드 개발자", status="PUBLISHED", **common),
+            JobPosting(title="c", position="비공개 직무", status="DRAFT", **common),
+        ])
+        session.commit()
+        autocomplete_index.build(session)
+        return {"talent": talent}
+
+
+def _values(res) -> list:
+    assert res.status_code == 200, res.json()
+    return [item["value"] for item in res.json()["data"]["items"]]
+
+
+def test_autocomplete_endpoint(client, seeded) -> None:
+    assert _values(client.get(AUTOCOMPLETE, params={"type": "position", "q": "ㄱ"})) == ["백엔드 개발자", "개발"]
+    assert client.get(AUTOCOMPLETE, params={"type": "position", "q": "백"}).json()["data"]["items"] == [
+        {"value": "백엔드 개발자", "count": 2}
+    ]
+    assert _values(client.get(AUTOCOMPLETE, params={"type": "position", "q": "비공"})) == []
+    assert _values(client.get(AUTOCOMPLETE, params={"type": "company", "q": "핏ㅋ"})) == ["핏커넥트"]
+    assert client.get(AUTOCOMPLETE, params={"type": "nope", "q": "a"}).status_code == 422
+
+
+def test_card_writes_update_index_on_commit(client, seeded) -> None:
+    assert _values(client.get(AUTOCOMPLETE, params={"type": "skill", "q": "fast"})) == []
+    body = {"user_id": seeded["talent"].id, "job_skills": [{"name": "FastAPI", "level": "high"}]}
+    assert client.post("/api/talent_cards/", json=body).status_code == 201
+    assert _values(client.get(AUTOCOMPLETE, params={"type": "skill", "q": "fast"})) == ["FastAPI"]
+
+
+def test_rows_deleted_elsewhere_drop_out_of_suggestions(client, db_engine, seeded) -> None:
+    body = {"user_id": seeded["talent"].id, "job_skills": [{"name": "FastAPI", "level": "high"}]}
+    assert client.post("/api/talent_cards/", json=body).status_code == 201
+    # 다른 워커에서 카드 삭제 (track 없이 직접 delete)
+    with Session(db_engine) as session:
+        session.query(TalentCard).delete()
+        session.commit()
+
+    assert _values(client.get(AUTOCOMPLETE, params={"type": "skill", "q": "fast"})) == []
+    assert autocomplete_index.stats()["skill"]["rows"] == 0
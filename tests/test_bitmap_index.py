@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from app.core.bitmap_index import BitmapIndex, from_ids, iter_ids
+from app.models.company import Company
+from app.models.user import User
+from app.repositories import job_posting_index, job_posting_repo
+
+
+def test_match_ands_fields_and_ors_values() -> None:
+    index = BitmapIndex(("city", "type"))
+    index.add(1, {"city": "서울", "type": "정규직"})
+    index.add(5, {"city": "경기", "type": "정규직"})
+    index.add(70, {"city": "부산", "type": "인턴"})
+
+    assert iter_ids(index.match({"city": ["서울", "경기"], "type": ["정규직"]})) == [1, 5]
+    assert iter_ids(index.match({"city": ["부산"], "type": None}), descending=True) == [70]
+    assert index.match({"city": ["대구"]}) == 0
+    assert index.counts("type") == {"정규직": 2, "인턴": 1}
+    assert index.counts("type", from_ids([5, 70, 99])) == {"정규직": 1, "인턴": 1}
+    assert from_ids([70, 1, 5]) == index.match({}) and from_ids([]) == 0
+
+
+def test_add_replaces_previous_values_and_remove_clears() -> None:
+    index = BitmapIndex(("city",))
+    index.add(3, {"city": "서울"})
+    index.add(3, {"city": "경기"})
+    assert index.counts("city") == {"경기": 1}
+
+    index.remove(3)
+    assert len(index) == 0
+    assert index.match({}) == 0
+    assert index.stats()["cardinality"] == {"city": 0}
+
+
+def test_rebuild_matches_incremental_adds() -> None:
+    rows = [(1, {"city": "서울", "type": "정규직"}), (9, {"city": "경기", "type": "정규직"}), (4, {"city": "서울", "type": "인턴"})]
+    added = BitmapIndex(("city", "type"))
+    for row_id, values in rows:
+        added.add(row_id, values)
+    rebuilt = BitmapIndex(("city", "type"))
+    rebuilt.add(100, {"city": "부산"})  # rebuild는 기존 내용을 대체
+    rebuilt.rebuild(rows)
+
+    assert rebuilt.stats() == added.stats()
+    assert rebuilt.match({"city": ["서울"]}) == added.match({"city": ["서울"]}) == from_ids([1, 4])
+    rebuilt.add(9, {"city": "서울", "type": "인턴"})
+    assert rebuilt.counts("city") == {"서울": 3}
+
+
+def _company(session: Session) -> Company:
+    owner = User(email="owner@example.com", password_hash="x", role="company")
+    session.add(owner)
+    session.flush()
+    company = Company(owner_user_id=owner.id, name="Acme", industry="IT", location_city="서울")
+    session.add(company)
+    session.flush()
+    return company
+
+
+def _data(title: str) -> dict:
+    return {
+        "title": title,
+        "employment_type": "정규직",
+        "location_city": "서울",
+        "career_level": "신입",
+        "education_level": "학력 무관",
+        "status": "PUBLISHED",
+    }
+
+
+def test_repo_writes_apply_on_commit_only(db_engine) -> None:
+    with Session(db_engine) as session:
+        job_posting_index.build(session)
+        company = _company(session)
+        kept = job_posting_repo.create(session, company.id, _data("kept"))
+        session.commit()
+        assert job_posting_index.index.counts("location_city") == {"서울": 1}
+
+        job_posting_repo.update_partial(session, kept, {"location_city": "경기"})
+        job_posting_repo.create(session, company.id, _data("rolled back"))
+        session.rollback()
+        assert job_posting_index.index.counts("location_city") == {"서울": 1}
+
+        job_posting_repo.update_partial(session, kept, {"location_city": "경기"})
+        session.commit()
+        assert job_posting_index.index.counts("location_city") == {"경기": 1}
+
+        job_posting_repo.soft_delete(session, kept)
+        session.commit()
+        assert len(job_posting_index.index) == 0
+
+
+def test_refresh_runs_in_background(client, db_engine, monkeypatch) -> None:
+    from app.core.settings import settings
+    from app.models.job_posting import JobPosting
+
+    with Session(db_engine) as session:
+        job_posting_index.build(session)
+        # 다른 워커가 쓴 공고 (track 없이 직접 insert)
+        session.add(JobPosting(company_id=_company(session).id, **_data("other worker")))
+        session.commit()
+    assert len(job_posting_index.index) == 0
+
+    monkeypatch.setattr(settings, "JOB_POSTING_INDEX_REFRESH_SECONDS", 0)
+    thread = job_posting_index.refresh_if_stale()
+    assert thread is not None
+    thread.join(timeout=5)
+    assert job_posting_index.index.counts("location_city") == {"서울": 1}
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.text_encoder import HashingEncoder, get_encoder
+from app.models.company import Company
+from app.models.job_posting import JobPosting
+from app.models.job_posting_card import JobPostingCard
+from app.models.matching_vector import MatchingVector
+from app.models.talent_card import TalentCard
+from app.models.user import User
+from app.services import card_embedding, vector_matching_service
+
+
+def test_hashing_encoder_is_stable_and_normalized() -> None:
+    encoder = HashingEncoder(dims=64)
+    vectors = encoder.encode(["파이썬 백엔드 개발자", "파이썬으로 백엔드를 개발", "UX 디자인 리서치", ""])
+    assert vectors.shape == (4, 64) and vectors.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(vectors[:3], axis=1), 1.0, rtol=1e-5)
+    assert not vectors[3].any()
+    assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+    np.testing.assert_array_equal(get_encoder("hashing", 64).encode(["파이썬 백엔드 개발자"])[0], vectors[0])
+    with pytest.raises(ValueError):
+        get_encoder("nope")
+
+
+@pytest.fixture()
+def cards(db_engine):
+    with Session(db_engine, expire_on_commit=False) as session:
+        owner = User(email="owner@example.com", password_hash="x", role="company")
+        talents = [User(email=f"t{i}@example.com", password_hash="x", role="talent") for i in range(3)]
+        session.add_all([owner, *talents])
+        session.flush()
+        company = Company(owner_user_id=owner.id, name="Acme", industry="IT", location_city="서울")
+        session.add(company)
+        session.flush()
+        posting = JobPosting(
+            company_id=company.id, title="Backend", employment_type="정규직", location_city="서울",
+            career_level="경력", education_level="무관", status="PUBLISHED",
+        )
+        session.add(posting)
+        session.flush()
+        session.add_all([
+            TalentCard(
+                user_id=talents[0].id, headline="파이썬 백엔드 개발자",
+                job_skills=[{"name": "FastAPI", "level": "high"}], experiences=["결제 서버 개발"],
+            ),
+            TalentCard(user_id=talents[1].id, headline="UX 디자이너", strengths=["사용자 리서치"]),
+            TalentCard(user_id=talents[2].id),  # 텍스트 없음 → 건너뜀
+            JobPostingCard(job_posting_id=posting.id, headline="백엔드 개발자", requirements=["FastAPI 경험"]),
+            JobPostingCard(job_posting_id=posting.id, headline="두 번째 카드는 사용하지 않음"),
+        ])
+        session.commit()
+        return {"owner": owner, "posting": posting, "talents": talents}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_pipeline_writes_six_vectors_per_card(db_engine, cards, workers) -> None:
+    encoder = HashingEncoder(dims=32)
+    with Session(db_engine) as session:
+        talent = card_embedding.run(session, "talent", encoder=encoder, batch_size=1, workers=workers)
+        company = card_embedding.run(session, "job_posting", encoder=encoder, workers=workers)
+        assert (talent["cards"], talent["created"]) == (2, 2)
+        assert (company["cards"], company["created"]) == (1, 1)
+
+        rows = {(row.role, row.user_id): row for row in session.execute(select(MatchingVector)).scalars()}
+        company_row = rows[("company", cards["owner"].id)]
+        assert company_row.job_posting_id == cards["posting"].id
+        assert company_row.vector_skills["model"] == "hashing-v1-32"
+        assert len(company_row.vector_culture["vector"]) == 32  # 빈 카테고리는 카드 전체 텍스트로 채움
+        assert ("talent", cards["talents"][2].id) not in rows
+
+        backend = vector_matching_service.match(session, rows[("talent", cards["talents"][0].id)].id, company_row.id)
+        designer = vector_matching_service.match(session, rows[("talent", cards["talents"][1].id)].id, company_row.id)
+        assert backend["total_similarity"] > designer["total_similarity"]
+
+        again = card_embedding.run(session, "talent", encoder=encoder, workers=workers)
+        assert (again["created"], again["updated"]) == (0, 2)
+
+
+def test_backfill_reencodes_stale_vectors_then_rematches(db_engine, cards) -> None:
+    from fastapi import HTTPException
+
+    from app.models.matching_result import MatchingResult
+    from app.services import matching_vector_service
+
+    legacy = {field: {"vector": [0.9, 0.8, 0.7, 0.6, 0.5]} for field in matching_vector_service.VECTOR_FIELDS}
+    with Session(db_engine) as session:
+        matching_vector_service.bulk_upsert(session, "talent", [{"user_id": t.id, **legacy} for t in cards["talents"]])
+        matching_vector_service.bulk_upsert(
+            session, "company", [{"user_id": cards["owner"].id, "job_posting_id": cards["posting"].id, **legacy}]
+        )
+        session.commit()
+        row = session.execute(select(MatchingVector).where(MatchingVector.role == "company")).scalar_one()
+        assert (row.model_version, row.dims, row.vector_roles["dim"]) == (None, 5, 5)
+
+        # 재인코딩 후 재매칭 전에 중단된 실행: 재인코딩한 벡터는 needs_rematch로 남는다
+        summary = card_embedding.backfill(session, encoder=HashingEncoder(dims=16), workers=1, rematch=False)
+        assert (summary["stale"], summary["cards"], summary["skipped"], summary["rematched"]) == (4, 3, 1, 0)
+        assert all(row.needs_rematch for row in session.execute(select(MatchingVector)).scalars())
+
+        # 다시 실행하면 더 인코딩할 것은 없지만 이전 실행분까지 모두 재매칭
+        summary = card_embedding.backfill(session, encoder=HashingEncoder(dims=16), workers=1)
+        assert (summary["stale"], summary["cards"], summary["rematched"]) == (1, 0, 4)
+        assert not any(row.needs_rematch for row in session.execute(select(MatchingVector)).scalars())
+
+        rows = {row.user_id: row for row in session.execute(select(MatchingVector)).scalars()}
+        company = rows[cards["owner"].id]
+        assert (company.model_version, company.dims) == ("hashing-v1-16", 16)
+        stale_talent = rows[cards["talents"][2].id]  # 카드가 비어 있어 이전 버전 그대로
+        assert stale_talent.model_version is None
+
+        # 같은 버전끼리만 결과가 저장되고, 버전이 다른 쌍은 비교하지 않는다
+        results = session.execute(select(MatchingResult.talent_vector_id)).scalars().all()
+        assert sorted(results) == sorted(rows[t.id].id for t in cards["talents"][:2])
+        with pytest.raises(HTTPException) as exc:
+            vector_matching_service.match(session, stale_talent.id, company.id)
+        assert exc.value.detail["code"] == "VECTOR_VERSION_MISMATCH"
+
+        again = card_embedding.backfill(session, encoder=HashingEncoder(dims=16), workers=1)
+        assert (again["stale"], again["cards"], again["rematched"]) == (1, 0, 0)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.ngram_index import NgramIndex
+from app.core.settings import settings
+from app.models.job_posting_card import JobPostingCard
+from app.models.talent_card import TalentCard
+from app.models.user import User
+from app.repositories import card_index
+
+SEARCH = "/api/cards/search"
+
+
+def test_fuzzy_search_ranks_by_matched_trigrams(tmp_path) -> None:
+    index = NgramIndex()
+    index.rebuild([(1, "파이썬 백엔드 개발 경험"), (2, "React 프론트엔드"), (3, "Python FastAPI 서버 개발")])
+
+    assert index.search("파이선") == [(1, 0.5)]  # 오탈자
+    assert [doc for doc, _ in index.search("pyhton", min_similarity=0.3)] == [3]
+    assert index.search("백엔드 개발", min_similarity=1.0) == [(1, 1.0)]  # 모든 trigram → 교집합
+    assert index.search("개발") == [(1, 1.0), (3, 1.0)]  # 동점은 trigram이 적은(짧은) 문서 먼저
+
+    index.set(2, "파이썬 데이터 분석")
+    index.remove(1)
+    assert index.search("파이썬") == [(2, 1.0)]
+
+    path = str(tmp_path / "cards.npz")
+    index.save(path, watermark="2026-10-19T00:00:00")
+    loaded = NgramIndex()
+    assert loaded.load(path) == {"watermark": "2026-10-19T00:00:00"}
+    assert loaded.stats() == index.stats()
+    assert loaded.search("pyhton", min_similarity=0.3) == index.search("pyhton", min_similarity=0.3)
+    assert NgramIndex().load(str(tmp_path / "missing.npz")) is None
+
+
+@pytest.fixture()
+def seeded(db_engine, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CARD_INDEX_SNAPSHOT_DIR", str(tmp_path))
+    with Session(db_engine, expire_on_commit=False) as session:
+        users = [User(email=f"t{i}@example.com", password_hash="x", role="talent") for i in range(3)]
+        session.add_all(users)
+        session.flush()
+        session.add_all([
+            TalentCard(user_id=users[0].id, headline="대용량 트래픽 백엔드", strengths=["쿠버네티스 운영"]),
+            TalentCard(user_id=users[1].id, headline="데이터 분석가", experiences=["쿠버네티스 기반 ML 파이프라인"]),
+        ])
+        session.commit()
+        card_index.build(session)
+        return {"users": users}
+
+
+def _owners(res, key: str = "user_id") -> list:
+    assert res.status_code == 200, res.json()
+    return [item[key] for item in res.json()["data"]["items"]]
+
+
+def test_search_endpoint_and_write_tracking(client, seeded) -> None:
+    users = seeded["users"]
+    assert _owners(client.get(SEARCH, params={"type": "talent", "q": "쿠버네티즈"})) == [users[0].id, users[1].id]
+    assert _owners(client.get(SEARCH, params={"type": "talent", "q": "백엔드"})) == [users[0].id]
+    assert client.get(SEARCH, params={"type": "company", "q": "a"}).status_code == 422
+
+    body = {"user_id": users[2].id, "headline": "쿠버네티스 SRE"}
+    assert client.post("/api/talent_cards/", json=body).status_code == 201
+    assert users[2].id in _owners(client.get(SEARCH, params={"type": "talent", "q": "SRE"}))
+
+
+def test_load_or_build_uses_snapshot_and_catches_up(db_engine, seeded) -> None:
+    card_index.indexes["talent"].rebuild([])
+    with Session(db_engine) as session:
+        # snapshot 이후 추가된 카드
+        session.add(JobPostingCard(job_posting_id=1, headline="Go 백엔드 엔지니어"))
+        session.commit()
+        card_index.load_or_build(session)
+        assert card_index.stats()["talent"]["loaded_from"] == "snapshot"
+        assert card_index.stats()["talent"]["docs"] == 2
+        assert [item["job_posting_id"] for item in card_index.search(session, "job_posting", "엔지니어", 10, 0.5)] == [1]
+
+
+def test_corrupt_snapshot_falls_back_to_build(db_engine, seeded) -> None:
+    with open(card_index.snapshot_path("talent"), "wb") as f:
+        f.write(b"not a zip archive")
+    card_index.indexes["talent"].rebuild([])
+    with Session(db_engine) as session:
+        card_index.load_or_build(session)
+        assert card_index.stats()["talent"]["loaded_from"] == "db"
+        assert card_index.stats()["talent"]["docs"] == 2
+    # build가 snapshot을 다시 저장했으므로 다음 시작은 snapshot에서
+    assert NgramIndex().load(card_index.snapshot_path("talent")) is not None
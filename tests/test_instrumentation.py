@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.settings import settings
+from app.db import instrumentation
+
+
+def test_normalize_sql_groups_same_shape() -> None:
+    a = instrumentation.normalize_sql("SELECT * FROM t WHERE id = 1 AND name = 'x'")
+    b = instrumentation.normalize_sql("SELECT *  FROM t\nWHERE id = 22 AND name = 'y''z'")
+    assert a == b
+    assert instrumentation.normalize_sql("SELECT 1 FROM t WHERE id IN (?, ?, ?)") == instrumentation.normalize_sql(
+        "SELECT 1 FROM t WHERE id IN (?)"
+    )
+
+
+def test_watch_raises_on_repeated_statement() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    with pytest.raises(instrumentation.NPlusOneDetected):
+        with instrumentation.watch("loop", threshold=3, raise_on_violation=True):
+            with engine.connect() as conn:
+                for i in range(4):
+                    conn.execute(text("SELECT :v"), {"v": i})
+
+    with instrumentation.watch("ok", threshold=3, raise_on_violation=True) as current:
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text("SELECT :v"), {"v": i})
+    assert current.violations() == []
+
+
+def test_slow_query_is_logged_with_route(monkeypatch, caplog) -> None:
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_MS", 1e-6)
+    engine = create_engine("sqlite:///:memory:")
+    with caplog.at_level(logging.WARNING, logger="app.db.slow"):
+        with instrumentation.watch("GET /things", threshold=0):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT :v"), {"v": 7})
+
+    message = caplog.records[-1].getMessage()
+    assert "route=GET /things" in message
+    assert "params=(7,)" in message
+
+
+def test_failed_statements_leave_nothing_on_connection() -> None:
+    from sqlalchemy.exc import OperationalError
+
+    engine = create_engine("sqlite:///:memory:")
+    with instrumentation.watch("errors", threshold=0) as current:
+        with engine.connect() as conn:
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+            assert not any(isinstance(value, list) for value in conn.info.values())
+    assert sum(current.counts.values()) == 1
+
+
+def test_middleware_fails_request_before_response_starts(monkeypatch) -> None:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setattr(settings, "DB_N_PLUS_ONE_THRESHOLD", 3)
+    monkeypatch.setattr(settings, "DB_N_PLUS_ONE_RAISE", True)
+    engine = create_engine("sqlite:///:memory:")
+    app = FastAPI()
+    app.add_middleware(instrumentation.QueryWatchMiddleware)
+
+    @app.get("/loop/{n}")
+    def loop(n: int):
+        with engine.connect() as conn:
+            for i in range(n):
+                conn.execute(text("SELECT :v"), {"v": i})
+        return {"ok": True}
+
+    client = TestClient(app, raise_server_exceptions=False)
+    assert client.get("/loop/3").status_code == 200
+    # 응답 헤더를 보내기 전에 검사하므로 200 대신 500
+    assert client.get("/loop/4").status_code == 500
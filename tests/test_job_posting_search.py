@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.company import Company
+from app.models.job_posting import JobPosting
+from app.models.user import User
+from app.repositories import job_posting_index
+from app.services import job_posting_service
+
+SEARCH = "/api/job-postings/search"
+FACETS = "/api/job-postings/search/facets"
+
+
+def _posting(company_id: int, title: str, **overrides) -> JobPosting:
+    fields = {
+        "company_id": company_id,
+        "title": title,
+        "employment_type": "정규직",
+        "location_city": "서울",
+        "career_level": "경력 3년 이상",
+        "education_level": "학력 무관",
+        "status": "PUBLISHED",
+    }
+    return JobPosting(**{**fields, **overrides})
+
+
+@pytest.fixture()
+def postings(db_engine):
+    with Session(db_engine, expire_on_commit=False) as session:
+        owner = User(email="owner@example.com", password_hash="x", role="company")
+        session.add(owner)
+        session.flush()
+        company = Company(owner_user_id=owner.id, name="Acme", industry="IT", location_city="서울", is_submitted=1)
+        session.add(company)
+        session.flush()
+        rows = [
+            _posting(company.id, "백엔드 개발자", requirements_must="Python, FastAPI"),
+            _posting(company.id, "프론트엔드 개발자", location_city="경기", competencies="React"),
+            _posting(company.id, "데이터 엔지니어", employment_type="계약직", responsibilities="Python 파이프라인"),
+            _posting(company.id, "백엔드 인턴", employment_type="인턴", location_city="부산"),
+            _posting(company.id, "임시 저장 공고", status="DRAFT"),
+            _posting(company.id, "마감된 백엔드", deadline_date=date.today() - timedelta(days=1)),
+        ]
+        session.add_all(rows)
+        session.commit()
+        # repo를 거치지 않은 직접 적재이므로 배치 적재 후처럼 bitmap index를 다시 만든다
+        job_posting_index.build(session)
+        job_posting_service.clear_facets_cache()
+        return {row.title: row.id for row in rows}
+
+
+def _titles(res) -> list:
+    assert res.status_code == 200, res.json()
+    return [item["title"] for item in res.json()["data"]["items"]]
+
+
+def test_filters_combine_with_and_and_values_with_or(client, postings) -> None:
+    assert _titles(client.get(SEARCH, params={"location_city": ["경기", "부산"]})) == ["백엔드 인턴", "프론트엔드 개발자"]
+    assert _titles(client.get(SEARCH, params={"location_city": "서울", "employment_type": "계약직"})) == ["데이터 엔지니어"]
+
+
+def test_excludes_draft_and_expired_by_default(client, postings) -> None:
+    titles = _titles(client.get(SEARCH))
+    assert "임시 저장 공고" not in titles
+    assert "마감된 백엔드" not in titles
+    assert "마감된 백엔드" in _titles(client.get(SEARCH, params={"open_only": "false"}))
+
+
+def test_keyword_matches_any_text_column(client, postings) -> None:
+    assert _titles(client.get(SEARCH, params={"q": "python"})) == ["데이터 엔지니어", "백엔드 개발자"]
+    assert _titles(client.get(SEARCH, params={"q": "백엔드 인턴"})) == ["백엔드 인턴"]
+
+
+def test_keyset_pagination_walks_all_pages(client, postings, assert_max_queries) -> None:
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        with assert_max_queries("GET /api/job-postings/search"):
+            res = client.get(SEARCH, params=params)
+        seen += _titles(res)
+        cursor = res.json()["data"]["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == ["백엔드 인턴", "데이터 엔지니어", "프론트엔드 개발자", "백엔드 개발자"]
+
+
+def test_invalid_filter_and_cursor(client, postings) -> None:
+    res = client.get(SEARCH, params={"status": "DRAFT"})
+    assert res.status_code == 422
+    assert res.json()["error"]["code"] == "VALIDATION_ERROR"
+    assert client.get(SEARCH, params={"cursor": "not-a-cursor"}).status_code == 422
+
+
+def _facet(data: dict, field: str) -> dict:
+    return {item["value"]: item["count"] for item in data["facets"][field]}
+
+
+@pytest.mark.parametrize("use_index", [True, False])
+def test_facets_exclude_own_filter(client, postings, monkeypatch, use_index) -> None:
+    monkeypatch.setattr(settings, "JOB_POSTING_INDEX_ENABLED", use_index)
+    res = client.get(FACETS, params={"location_city": "서울"})
+    assert res.status_code == 200, res.json()
+    data = res.json()["data"]
+    assert data["total"] == 2
+    assert _facet(data, "location_city") == {"서울": 2, "경기": 1, "부산": 1}
+    assert _facet(data, "employment_type") == {"정규직": 1, "계약직": 1}
+
+    data = client.get(FACETS, params={"location_city": "서울", "open_only": "false", "q": "백엔드"}).json()["data"]
+    assert data["total"] == 2
+    assert _facet(data, "location_city") == {"서울": 2, "부산": 1}
+
+
+def test_facets_are_cached_per_filter_signature(client, postings) -> None:
+    params = {"employment_type": ["계약직", "정규직"]}
+    first = client.get(FACETS, params=params).json()["data"]
+    before = job_posting_service.facets_cache_stats()["hits"]
+    # 값 순서만 다른 같은 조건은 같은 캐시 항목
+    again = client.get(FACETS, params={"employment_type": ["정규직", "계약직"]}).json()["data"]
+    assert again == first
+    assert job_posting_service.facets_cache_stats()["hits"] == before + 1
+    assert client.get(FACETS, params={"status": "DRAFT"}).status_code == 422
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.company import Company
+from app.models.job_posting import JobPosting
+from app.models.matching_result import MatchingResult
+from app.models.matching_vector import MatchingVector
+from app.models.profile import TalentProfile
+from app.models.user import User
+from app.services import matching_constraints as mc
+from app.services import matching_vector_service
+
+ALL = frozenset(mc.CONSTRAINT_FIELDS)
+
+
+def test_parse_free_text_preferences() -> None:
+    assert mc.parse_locations("서울·경기 전체") == {"서울", "경기"}
+    assert mc.parse_locations("지역 무관") is None
+    assert mc.parse_min_salary("5,000만원 이상") == 5000
+    assert mc.parse_min_salary("1.2억") == 12000
+    assert mc.parse_min_salary("1억 2천만원") == 12000
+    assert mc.parse_min_salary("1억2000만원 이상") == 12000
+    assert mc.parse_min_salary("8000만 ~ 1억") == 8000
+    assert mc.parse_headcount("501~1,000명") == (501, 1000)
+    assert mc.parse_headcount("1000명 이상") == (1000, float("inf"))
+    assert mc.parse_industries("IT·인터넷") == ("it", "인터넷")
+    assert mc.industry_ok(("it",), "IT 서비스") and mc.industry_ok(("it 서비스",), "IT")
+    assert not mc.industry_ok(("it",), "Digital Media")
+
+
+def test_company_candidate_mask() -> None:
+    prefs = mc.parse_preferences("서울·경기 전체", "5,000만원 이상", "51~200명", "IT·인터넷", ALL)
+    mask = mc.company_candidate_mask(
+        prefs,
+        locations=["서울", "부산", "경기", "서울", "서울"],
+        salary_ranges=["5000만 ~ 6000만", "5000만 ~ 6000만", "연봉 추후 협상", "3000만 ~ 4000만", None],
+        sizes=["100 ~ 200명", "100 ~ 200명", None, "100 ~ 200명", "10 ~ 50명"],
+        industries=["IT", "IT", "제조", "IT", "IT 서비스"],
+    )
+    assert mask.tolist() == [True, False, False, False, False]
+
+
+def test_talent_candidate_mask_only_uses_enabled_constraints() -> None:
+    kwargs = dict(
+        location="서울",
+        salary_range="3000만 ~ 4000만",
+        size="1000명 이상",
+        industry="금융",
+        desired_locations=["서울 전체", "부산", None],
+        desired_salaries=["5,000만원 이상", None, "3,000만원"],
+        desired_sizes=[None, None, None],
+        desired_industries=[None, None, None],
+    )
+    assert mc.talent_candidate_mask(frozenset({"location"}), **kwargs).tolist() == [True, False, True]
+    assert mc.talent_candidate_mask(ALL, **kwargs).tolist() == [False, False, True]
+
+
+def test_auto_matching_skips_and_removes_excluded_pairs(db_engine, monkeypatch, vector_payload) -> None:
+    monkeypatch.setattr(settings, "MATCHING_HARD_CONSTRAINTS", "location")
+    with Session(db_engine) as session:
+        owner = User(email="owner@example.com", password_hash="x", role="company")
+        talent = User(email="talent@example.com", password_hash="x", role="talent")
+        session.add_all([owner, talent])
+        session.flush()
+        company = Company(owner_user_id=owner.id, name="Acme", industry="IT", location_city="서울")
+        session.add(company)
+        session.add(TalentProfile(user_id=talent.id, name="T", desired_work_location="서울 전체"))
+        session.flush()
+        vectors = {}
+        for city in ("서울", "부산"):
+            posting = JobPosting(
+                company_id=company.id, title=city, employment_type="정규직", location_city=city,
+                career_level="신입", education_level="학력 무관", status="PUBLISHED",
+            )
+            session.add(posting)
+            session.flush()
+            vectors[city] = MatchingVector(
+                user_id=owner.id, role="company", job_posting_id=posting.id, updated_at=datetime.utcnow(),
+                **vector_payload([2.0, 2.0, 1.0]),
+            )
+            session.add(vectors[city])
+        talent_vector = MatchingVector(
+            user_id=talent.id, role="talent", updated_at=datetime.utcnow(), **vector_payload([1.0, 1.0, 1.0])
+        )
+        session.add(talent_vector)
+        session.flush()
+        # 제약 적용 전에 저장된 결과는 다음 재계산 때 정리된다
+        session.add(MatchingResult(
+            talent_vector_id=talent_vector.id, company_vector_id=vectors["부산"].id, talent_user_id=talent.id,
+            company_user_id=owner.id, job_posting_id=vectors["부산"].job_posting_id, total_score=50,
+        ))
+        session.flush()
+
+        matching_vector_service._calculate_all_matches_for_talent(session, talent_vector)
+
+        stored = session.query(MatchingResult.company_vector_id).all()
+        assert [row[0] for row in stored] == [vectors["서울"].id]
+
+        # 후보로 넘긴 id만 판정하고, 후보 id는 IN_BATCH_SIZE개씩 나눠 조회한다
+        location = frozenset({"location"})
+        assert mc.excluded_company_vectors(session, talent.id, [vectors["서울"].id], location) == set()
+        monkeypatch.setattr(mc, "IN_BATCH_SIZE", 1)
+        candidate_ids = [vectors["서울"].id, vectors["부산"].id]
+        assert mc.excluded_company_vectors(session, talent.id, candidate_ids, location) == {vectors["부산"].id}
+
+
+def test_delete_pairs_in_batches(db_engine, vector_payload) -> None:
+    from app.repositories import matching_result_repo
+
+    with Session(db_engine) as session:
+        owner = User(email="owner@example.com", password_hash="x", role="company")
+        talent = User(email="talent@example.com", password_hash="x", role="talent")
+        session.add_all([owner, talent])
+        session.flush()
+        company = Company(owner_user_id=owner.id, name="Acme", industry="IT", location_city="서울")
+        session.add(company)
+        session.flush()
+        postings = [
+            JobPosting(
+                company_id=company.id, title=f"Backend {i}", employment_type="정규직", location_city="서울",
+                career_level="신입", education_level="학력 무관", status="PUBLISHED",
+            )
+            for i in range(3)
+        ]
+        session.add_all(postings)
+        session.flush()
+        talent_vector = MatchingVector(
+            user_id=talent.id, role="talent", updated_at=datetime.utcnow(), **vector_payload([1.0, 1.0, 1.0])
+        )
+        company_vectors = [
+            MatchingVector(
+                user_id=owner.id, role="company", job_posting_id=posting.id, updated_at=datetime.utcnow(),
+                **vector_payload([2.0, 2.0, 1.0]),
+            )
+            for posting in postings
+        ]
+        session.add_all([talent_vector, *company_vectors])
+        session.flush()
+        for vector in company_vectors:
+            session.add(MatchingResult(
+                talent_vector_id=talent_vector.id, company_vector_id=vector.id, talent_user_id=talent.id,
+                company_user_id=owner.id, job_posting_id=vector.job_posting_id, total_score=50,
+            ))
+        session.flush()
+
+        removed = [vector.id for vector in company_vectors[:2]]
+        assert matching_result_repo.delete_pairs(session, [talent_vector.id], removed, batch_size=1) == 2
+        stored = session.query(MatchingResult.company_vector_id).all()
+        assert [row[0] for row in stored] == [company_vectors[2].id]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+
+from app.core import memory
+
+
+@pytest.fixture
+def tracing():
+    was_tracing = tracemalloc.is_tracing()
+    memory.start(frames=5)
+    yield
+    memory.clear()
+    if not was_tracing:
+        memory.stop()
+
+
+def _allocate() -> list:
+    return [bytearray(1024) for _ in range(2000)]
+
+
+def test_diff_reports_new_allocation_site(tracing) -> None:
+    base = memory.take_snapshot("base")
+    kept = _allocate()
+    target = memory.take_snapshot("target")
+
+    stats = memory.diff(base["id"], target["id"], limit=5)
+
+    assert stats[0]["size_diff_bytes"] >= 2000 * 1024
+    assert "test_memory.py" in stats[0]["traceback"][0]
+    assert memory.top(target["id"], limit=3)
+    del kept
+
+
+def test_snapshot_requires_tracing_and_unknown_id() -> None:
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc already enabled for this run")
+    with pytest.raises(RuntimeError):
+        memory.take_snapshot()
+    with pytest.raises(memory.SnapshotNotFound):
+        memory.top(999_999)
+
+
+def test_peak_tracker_measures_transient_allocation(tracing) -> None:
+    tracker = memory.PeakTracker().start()
+    data = _allocate()
+    del data
+    usage = tracker.stop()
+
+    assert usage["traced_peak_bytes"] >= 2000 * 1024
+    assert "peak_mem=" in tracker.describe()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from app.core.metrics import Counter, Histogram, Registry
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = Registry()
+    hist = registry.register(Histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0)))
+    hist.observe(0.05, route="/a")
+    hist.observe(0.5, route="/a")
+    hist.observe(5.0, route="/a")
+
+    text = registry.render()
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+    assert 'latency_seconds_sum{route="/a"} 5.55' in text
+
+
+def test_counter_escapes_label_values() -> None:
+    registry = Registry()
+    counter = registry.register(Counter("errors_total", "Errors", ("code",)))
+    counter.inc(code='BAD "QUOTE"')
+    counter.inc(2, code='BAD "QUOTE"')
+
+    assert 'errors_total{code="BAD \\"QUOTE\\""} 3' in registry.render()
+
+
+def test_metrics_endpoint_exposes_request_histogram(monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    from app.core.settings import settings
+    from app.main import app
+
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "admin-key")
+    client = TestClient(app)
+    client.get("/health")
+    assert client.get("/metrics").status_code == 403
+    res = client.get("/metrics", headers={"X-Admin-Key": "admin-key"})
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'fitconnect_http_request_duration_seconds_count{method="GET",route="/health"}' in res.text
+    assert "fitconnect_db_pool_size" in res.text
+
+
+def test_errors_are_counted_from_responses() -> None:
+    from fastapi import FastAPI, HTTPException
+    from fastapi.responses import JSONResponse
+    from fastapi.testclient import TestClient
+
+    from app.core import metrics
+    from app.core.request_timing import RequestTimingMiddleware
+
+    app = FastAPI()
+    app.add_middleware(RequestTimingMiddleware, server_timing=False, access_log=False)
+
+    @app.get("/raised")
+    def raised():
+        raise HTTPException(status_code=404, detail={"code": "T_RAISED", "message": "x"})
+
+    @app.get("/returned")
+    def returned():
+        # 예외 객체를 만들기만 하고 삼킨 에러는 세지 않는다
+        HTTPException(status_code=500, detail={"code": "T_SWALLOWED", "message": "x"})
+        return JSONResponse(status_code=409, content={"ok": False, "error": {"code": "T_RETURNED", "message": "x"}})
+
+    def count(code: str) -> float:
+        return metrics.errors_total.value(code=code)
+
+    before = {code: count(code) for code in ("T_RAISED", "T_RETURNED", "T_SWALLOWED")}
+    client = TestClient(app)
+    client.get("/raised")
+    client.get("/returned")
+    client.get("/returned")
+    client.get("/raised")
+
+    assert count("T_RAISED") - before["T_RAISED"] == 2
+    assert count("T_RETURNED") - before["T_RETURNED"] == 2
+    assert count("T_SWALLOWED") == before["T_SWALLOWED"]
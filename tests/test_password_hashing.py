@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core.security import BoundedHashExecutor, PasswordHasherBusy, pwd_context
+
+
+def test_executor_rejects_when_saturated() -> None:
+    executor = BoundedHashExecutor(workers=1, max_queue=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow() -> str:
+        started.set()
+        release.wait(timeout=5)
+        return "done"
+
+    results: list[str] = []
+    worker = threading.Thread(target=lambda: results.append(executor.run(slow)))
+    worker.start()
+    assert started.wait(timeout=5)
+
+    with pytest.raises(PasswordHasherBusy):
+        executor.run(lambda: "never")
+
+    release.set()
+    worker.join(timeout=5)
+    assert results == ["done"]
+    stats = executor.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 1
+    assert stats["queue_depth"] == 0
+
+
+def test_run_async_counts_failures_separately() -> None:
+    import asyncio
+
+    executor = BoundedHashExecutor(workers=1, max_queue=0)
+
+    def boom() -> None:
+        raise ValueError("bad hash")
+
+    async def scenario() -> str:
+        with pytest.raises(ValueError):
+            await executor.run_async(boom)
+        return await executor.run_async(lambda: "ok")
+
+    assert asyncio.run(scenario()) == "ok"
+    stats = executor.stats()
+    assert (stats["completed"], stats["failed"], stats["rejected"]) == (1, 1, 0)
+
+
+def test_verify_and_update_rehashes_outdated_hash() -> None:
+    old_context = CryptContext(schemes=["bcrypt_sha256"], bcrypt_sha256__rounds=4)
+    old_hash = old_context.hash("secret-pw")
+
+    verified, new_hash = pwd_context.verify_and_update("secret-pw", old_hash)
+
+    assert verified is True
+    assert new_hash is not None and new_hash != old_hash
+    assert pwd_context.verify("secret-pw", new_hash)
+
+
+def test_async_login_and_register_routes(client) -> None:
+    body = {"email": "hash@example.com", "password": "secret-pw1", "role": "company"}
+    assert client.post("/auth/register", json=body).status_code == 200
+    assert client.post("/auth/register", json=body).status_code == 400
+    assert client.post("/auth/login", json={"email": body["email"], "password": "secret-pw1"}).status_code == 200
+    assert client.post("/auth/login", json={"email": body["email"], "password": "wrong"}).status_code == 401
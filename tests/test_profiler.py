@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.profiler import SamplingProfilerMiddleware
+
+
+def _busy_work() -> None:
+    deadline = time.perf_counter() + 0.1
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+def _client(tmp_path) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(SamplingProfilerMiddleware, output_dir=str(tmp_path), interval_ms=2, admin_key="secret")
+
+    @app.get("/slow/{item_id}")
+    def slow(item_id: int):
+        _busy_work()
+        return {"id": item_id}
+
+    return TestClient(app)
+
+
+def test_profiles_request_with_admin_header(tmp_path) -> None:
+    client = _client(tmp_path)
+    res = client.get("/slow/1", headers={"X-Profile": "1", "X-Admin-Key": "secret"})
+
+    name = res.headers["x-profile-file"]
+    assert name.endswith("-GET-slow_item_id.collapsed")
+    content = (tmp_path / name).read_text()
+    assert "_busy_work (tests/test_profiler.py:" in content
+    stack, count = content.splitlines()[0].rsplit(" ", 1)
+    assert int(count) > 0
+
+
+def test_skips_request_without_valid_key(tmp_path) -> None:
+    client = _client(tmp_path)
+    res = client.get("/slow/1", headers={"X-Profile": "1", "X-Admin-Key": "wrong"})
+
+    assert "x-profile-file" not in res.headers
+    assert list(tmp_path.iterdir()) == []
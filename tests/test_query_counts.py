@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.db.instrumentation import count_queries
+from app.models.company import Company
+from app.models.job_posting import JobPosting
+from app.models.matching_vector import MatchingVector
+from app.models.profile import TalentProfile
+from app.models.user import User
+
+TALENTS = 3
+
+
+@pytest.fixture()
+def seeded(db_engine, vector_payload):
+    with Session(db_engine, expire_on_commit=False) as session:
+        owner = User(email="owner@example.com", password_hash="x", role="company")
+        talents = [User(email=f"talent{i}@example.com", password_hash="x", role="talent") for i in range(TALENTS)]
+        session.add_all([owner, *talents])
+        session.flush()
+
+        company = Company(owner_user_id=owner.id, name="Acme", industry="IT", location_city="서울", is_submitted=1)
+        session.add(company)
+        session.flush()
+        posting = JobPosting(
+            company_id=company.id,
+            title="Backend Engineer",
+            employment_type="정규직",
+            location_city="서울",
+            career_level="경력 3년 이상",
+            education_level="학력 무관",
+            status="PUBLISHED",
+        )
+        session.add(posting)
+        for i, talent in enumerate(talents):
+            session.add(TalentProfile(user_id=talent.id, name=f"Talent {i}", is_submitted=True))
+            vectors = vector_payload([i + 1.0, i + 1.0, 1.0])
+            session.add(MatchingVector(user_id=talent.id, role="talent", updated_at=datetime.utcnow(), **vectors))
+        session.commit()
+        return {"owner": owner, "talents": talents, "posting": posting}
+
+
+def test_count_queries_counts_statements_on_engine(db_engine) -> None:
+    from sqlalchemy import text
+
+    with count_queries(db_engine) as counter:
+        with db_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+    assert counter.count == 2
+    assert counter.by_statement() == {"SELECT ?": 2}
+
+
+def test_public_job_posting_queries(client, seeded, assert_max_queries) -> None:
+    with assert_max_queries("GET /api/job-postings/{job_posting_id}"):
+        res = client.get(f"/api/job-postings/{seeded['posting'].id}")
+    assert res.status_code == 200
+
+
+def test_public_talent_profile_queries(client, seeded, assert_max_queries) -> None:
+    talent = seeded["talents"][0]
+    with assert_max_queries("GET /api/talents/{user_id}/profile"):
+        res = client.get(f"/api/talents/{talent.id}/profile")
+    assert res.status_code == 200
+
+
+def test_company_matching_vector_create_queries(
+    client, seeded, assert_max_queries, auth_headers, vector_payload
+) -> None:
+    owner = seeded["owner"]
+    payload = {"role": "company", "job_posting_id": seeded["posting"].id, **vector_payload([2.0, 2.0, 1.0])}
+    headers = auth_headers(owner)
+
+    with assert_max_queries("POST /api/me/matching-vectors (company, 3 talents)"):
+        res = client.post("/api/me/matching-vectors", json=payload, headers=headers)
+    assert res.status_code == 201
+
+
+def test_talent_matches_queries(client, seeded, assert_max_queries, auth_headers, vector_payload) -> None:
+    owner, talent = seeded["owner"], seeded["talents"][0]
+    client.post(
+        "/api/me/matching-vectors",
+        json={"role": "company", "job_posting_id": seeded["posting"].id, **vector_payload([2.0, 2.0, 1.0])},
+        headers=auth_headers(owner),
+    )
+
+    with assert_max_queries("GET /api/matching-results/talents/{user_id}/job-postings"):
+        res = client.get(
+            f"/api/matching-results/talents/{talent.id}/job-postings",
+            headers=auth_headers(talent),
+        )
+    assert res.status_code == 200
+    assert res.json()["data"]["total_matches"] == 1
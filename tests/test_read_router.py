@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.db.routing import ReadRouter
+
+
+def test_health_check_runs_off_the_request_path() -> None:
+    release = threading.Event()
+    attempts = []
+
+    def hanging_connect():
+        attempts.append(1)
+        release.wait(timeout=5)
+        raise ConnectionError("replica down")
+
+    primary = create_engine("sqlite://", poolclass=StaticPool)
+    replica = create_engine("sqlite://", creator=hanging_connect)
+    router = ReadRouter(primary, {"replica-0": replica}, health_check_interval=0.0)
+
+    # probe가 끝나지 않아도 요청은 마지막 상태(healthy)로 바로 라우팅, probe는 하나만 실행
+    started = time.monotonic()
+    assert all(router.engine_for_read() is replica for _ in range(5))
+    assert time.monotonic() - started < 1.0
+    assert router.status()[0]["probing"] is True
+
+    release.set()
+    router._replicas[0].probe.join(timeout=5)
+    assert len(attempts) == 1
+    assert router.status()[0]["healthy"] is False
+    assert router.engine_for_read() is primary
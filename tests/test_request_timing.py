@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.request_timing import RequestTimingMiddleware
+
+
+def _app():
+    engine = create_engine("sqlite:///:memory:")
+    app = FastAPI()
+    app.add_middleware(RequestTimingMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    return app
+
+
+def test_server_timing_header_counts_queries() -> None:
+    client = TestClient(_app())
+    res = client.get("/items/7")
+    assert res.status_code == 200
+    timing = res.headers["server-timing"]
+    assert 'desc="3 queries"' in timing
+    assert "app;dur=" in timing
+
+
+def test_structured_log_uses_route_template(caplog) -> None:
+    client = TestClient(_app())
+    with caplog.at_level(logging.INFO, logger="app.request"):
+        client.get("/items/42")
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record["route"] == "/items/{item_id}"
+    assert record["path"] == "/items/42"
+    assert record["status"] == 200
+    assert record["db_queries"] == 3
+
+
+def test_failed_statements_do_not_leave_timers_on_connection() -> None:
+    from sqlalchemy.exc import OperationalError
+
+    from app.core.request_timing import install_sql_listeners
+
+    install_sql_listeners()
+    engine = create_engine("sqlite:///:memory:")
+    with engine.connect() as conn:
+        for _ in range(3):
+            try:
+                conn.execute(text("SELECT * FROM missing_table"))
+            except OperationalError:
+                pass
+        conn.execute(text("SELECT 1"))
+        assert not conn.info.get("query_start")
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.core import sparse_vector
+from app.core.sparse_vector import CSR, SparseVector
+
+
+def test_normalize_sorts_and_drops_zeros() -> None:
+    data = sparse_vector.normalize({"indices": [7, 2, 4], "values": [1, 0, -2.5], "dim": 10, "model": "m"})
+    assert data == {"indices": [4, 7], "values": [-2.5, 1.0], "dim": 10, "model": "m"}
+
+    for bad in (
+        {"indices": [1], "values": [1.0]},  # dim 없음
+        {"indices": [1, 1], "values": [1.0, 2.0], "dim": 3},
+        {"indices": [3], "values": [1.0], "dim": 3},
+        {"indices": [0, 1], "values": [1.0], "dim": 3},
+        {"indices": ["a"], "values": [1.0], "dim": 3},
+    ):
+        with pytest.raises(ValueError):
+            sparse_vector.normalize(bad)
+
+
+def test_dot_and_csr_match_dense() -> None:
+    rng = np.random.default_rng(0)
+    dense = rng.standard_normal((6, 50)) * (rng.random((6, 50)) < 0.1)
+    vectors = [sparse_vector.from_raw({"indices": list(np.flatnonzero(r)), "values": list(r[r != 0]), "dim": 50}) for r in dense]
+    query = rng.standard_normal(50)
+
+    assert sparse_vector.dot(vectors[0], vectors[1]) == pytest.approx(dense[0] @ dense[1])
+    assert sparse_vector.dot(list(query), vectors[2]) == pytest.approx(query @ dense[2])
+    np.testing.assert_allclose(sparse_vector.to_dense(vectors[3]), dense[3])
+
+    csr = CSR([*vectors, None, SparseVector([], [], 50)])
+    np.testing.assert_allclose(csr.dot(query), [*(dense @ query), 0.0, 0.0])
+    np.testing.assert_allclose(csr.norms(), [*np.linalg.norm(dense, axis=1), 0.0, 0.0])
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.company import Company
+from app.models.experience import Experience
+from app.models.job_posting import JobPosting
+from app.models.matching_vector import MatchingVector
+from app.models.profile import TalentProfile
+from app.models.user import User
+
+SEARCH = "/api/talents/search"
+
+
+@pytest.fixture()
+def seeded(db_engine, vector_payload):
+    # 공고 벡터 [1, 0]에 가까운 순서: exact > close > far, draft는 미제출 프로필
+    talents = {
+        "exact": ([1.0, 0.0], "백엔드 개발자", 5),
+        "close": ([1.0, 0.5], "백엔드 개발자", 1),
+        "far": ([0.0, 1.0], "디자이너", 3),
+        "draft": ([1.0, 0.0], "백엔드 개발자", 0),
+    }
+    with Session(db_engine, expire_on_commit=False) as session:
+        owner = User(email="owner@example.com", password_hash="x", role="company")
+        session.add(owner)
+        session.flush()
+        company = Company(owner_user_id=owner.id, name="Acme", industry="IT", location_city="서울")
+        session.add(company)
+        session.flush()
+        posting = JobPosting(
+            company_id=company.id, title="Backend", employment_type="정규직", location_city="서울",
+            career_level="경력", education_level="학력 무관", status="PUBLISHED",
+        )
+        session.add(posting)
+        session.flush()
+        session.add(MatchingVector(
+            user_id=owner.id, role="company", job_posting_id=posting.id, updated_at=datetime.utcnow(),
+            **vector_payload([1.0, 0.0]),
+        ))
+        users = {}
+        for name, (direction, role, years) in talents.items():
+            user = User(email=f"{name}@example.com", password_hash="x", role="talent")
+            session.add(user)
+            session.flush()
+            users[name] = user
+            session.add(TalentProfile(user_id=user.id, name=name, desired_role=role, is_submitted=name != "draft"))
+            vectors = vector_payload(direction)
+            session.add(MatchingVector(user_id=user.id, role="talent", updated_at=datetime.utcnow(), **vectors))
+            if years:
+                session.add(Experience(user_id=user.id, company_name="Prev", duration_years=years))
+        session.commit()
+        return {"owner": owner, "posting": posting, "users": users}
+
+
+def _names(res) -> list:
+    assert res.status_code == 200, res.json()
+    return [item["name"] for item in res.json()["data"]["items"]]
+
+
+def test_orders_by_similarity_and_applies_filters(client, seeded, auth_headers) -> None:
+    headers = auth_headers(seeded["owner"])
+    params = {"job_posting_id": seeded["posting"].id}
+
+    res = client.get(SEARCH, params=params, headers=headers)
+    assert _names(res) == ["exact", "close", "far"]
+    top = res.json()["data"]["items"][0]
+    assert top["score"] == 100.0 and top["experience_years"] == 5
+
+    assert _names(client.get(SEARCH, params={**params, "desired_role": "백엔드"}, headers=headers)) == ["exact", "close"]
+    assert _names(client.get(SEARCH, params={**params, "min_experience_years": 2}, headers=headers)) == ["exact", "far"]
+
+
+def test_cursor_pagination_and_query_vectors(client, seeded, auth_headers) -> None:
+    headers = auth_headers(seeded["owner"])
+    body = {"query_vectors": {"vector_skills": [0.0, 1.0]}, "limit": 2}
+
+    first = client.post(SEARCH, json=body, headers=headers)
+    assert _names(first) == ["far", "close"]
+    assert list(first.json()["data"]["items"][0]["field_scores"]) == ["vector_skills"]
+
+    second = client.post(SEARCH, json={**body, "cursor": first.json()["data"]["next_cursor"]}, headers=headers)
+    assert _names(second) == ["exact"]
+    assert second.json()["data"]["next_cursor"] is None
+
+
+def test_scores_sparse_candidates(client, seeded, db_engine, auth_headers, vector_payload) -> None:
+    with Session(db_engine) as session:
+        user = User(email="sparse@example.com", password_hash="x", role="talent")
+        session.add(user)
+        session.flush()
+        session.add(TalentProfile(user_id=user.id, name="sparse", desired_role="백엔드 개발자", is_submitted=True))
+        sparse = vector_payload({"indices": [0], "values": [2.0], "dim": 2})
+        session.add(MatchingVector(user_id=user.id, role="talent", updated_at=datetime.utcnow(), **sparse))
+        session.commit()
+
+    headers = auth_headers(seeded["owner"])
+    res = client.get(SEARCH, params={"job_posting_id": seeded["posting"].id}, headers=headers)
+    items = {item["name"]: item["score"] for item in res.json()["data"]["items"]}
+    assert items["sparse"] == items["exact"] == 100.0
+
+
+def test_legacy_posting_vector_skips_other_model_candidates(
+    client, seeded, db_engine, auth_headers, vector_payload
+) -> None:
+    with Session(db_engine) as session:
+        user = User(email="versioned@example.com", password_hash="x", role="talent")
+        session.add(user)
+        session.flush()
+        session.add(TalentProfile(user_id=user.id, name="versioned", desired_role="백엔드 개발자", is_submitted=True))
+        vectors = vector_payload({"vector": [1.0, 0.0], "model": "hashing-v1-2"})
+        session.add(MatchingVector(
+            user_id=user.id, role="talent", model_version="hashing-v1-2", dims=2, updated_at=datetime.utcnow(), **vectors
+        ))
+        session.commit()
+
+    headers = auth_headers(seeded["owner"])
+    res = client.get(SEARCH, params={"job_posting_id": seeded["posting"].id}, headers=headers)
+    assert "versioned" not in _names(res)
+
+
+def test_budget_returns_partial_results(client, seeded, monkeypatch, db_engine, auth_headers) -> None:
+    from app.db.instrumentation import count_queries
+
+    monkeypatch.setattr(settings, "TALENT_SEARCH_BUDGET_MS", 0.0)
+    monkeypatch.setattr(settings, "TALENT_SEARCH_CHUNK_SIZE", 1)
+    headers = auth_headers(seeded["owner"])
+
+    with count_queries(db_engine) as counter:
+        data = client.get(SEARCH, params={"job_posting_id": seeded["posting"].id}, headers=headers).json()["data"]
+    assert data["partial"] is True
+    assert data["scanned"] == 1
+    # 예산을 넘긴 뒤에는 다음 청크 쿼리를 보내지 않는다
+    assert sum("talent_profiles" in sql and "LIMIT" in sql for sql in counter.statements) == 1
+
+
+def test_partial_page_has_no_cursor(client, seeded, monkeypatch, auth_headers) -> None:
+    monkeypatch.setattr(settings, "TALENT_SEARCH_CHUNK_SIZE", 2)
+    headers = auth_headers(seeded["owner"])
+    params = {"job_posting_id": seeded["posting"].id, "limit": 1}
+
+    monkeypatch.setattr(settings, "TALENT_SEARCH_BUDGET_MS", 0.0)
+    data = client.get(SEARCH, params=params, headers=headers).json()["data"]
+    # 첫 청크만 평가: 점수 cursor를 주면 다음 청크의 상위 후보가 빠지므로 cursor 없음
+    assert data["partial"] is True and data["scanned"] == 2
+    assert data["next_cursor"] is None
+
+    monkeypatch.setattr(settings, "TALENT_SEARCH_BUDGET_MS", 10_000.0)
+    names, cursor = [], None
+    while True:
+        data = client.get(SEARCH, params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers).json()["data"]
+        assert data["partial"] is False
+        names += [item["name"] for item in data["items"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    assert names == ["exact", "close", "far"]
+
+
+def test_requires_company_role_and_own_posting(client, seeded, auth_headers) -> None:
+    talent_headers = auth_headers(seeded["users"]["exact"])
+    assert client.get(SEARCH, params={"job_posting_id": seeded["posting"].id}, headers=talent_headers).status_code == 403
+
+    headers = auth_headers(seeded["owner"])
+    res = client.get(SEARCH, params={"job_posting_id": 9999}, headers=headers)
+    assert res.status_code == 404
+    assert res.json()["error"]["code"] == "JOB_POSTING_NOT_FOUND"
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+
+from app.core.cache import TTLCache
+from app.core.token_cache import VerifiedTokenCache
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a becomes most recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+def test_ttl_cache_expires_entries() -> None:
+    cache = TTLCache(maxsize=10)
+    cache.set("expired", "x", expires_at=time.time() - 1)
+    cache.set("alive", "y", expires_at=time.time() + 60)
+
+    assert cache.get("expired") is None
+    assert cache.get("alive") == "y"
+    assert len(cache) == 1
+
+
+def test_token_cache_stores_until_exp_and_purges_on_revoke() -> None:
+    cache = VerifiedTokenCache(maxsize=10)
+    user = {"id": 1, "role": "talent"}
+    exp = time.time() + 60
+
+    cache.put("token-1", user, exp)
+    assert cache.get("token-1") == user
+
+    cache.revoke("token-1", exp=exp)
+    assert cache.get("token-1") is None
+    assert cache.is_revoked("token-1")
+
+    cache.put("token-1", user, exp)  # revoked tokens are never cached again
+    assert cache.get("token-1") is None
+    assert cache.stats()["revoked"] == 1
+
+
+def test_token_cache_ignores_tokens_without_exp() -> None:
+    cache = VerifiedTokenCache(maxsize=10)
+    cache.put("token-2", {"id": 2, "role": "company"}, None)
+
+    assert cache.get("token-2") is None
+
+
+def test_logout_is_shared_through_revoked_tokens(client, db_engine) -> None:
+    from sqlalchemy.orm import Session
+
+    from app.core.security import create_access_token
+    from app.core.token_cache import token_cache
+    from app.models.revoked_token import RevokedToken
+    from app.models.user import User
+    from app.repositories import revoked_token_repo
+
+    with Session(db_engine) as session:
+        user = User(email="logout@example.com", password_hash="x", role="talent")
+        session.add(user)
+        session.commit()
+        token = create_access_token({"sub": str(user.id), "email": user.email, "role": user.role})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.post("/auth/logout", headers=headers).json() == {"ok": True}
+    with Session(db_engine) as session:
+        assert session.get(RevokedToken, token_cache.digest(token)) is not None
+
+    # 다른 워커: 로컬 revocation list에는 없고 검증된 토큰이 캐시에 있는 상태
+    token_cache._revoked.pop(token_cache.digest(token))
+    token_cache.put(token, {"id": user.id, "role": "talent"}, time.time() + 60)
+    assert client.post("/auth/logout", headers=headers).status_code == 200
+
+    with Session(db_engine) as session:
+        assert revoked_token_repo.sync(session) >= 1
+    assert token_cache.get(token) is None
+    assert client.post("/auth/logout", headers=headers).status_code == 401
@@ -105,3 +105,69 @@ def test_match_requires_all_fields(db_session: Session) -> None:
 
     assert exc_info.value.status_code == 422
     assert exc_info.value.detail["code"] == "INCOMPLETE_VECTOR_FIELDS"
+
+
+def _sparse(dense: list[float]) -> dict:
+    return {
+        "indices": [i for i, v in enumerate(dense) if v],
+        "values": [v for v in dense if v],
+        "dim": len(dense),
+    }
+
+
+def test_match_accepts_sparse_vectors(db_session: Session) -> None:
+    talent = _create_user(db_session, "talent4@example.com", "talent")
+    company = _create_user(db_session, "company4@example.com", "company")
+    dense_talent = _create_matching_vector(db_session, talent, 1.0)
+    dense_company = _create_matching_vector(db_session, company, 1.5)
+    expected = vector_matching_service.match(db_session, dense_talent.id, dense_company.id)
+
+    # 모든 필드 sparse (sparse-sparse) / 인재만 sparse (sparse-dense) 모두 dense와 같은 점수
+    dense_talent.vector_skills = _sparse(dense_talent.vector_skills["vector"])
+    dense_company.vector_skills = _sparse(dense_company.vector_skills["vector"])
+    dense_talent.vector_roles = _sparse([0.0, 2.0, 3.0])
+    db_session.flush()
+    result = vector_matching_service.match(db_session, dense_talent.id, dense_company.id)
+    assert result["field_scores"]["vector_skills"] == pytest.approx(expected["field_scores"]["vector_skills"])
+    assert result["field_scores"]["vector_growth"] == pytest.approx(expected["field_scores"]["vector_growth"])
+    assert result["field_scores"]["vector_roles"] < expected["field_scores"]["vector_roles"]
+
+    dense_company.vector_skills = {"indices": [0, 0], "values": [1.0, 2.0], "dim": 3}
+    db_session.flush()
+    with pytest.raises(HTTPException) as exc_info:
+        vector_matching_service.match(db_session, dense_talent.id, dense_company.id)
+    assert exc_info.value.detail["code"] == "INVALID_VECTOR_DATA"
+
+    dense_company.vector_skills = {"indices": [1], "values": [1.0], "dim": 4}
+    db_session.flush()
+    with pytest.raises(HTTPException) as exc_info:
+        vector_matching_service.match(db_session, dense_talent.id, dense_company.id)
+    assert exc_info.value.detail["code"] == "VECTOR_DIMENSION_MISMATCH"
+
+
+def test_auto_matching_skips_legacy_vectors_with_other_dims(db_session: Session, monkeypatch) -> None:
+    from app.core.settings import settings
+    from app.models.matching_result import MatchingResult
+    from app.services import matching_vector_service
+
+    monkeypatch.setattr(settings, "MATCHING_HARD_CONSTRAINTS", "")
+    talent = _create_matching_vector(db_session, _create_user(db_session, "talent@example.com", "talent"), 1.0)
+    same = _create_matching_vector(db_session, _create_user(db_session, "same@example.com", "company"), 2.0)
+    other = _create_user(db_session, "other@example.com", "company")
+    shorter = MatchingVector(
+        user_id=other.id, role="company", job_posting_id=2, updated_at=datetime.utcnow(),
+        **{field: {"vector": value["vector"][:2]} for field, value in _vector_payload(3.0).items()},
+    )
+    db_session.add(shorter)
+    same.job_posting_id = 1
+    for row, dims in ((talent, 3), (same, 3), (shorter, 2)):
+        row.model_version, row.dims = None, dims  # 모델 표시 없는 기존 벡터
+    db_session.flush()
+
+    candidates = matching_vector_service.compatible_candidates(
+        db_session.query(MatchingVector).filter(MatchingVector.role == "company"), talent
+    ).all()
+    assert [row.id for row in candidates] == [same.id]
+
+    matching_vector_service._calculate_all_matches_for_talent(db_session, talent)
+    assert [row[0] for row in db_session.query(MatchingResult.company_vector_id).all()] == [same.id]